@@ -9,6 +9,7 @@ import json
 
 from src.agent import AIGuruAgent
 from src.logger import get_logger
+from src.utils.pipeline import BackgroundLoop
 from config.prompts import AGENT_NAME, USER_NAME, EXPERTISE_AREAS
 
 logger = get_logger(__name__)
@@ -222,6 +223,10 @@ def initialize_session_state():
             st.info("Please check your `.env` file and ensure ANTHROPIC_API_KEY is set.")
             st.stop()
 
+    if "event_loop" not in st.session_state:
+        # One loop per session keeps the API connection alive between turns
+        st.session_state.event_loop = BackgroundLoop(name="chat-loop")
+
     if "messages" not in st.session_state:
         st.session_state.messages = []
 
@@ -276,12 +281,25 @@ def display_sidebar():
                 st.info(f"📎 Selected: {uploaded_file.name}")
                 if st.button("⬆️ Ingest PDF", key="ingest_pdf", use_container_width=True):
                     logger.info(f"User uploading PDF: {uploaded_file.name}")
+                    progress_bar = st.progress(0.0, text="Processing PDF...")
+
+                    def show_progress(progress):
+                        progress_bar.progress(
+                            progress.fraction,
+                            text=(
+                                f"Page {progress.pages_read}/{progress.page_count} · "
+                                f"{progress.chunks_stored} chunks stored"
+                            )
+                        )
+
                     with st.spinner("Processing PDF..."):
                         try:
                             result = st.session_state.agent.ingest_pdf_upload(
                                 uploaded_file,
-                                uploaded_file.name
+                                uploaded_file.name,
+                                progress_callback=show_progress
                             )
+                            progress_bar.progress(1.0, text="Done")
                             logger.info(
                                 f"PDF ingested: {result['source']}, "
                                 f"chunks={result['chunks_created']}"
@@ -314,7 +332,9 @@ def display_sidebar():
                         with st.spinner("Fetching and processing URL..."):
                             try:
                                 result = st.session_state.agent.ingest_url(url_input)
-                                if result.get("success", True):
+                                if result.get("not_modified"):
+                                    st.info("ℹ️ Already up to date, nothing to re-ingest")
+                                elif result.get("success", True):
                                     logger.info(
                                         f"URL ingested: {result['source'][:50]}..., "
                                         f"chunks={result['chunks_created']}"
@@ -334,12 +354,77 @@ def display_sidebar():
                 else:
                     st.warning("⚠️ Please enter a URL")
 
+            urls_input = st.text_area(
+                "Or several URLs, one per line",
+                key="urls_input",
+                help="URLs are fetched concurrently"
+            )
+
+            if st.button("🔗 Ingest URLs", key="ingest_urls", use_container_width=True):
+                urls = [u.strip() for u in urls_input.splitlines() if u.strip()]
+                invalid = [u for u in urls if not u.startswith(("http://", "https://"))]
+                if not urls:
+                    st.warning("⚠️ Please enter at least one URL")
+                elif invalid:
+                    st.warning(f"⚠️ Not a valid URL: {invalid[0]}")
+                else:
+                    logger.info(f"User ingesting {len(urls)} URLs")
+                    progress_bar = st.progress(0.0, text="Fetching URLs...")
+
+                    def show_url_progress(progress):
+                        progress_bar.progress(
+                            progress.fraction,
+                            text=(
+                                f"URL {progress.pages_read}/{progress.page_count} · "
+                                f"{progress.chunks_stored} chunks stored"
+                            )
+                        )
+
+                    try:
+                        result = st.session_state.agent.ingest_urls(
+                            urls, progress_callback=show_url_progress
+                        )
+                        progress_bar.progress(1.0, text="Done")
+                        logger.info(
+                            f"URLs ingested: {result['succeeded']}/{result['urls']}, "
+                            f"chunks={result['chunks_created']}"
+                        )
+                        if result["failed"]:
+                            failed = [r["source"] for r in result["results"] if not r["success"]]
+                            st.warning(
+                                f"⚠️ {result['failed']} URL(s) failed: " + ", ".join(failed[:5])
+                            )
+                        if result["succeeded"]:
+                            st.success(
+                                f"✅ Ingested {result['succeeded']} URL(s) "
+                                f"({result['chunks_created']} chunks)"
+                            )
+                            st.rerun()
+                    except Exception as e:
+                        logger.error(f"URL batch ingestion failed: {e}")
+                        st.error(f"❌ Error: {str(e)}")
+
         st.divider()
 
         # Source List
         st.markdown("### 📚 Sources")
         sources = st.session_state.agent.get_sources()
 
+        if any(source["type"] == "url" for source in sources):
+            if st.button("🔄 Refresh URL sources", key="refresh_urls", use_container_width=True):
+                logger.info("User refreshing URL sources")
+                with st.spinner("Checking URL sources for changes..."):
+                    try:
+                        result = st.session_state.agent.refresh_url_sources()
+                        updated = result["succeeded"] - result["not_modified"]
+                        st.success(
+                            f"✅ {updated} updated, {result['not_modified']} unchanged"
+                            + (f", {result['failed']} failed" if result["failed"] else "")
+                        )
+                    except Exception as e:
+                        logger.error(f"URL refresh failed: {e}")
+                        st.error(f"❌ Error: {str(e)}")
+
         if sources:
             for source in sources:
                 source_name = source["source"]
@@ -526,9 +611,12 @@ def display_chat():
             # Show typing indicator
             message_placeholder.markdown("🤔 Thinking...")
 
-            # Stream the response
+            # Stream the response; a new message cancels this one
             try:
-                for chunk in st.session_state.agent.chat_stream(user_message):
+                stream = st.session_state.event_loop.iterate(
+                    st.session_state.agent.chat_stream_async(user_message)
+                )
+                for chunk in stream:
                     if chunk["type"] == "sources":
                         sources = chunk["sources"]
                         logger.debug(f"Received {len(sources)} sources")
@@ -537,7 +625,9 @@ def display_chat():
                         message_placeholder.markdown(full_response + "▌")
                     elif chunk["type"] == "done":
                         message_placeholder.markdown(full_response)
-                        logger.info("Response stream completed")
+                        logger.info(f"Response stream completed, timings: {chunk['timings']}")
+                    elif chunk["type"] == "cancelled":
+                        logger.info("Response stream cancelled")
             except Exception as e:
                 logger.error(f"Error during chat: {e}")
                 message_placeholder.error(f"❌ An error occurred: {str(e)}")
@@ -23,11 +23,29 @@ CHROMA_DIR.mkdir(parents=True, exist_ok=True)
 # Anthropic API Configuration
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514")
+ANTHROPIC_BASE_URL = os.getenv("ANTHROPIC_BASE_URL")  # None for the public API
 
 # Embedding Configuration
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 EMBEDDING_DIMENSION = 384
 
+# Embedding Execution
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))  # texts per model call
+EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", "0"))  # >1 enables a multi-process pool
+EMBEDDING_POOL_MIN_TEXTS = 256  # smaller requests stay in-process
+
+# Embedding Cache (persistent, keyed by model + normalized text)
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_DIR = Path(os.getenv("EMBEDDING_CACHE_DIR", str(DATA_DIR / "embedding_cache")))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))
+EMBEDDING_STORAGE_DTYPE = os.getenv("EMBEDDING_STORAGE_DTYPE", "float32")  # or "float16" to halve the store
+
+# Query Cache (recent retrieval results, reused for repeated or rephrased questions)
+QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "true").lower() == "true"
+QUERY_CACHE_SIMILARITY = float(os.getenv("QUERY_CACHE_SIMILARITY", "0.95"))  # cosine to reuse a result
+QUERY_CACHE_TTL = int(os.getenv("QUERY_CACHE_TTL", "900"))  # seconds
+QUERY_CACHE_MAX_ENTRIES = 256
+
 # ChromaDB Configuration
 CHROMA_USE_CLOUD = os.getenv("CHROMA_USE_CLOUD", "false").lower() == "true"
 
@@ -39,20 +57,50 @@ CHROMA_DATABASE = os.getenv("CHROMA_DATABASE")
 # ChromaDB Local Settings
 CHROMA_COLLECTION_NAME = "ai_guru_knowledge"
 CHROMA_PERSIST_PATH = os.getenv("CHROMA_PERSIST_PATH", str(CHROMA_DIR))
+BM25_INDEX_PATH = Path(os.getenv("BM25_INDEX_PATH", str(Path(CHROMA_PERSIST_PATH).with_name("bm25_index.npz"))))
 
 # Text Chunking Configuration
 CHUNK_SIZE = 1000  # characters
 CHUNK_OVERLAP = 200  # characters
 
+# Streaming Ingestion
+INGEST_BATCH_SIZE = 64  # chunks embedded and stored together
+INGEST_QUEUE_SIZE = 4  # batches buffered between pipeline stages
+
 # RAG Configuration
 TOP_K_RESULTS = 5  # Number of relevant chunks to retrieve
 SIMILARITY_THRESHOLD = 0.3  # Minimum similarity score for retrieval
+SEARCH_MODE = os.getenv("SEARCH_MODE", "vector")  # or "hybrid" for BM25 + vector retrieval
+HYBRID_CANDIDATES = 4  # each retriever contributes top_k * this candidates to the fusion
+RRF_K = 60  # reciprocal-rank fusion damping constant
+
+# Reranking (optional second stage: a cross-encoder reorders over-fetched candidates)
+RERANK_ENABLED = os.getenv("RERANK_ENABLED", "false").lower() == "true"
+RERANK_MODEL = os.getenv("RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+RERANK_CANDIDATES = int(os.getenv("RERANK_CANDIDATES", "20"))  # chunks retrieved for reranking
+RERANK_TOP_K = int(os.getenv("RERANK_TOP_K", "3"))  # chunks kept after reranking
+RERANK_BATCH_SIZE = 16  # (query, chunk) pairs per model call
+RERANK_CACHE_MAX_ENTRIES = 4096  # cached (query, chunk) scores
 
 # Claude API Configuration
 MAX_TOKENS = 4096
 TEMPERATURE = 0.7
 
+# Prompt Budget (tokens, counted with tiktoken as an estimate of Claude's tokenizer)
+TOKEN_ENCODING = "cl100k_base"
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "3000"))  # retrieved excerpts
+HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "2000"))  # earlier conversation turns
+HISTORY_MAX_MESSAGES = 20  # 10 user + 10 assistant messages
+
 # Document Processing
 SUPPORTED_PDF_EXTENSIONS = [".pdf"]
+PDF_EXTRACTOR = os.getenv("PDF_EXTRACTOR", "pdfplumber")  # or "pypdf" for text-only PDFs
+PDF_EXTRACTION_WORKERS = int(os.getenv("PDF_EXTRACTION_WORKERS", "1"))  # >1 extracts pages in parallel
+PDF_PARALLEL_MIN_PAGES = 50  # smaller PDFs are extracted in-process
 REQUEST_TIMEOUT = 30  # seconds for web requests
 MAX_CONTENT_LENGTH = 100000  # characters for web content
+HTML_PARSER = os.getenv("HTML_PARSER", "auto")  # "lxml", "html.parser", or "auto" (lxml if installed)
+URL_FETCH_WORKERS = int(os.getenv("URL_FETCH_WORKERS", "8"))  # concurrent URL downloads
+URL_FETCH_PER_HOST = int(os.getenv("URL_FETCH_PER_HOST", "2"))  # concurrent downloads per host
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"  # revalidate URL sources
+HTTP_CACHE_DIR = Path(os.getenv("HTTP_CACHE_DIR", str(DATA_DIR / "http_cache")))
@@ -30,9 +30,18 @@ DATABASE_PATH = DATABASE_DIR / DATABASE_NAME
 SQLITE_TIMEOUT = 30  # seconds
 SQLITE_CHECK_SAME_THREAD = False
 
+# SQLite performance profile (PRAGMAs applied to every connection)
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")  # WAL lets readers run during writes
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")  # NORMAL is corruption-safe under WAL (recent commits may roll back on power loss)
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", 64 * 1024))  # page cache per connection
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))  # bytes, 0 = disabled
+SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")  # DEFAULT, FILE or MEMORY
+SQLITE_BUSY_TIMEOUT_MS = SQLITE_TIMEOUT * 1000  # wait for writer locks instead of failing
+
 # Import Configuration
 SUPPORTED_EXTENSIONS = [".csv", ".xlsx", ".xls"]
-MAX_FILE_SIZE_MB = 50
+STREAMING_THRESHOLD_MB = 50  # Larger files are imported chunk by chunk
+IMPORT_CHUNK_SIZE = 50000  # Rows per chunk in streaming imports
 BATCH_SIZE = 1000  # Records per batch for bulk operations
 
 # Validation Configuration
@@ -4,13 +4,17 @@ Pure-function demand forecasting using Simple Moving Average (SMA),
 Weighted Moving Average (WMA), and Linear Trend (OLS regression).
 
 All functions are stateless and require no database access.
+``forecast_matrix`` / ``forecast_batch`` provide a vectorized NumPy path
+that forecasts many products at once with the same results as ``forecast``.
 """
 
 import math
 import statistics
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+
+import numpy as np
 
 
 # ---------------------------------------------------------------------------
@@ -44,6 +48,17 @@ class ForecastResult:
     forecast_values: List[float] = field(default_factory=list)  # One per day
 
 
+@dataclass
+class BatchForecast:
+    """Vectorized forecast output for a (products × days) demand matrix."""
+    method: str
+    forecast_values: np.ndarray    # (products, horizon_days), clipped at 0 for LINEAR
+    forecast_daily: np.ndarray     # (products,)
+    historical_avg: np.ndarray     # (products,)
+    std_dev: np.ndarray            # (products,) population std-dev
+    mae: np.ndarray                # (products,) walk-forward MAE
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -85,6 +100,46 @@ def build_series(
     )
 
 
+def build_series_batch(
+    products: List[Dict],
+    rows_by_product: Dict[str, List[Dict]],
+    start_date: date,
+    end_date: date,
+) -> List[DemandSeries]:
+    """
+    Build one gapless DemandSeries per product in a single pass.
+
+    ``products`` must contain dicts with keys ``product_id``,
+    ``product_name`` and ``category``; ``rows_by_product`` maps a
+    product_id to the same sparse rows accepted by :func:`build_series`.
+    The date axis is computed once and shared by every product.
+    Series are returned in the same order as ``products``.
+    """
+    num_days = (end_date - start_date).days + 1
+    dates: List[str] = [
+        (start_date + timedelta(days=i)).isoformat() for i in range(max(0, num_days))
+    ]
+    index_by_date: Dict[str, int] = {ds: i for i, ds in enumerate(dates)}
+
+    result: List[DemandSeries] = []
+    for p in products:
+        quantities = [0] * len(dates)
+        for r in rows_by_product.get(p["product_id"], ()):
+            idx = index_by_date.get(r["date"])
+            if idx is not None:
+                quantities[idx] = int(r["total_quantity"])
+
+        result.append(DemandSeries(
+            product_id=p["product_id"],
+            product_name=p["product_name"],
+            category=p["category"],
+            dates=list(dates),
+            quantities=quantities,
+        ))
+
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Forecasting algorithms
 # ---------------------------------------------------------------------------
@@ -155,34 +210,104 @@ def linear_trend_forecast(
     return [max(0.0, intercept + slope * (start_idx + i)) for i in range(horizon_days)]
 
 
+def _rolling_sma(quantities: List[int], window: int, start: int) -> Iterator[float]:
+    """
+    One-step-ahead SMA predictions for t = start .. len-1, trained on
+    ``quantities[:t]``.  Keeps a running window sum so each step is O(1).
+    Requires ``start >= window >= 1``.
+    """
+    window_sum = sum(quantities[start - window:start])
+    for t in range(start, len(quantities)):
+        yield window_sum / window
+        window_sum += quantities[t] - quantities[t - window]
+
+
+def _rolling_wma(quantities: List[int], window: int, start: int) -> Iterator[float]:
+    """
+    One-step-ahead WMA predictions for t = start .. len-1 (linear weights
+    1..window).  Sliding the window drops every weight by one, so the
+    weighted sum updates as ``W - S + window * q_new`` in O(1).
+    Requires ``start >= window >= 1``.
+    """
+    subset = quantities[start - window:start]
+    window_sum = sum(subset)
+    weighted_sum = sum(w * q for w, q in enumerate(subset, start=1))
+    total_weight = window * (window + 1) / 2
+    for t in range(start, len(quantities)):
+        yield weighted_sum / total_weight
+        q_new = quantities[t]
+        weighted_sum += window * q_new - window_sum
+        window_sum += q_new - quantities[t - window]
+
+
+def _rolling_linear(quantities: List[int], start: int) -> Iterator[float]:
+    """
+    One-step-ahead OLS trend predictions for t = start .. len-1, trained on
+    ``quantities[:t]``.  Maintains prefix sums Σy and Σx·y so each refit is
+    O(1); predictions are clipped at 0 like :func:`linear_trend_forecast`.
+    """
+    sum_y = sum(quantities[:start])
+    sum_xy = sum(x * q for x, q in enumerate(quantities[:start]))
+    for t in range(start, len(quantities)):
+        if t == 0:
+            yield 0.0
+        elif t == 1:
+            yield max(0.0, float(quantities[0]))
+        else:
+            mean_x = (t - 1) / 2
+            mean_y = sum_y / t
+            ss_xy = sum_xy - mean_x * sum_y
+            ss_xx = t * (t * t - 1) / 12
+            slope = ss_xy / ss_xx if ss_xx != 0 else 0.0
+            intercept = mean_y - slope * mean_x
+            yield max(0.0, intercept + slope * t)
+        sum_y += quantities[t]
+        sum_xy += t * quantities[t]
+
+
 def _walk_forward_mae(quantities: List[int], method: str, window: int) -> float:
     """
     Walk-forward validation: train on [0..t-1], predict t, compare to actual.
     Returns mean absolute error over the last half of the series.
     Requires at least window+1 points; returns 0 if series is too short.
+
+    Models are updated incrementally (running sums), so the whole
+    validation is O(n) rather than one refit per step.
     """
     if len(quantities) < window + 1:
         return 0.0
 
-    errors = []
     half = len(quantities) // 2
     eval_start = max(window, half)
 
-    for t in range(eval_start, len(quantities)):
-        train = quantities[:t]
-        actual = quantities[t]
+    if window < 1:
+        # Degenerate window — fall back to refitting at every step
+        predictions = (
+            _predict_next(quantities[:t], method, window)
+            for t in range(eval_start, len(quantities))
+        )
+    elif method == "SMA":
+        predictions = _rolling_sma(quantities, window, eval_start)
+    elif method == "WMA":
+        predictions = _rolling_wma(quantities, window, eval_start)
+    else:  # LINEAR
+        predictions = _rolling_linear(quantities, eval_start)
 
-        if method == "SMA":
-            pred = simple_moving_average(train, window)
-        elif method == "WMA":
-            pred = weighted_moving_average(train, window)
-        else:  # LINEAR
-            forecasts = linear_trend_forecast(train, 1)
-            pred = forecasts[0] if forecasts else 0.0
+    errors = [
+        abs(pred - actual)
+        for pred, actual in zip(predictions, quantities[eval_start:])
+    ]
+    return statistics.mean(errors) if errors else 0.0
 
-        errors.append(abs(pred - actual))
 
-    return statistics.mean(errors) if errors else 0.0
+def _predict_next(train: List[int], method: str, window: int) -> float:
+    """Refit ``method`` on ``train`` and predict the next observation."""
+    if method == "SMA":
+        return simple_moving_average(train, window)
+    if method == "WMA":
+        return weighted_moving_average(train, window)
+    forecasts = linear_trend_forecast(train, 1)
+    return forecasts[0] if forecasts else 0.0
 
 
 # ---------------------------------------------------------------------------
@@ -249,3 +374,202 @@ def forecast(
         forecast_dates=forecast_dates,
         forecast_values=[round(v, 2) for v in forecast_values],
     )
+
+
+# ---------------------------------------------------------------------------
+# Vectorized batch engine
+# ---------------------------------------------------------------------------
+
+def _prefix_sums(q: np.ndarray):
+    """
+    Column prefix sums for a (products × days) matrix.
+
+    Returns ``(s, sx)`` of shape (products, days + 1) where ``s[:, t]`` is
+    the sum of the first ``t`` observations and ``sx[:, t]`` the sum of
+    ``j * q[:, j]`` over the same range.
+    """
+    rows, n = q.shape
+    s = np.zeros((rows, n + 1))
+    sx = np.zeros((rows, n + 1))
+    np.cumsum(q, axis=1, out=s[:, 1:])
+    np.cumsum(q * np.arange(n, dtype=float), axis=1, out=sx[:, 1:])
+    return s, sx
+
+
+def _batch_ols(sum_y, sum_xy, n):
+    """
+    OLS slope and intercept for y ~ a + b*x with x = 0..n-1, from the
+    prefix sums Σy and Σx·y (n >= 2).
+    """
+    mean_x = (n - 1.0) / 2.0
+    mean_y = sum_y / n
+    ss_xy = sum_xy - mean_x * sum_y
+    ss_xx = n * (n * n - 1.0) / 12.0
+    slope = ss_xy / ss_xx
+    return slope, mean_y - slope * mean_x
+
+
+def _batch_predict(
+    q: np.ndarray, s: np.ndarray, sx: np.ndarray, t: np.ndarray, method: str, window: int
+) -> np.ndarray:
+    """
+    One-step-ahead prediction trained on ``q[:, :t]`` for each t in ``t``.
+
+    Returns an array of shape (products, len(t)).  For SMA/WMA every
+    ``t`` must be >= 1; the effective window is ``min(window, t)``.
+    """
+    if method in ("SMA", "WMA"):
+        w = np.minimum(window, t)
+        lo = t - w
+        window_sum = s[:, t] - s[:, lo]
+        if method == "SMA":
+            return window_sum / w
+        # Weights 1..w over positions lo..t-1:  Σ (j - lo + 1)·q_j
+        weighted = (sx[:, t] - sx[:, lo]) - (lo - 1) * window_sum
+        return weighted / (w * (w + 1) / 2)
+
+    # LINEAR — OLS on x = 0..t-1, predict x = t
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tf = t.astype(float)
+        slope, intercept = _batch_ols(s[:, t], sx[:, t], tf)
+        pred = intercept + slope * tf
+    pred = np.where(t >= 2, pred, q[:, :1])   # single point → flat forecast
+    return np.maximum(0.0, pred)
+
+
+def forecast_matrix(
+    quantities,
+    method: str = "SMA",
+    horizon_days: int = 30,
+    window: int = 14,
+) -> BatchForecast:
+    """
+    Forecast every row of a (products × days) demand matrix in one call.
+
+    Args:
+        quantities:   2-D array-like of daily demand, one row per product,
+                      oldest day first.  All rows share the same length.
+        method:       One of "SMA", "WMA", "LINEAR".
+        horizon_days: Number of future days to forecast.
+        window:       Lookback window for SMA/WMA (must be >= 1).
+
+    Returns:
+        BatchForecast holding unrounded per-product arrays.
+    """
+    method = method.upper()
+    if method not in ("SMA", "WMA"):
+        method = "LINEAR"
+
+    q = np.asarray(quantities, dtype=float)
+    if q.ndim != 2:
+        raise ValueError("quantities must be a 2-D (products × days) array")
+    rows, n = q.shape
+
+    if n == 0:
+        zeros = np.zeros(rows)
+        return BatchForecast(
+            method=method,
+            forecast_values=np.zeros((rows, horizon_days)),
+            forecast_daily=zeros,
+            historical_avg=zeros.copy(),
+            std_dev=zeros.copy(),
+            mae=zeros.copy(),
+        )
+
+    s, sx = _prefix_sums(q)
+
+    # Per-day forecast values
+    if method == "LINEAR":
+        if n >= 2:
+            slope, intercept = _batch_ols(s[:, n], sx[:, n], float(n))
+        else:
+            slope = np.zeros(rows)
+            intercept = q[:, 0]
+        steps = np.arange(n, n + horizon_days, dtype=float)
+        forecast_values = np.maximum(0.0, intercept[:, None] + slope[:, None] * steps)
+        daily = forecast_values.mean(axis=1) if horizon_days else np.zeros(rows)
+    else:
+        daily = _batch_predict(q, s, sx, np.array([n]), method, window)[:, 0]
+        forecast_values = np.repeat(daily[:, None], horizon_days, axis=1)
+
+    # Summary stats on historical series
+    historical_avg = s[:, n] / n
+    std_dev = q.std(axis=1) if n >= 2 else np.zeros(rows)
+
+    # MAE via walk-forward validation over the last half of the series
+    if n < window + 1:
+        mae = np.zeros(rows)
+    else:
+        t = np.arange(max(window, n // 2), n)
+        errors = np.abs(_batch_predict(q, s, sx, t, method, window) - q[:, t])
+        mae = errors.mean(axis=1)
+
+    return BatchForecast(
+        method=method,
+        forecast_values=forecast_values,
+        forecast_daily=daily,
+        historical_avg=historical_avg,
+        std_dev=std_dev,
+        mae=mae,
+    )
+
+
+def forecast_batch(
+    series_list: List[DemandSeries],
+    method: str = "SMA",
+    horizon_days: int = 30,
+    window: int = 14,
+) -> List[ForecastResult]:
+    """
+    Vectorized equivalent of calling :func:`forecast` on every series.
+
+    Series are grouped by length and each group is forecast with a single
+    :func:`forecast_matrix` call.  Results are returned in input order.
+    """
+    if window < 1:
+        return [
+            forecast(sr, method=method, horizon_days=horizon_days, window=window)
+            for sr in series_list
+        ]
+
+    method = method.upper()
+    results: List[Optional[ForecastResult]] = [None] * len(series_list)
+
+    groups: Dict[int, List[int]] = {}
+    for i, sr in enumerate(series_list):
+        groups.setdefault(len(sr.quantities), []).append(i)
+
+    for indices in groups.values():
+        batch = forecast_matrix(
+            [series_list[i].quantities for i in indices],
+            method=method, horizon_days=horizon_days, window=window,
+        )
+        values_rows = batch.forecast_values.tolist()
+        daily = batch.forecast_daily.tolist()
+        hist = batch.historical_avg.tolist()
+        std = batch.std_dev.tolist()
+        mae = batch.mae.tolist()
+
+        for row, i in enumerate(indices):
+            sr = series_list[i]
+            values = values_rows[row]
+            last_date = date.fromisoformat(sr.dates[-1]) if sr.dates else date.today()
+            results[i] = ForecastResult(
+                product_id=sr.product_id,
+                product_name=sr.product_name,
+                category=sr.category,
+                method=method,
+                horizon_days=horizon_days,
+                historical_daily_avg=round(hist[row], 2),
+                forecast_daily=round(daily[row], 2),
+                forecast_total=round(sum(values)),
+                std_dev=round(std[row], 2),
+                mae=round(mae[row], 2),
+                forecast_dates=[
+                    (last_date + timedelta(days=d + 1)).isoformat()
+                    for d in range(horizon_days)
+                ],
+                forecast_values=[round(v, 2) for v in values],
+            )
+
+    return results
@@ -4,9 +4,9 @@ Handles SQLite database connections with proper session management.
 """
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Dict, Generator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.engine import Engine
 
@@ -23,6 +23,40 @@ from src.logger import LoggerMixin, get_logger
 
 logger = get_logger(__name__)
 
+# Values SQLite reports back for enumerated PRAGMAs
+_SYNCHRONOUS_LEVELS = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+_TEMP_STORE_MODES = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """
+    PRAGMA settings applied to every new connection, in order.
+
+    ``journal_mode`` is set first because WAL changes how ``synchronous``
+    behaves; a negative ``cache_size`` is in KiB rather than pages.
+    """
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE.upper(),
+        "synchronous": settings.SQLITE_SYNCHRONOUS.upper(),
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KB,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE.upper(),
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "foreign_keys": "ON",
+    }
+
+
+def _normalize_pragma(name: str, value: Any) -> str:
+    """Render a PRAGMA value the same way whether requested or reported."""
+    text = str(value).upper()
+    if name == "synchronous":
+        return _SYNCHRONOUS_LEVELS.get(value, text)
+    if name == "temp_store":
+        return _TEMP_STORE_MODES.get(value, text)
+    if name == "foreign_keys":
+        return {"1": "ON", "0": "OFF"}.get(text, text)
+    return text
+
 
 class DatabaseManager(LoggerMixin):
     """Manages database connections and session lifecycle."""
@@ -57,11 +91,14 @@ class DatabaseManager(LoggerMixin):
             echo=False
         )
 
-        # Enable foreign keys for SQLite
+        # Apply the performance profile (and foreign keys) to every connection
+        pragmas = sqlite_pragmas()
+
         @event.listens_for(DatabaseManager._engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
             cursor.close()
 
         # Create session factory
@@ -72,13 +109,65 @@ class DatabaseManager(LoggerMixin):
         )
 
         self.logger.info("Database engine initialized")
+        self.check_sqlite_profile()
+
+    def check_sqlite_profile(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report which PRAGMA settings are actually active.
+
+        SQLite silently ignores some requests (e.g. WAL on a network share
+        or for an in-memory database), so each setting is read back.
+
+        Returns:
+            Mapping of PRAGMA name to {"requested", "active", "ok"}
+        """
+        report: Dict[str, Dict[str, Any]] = {}
+
+        with DatabaseManager._engine.connect() as conn:
+            for name, requested in sqlite_pragmas().items():
+                active = conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+                ok = _normalize_pragma(name, active) == _normalize_pragma(name, requested)
+                report[name] = {"requested": requested, "active": active, "ok": ok}
+                if not ok:
+                    self.logger.warning(
+                        f"SQLite PRAGMA {name}: requested {requested}, active {active}"
+                    )
+
+        self.logger.info(
+            "SQLite profile: "
+            + ", ".join(f"{name}={entry['active']}" for name, entry in report.items())
+        )
+        return report
 
     def create_tables(self):
         """Create all database tables."""
         self.logger.info("Creating database tables")
         Base.metadata.create_all(DatabaseManager._engine)
+        self._add_missing_columns()
         self.logger.info("Database tables created successfully")
 
+    def _add_missing_columns(self):
+        """
+        Add nullable columns that were introduced after a table was created.
+
+        ``create_all`` only creates missing tables, so databases created by
+        an earlier version would otherwise lack newer optional columns.
+        """
+        engine = DatabaseManager._engine
+        inspector = inspect(engine)
+
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {c["name"] for c in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing or not column.nullable:
+                        continue
+                    col_type = column.type.compile(dialect=engine.dialect)
+                    self.logger.info(f"Adding column {table.name}.{column.name}")
+                    conn.execute(text(
+                        f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {col_type}'
+                    ))
+
     def drop_tables(self):
         """Drop all database tables (use with caution)."""
         self.logger.warning("Dropping all database tables")
@@ -150,6 +150,7 @@ class ImportLog(Base):
     error_details = Column(Text, nullable=True)
     imported_at = Column(DateTime, default=func.now())
     imported_by = Column(String(100), nullable=True)
+    dialect = Column(Text, nullable=True)  # JSON CSVDialect (encoding, delimiter, header)
 
     def __repr__(self):
         return f"<ImportLog(file='{self.filename}', status='{self.status}')>"
@@ -1,10 +1,11 @@
 """Data importer module for Logistics DSS."""
-from src.importer.base import BaseImporter, ImportResult
+from src.importer.base import BaseImporter, ImportProgress, ImportResult
 from src.importer.csv_importer import CSVImporter
 from src.importer.excel_importer import ExcelImporter
 
 __all__ = [
     "BaseImporter",
+    "ImportProgress",
     "ImportResult",
     "CSVImporter",
     "ExcelImporter",
@@ -5,7 +5,7 @@ Abstract base class for data importers.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -17,7 +17,9 @@ import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from config import settings
 from config.constants import DataType, REQUIRED_COLUMNS
+from src.importer.chunk_reader import should_stream
 from src.logger import LoggerMixin
 
 
@@ -59,6 +61,18 @@ class ImportResult:
         }
 
 
+@dataclass
+class ImportProgress:
+    """Progress snapshot reported to import progress callbacks."""
+    rows_processed: int
+    rows_imported: int
+    rows_failed: int
+    fraction: Optional[float] = None  # 0..1, None when the total is unknown
+
+
+ProgressCallback = Callable[[ImportProgress], None]
+
+
 class BaseImporter(ABC, LoggerMixin):
     """Abstract base class for file importers."""
 
@@ -89,6 +103,26 @@ class BaseImporter(ABC, LoggerMixin):
         """
         pass
 
+    def read_chunks(
+        self, file_path: Path, chunk_size: int
+    ) -> Iterator[Tuple[pd.DataFrame, Optional[float]]]:
+        """
+        Read file as a sequence of DataFrame chunks.
+
+        The default implementation reads the whole file and slices it;
+        subclasses override it to keep memory bounded.
+
+        Args:
+            file_path: Path to the file to read
+            chunk_size: Rows per chunk
+
+        Yields:
+            Tuples of (chunk, fraction of the file consumed)
+        """
+        df = self.read_file(file_path)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size], min((start + chunk_size) / len(df), 1.0)
+
     def validate_file(self, file_path: Path) -> bool:
         """
         Validate that file exists and is readable.
@@ -155,12 +189,23 @@ class BaseImporter(ABC, LoggerMixin):
         df.columns = [col.lower().strip() for col in df.columns]
         return df
 
-    def import_file(self, file_path: Path) -> ImportResult:
+    def import_file(
+        self,
+        file_path: Path,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: Optional[int] = None
+    ) -> ImportResult:
         """
         Main import method.
 
+        Files larger than ``settings.STREAMING_THRESHOLD_MB``, or any file
+        when ``chunk_size`` is given, are imported in streaming mode: read,
+        validated and committed one chunk at a time.
+
         Args:
             file_path: Path to file to import
+            progress_callback: Optional callable receiving ImportProgress
+            chunk_size: Rows per chunk; forces streaming mode when set
 
         Returns:
             ImportResult with details of the import operation
@@ -171,6 +216,7 @@ class BaseImporter(ABC, LoggerMixin):
 
         file_path = Path(file_path)
         filename = file_path.name
+        self._current_filename = filename
 
         self.logger.info(f"Starting import: {filename} as {self.data_type.value}")
 
@@ -189,6 +235,12 @@ class BaseImporter(ABC, LoggerMixin):
                 duration_seconds=duration
             )
 
+        if chunk_size is None and should_stream(file_path):
+            chunk_size = settings.IMPORT_CHUNK_SIZE
+
+        if chunk_size is not None:
+            return self._import_streaming(file_path, chunk_size, progress_callback, start_time)
+
         try:
             # Read file
             df = self.read_file(file_path)
@@ -231,6 +283,9 @@ class BaseImporter(ABC, LoggerMixin):
             # Process and validate data
             imported, failed = self._process_data(df)
 
+            if progress_callback:
+                progress_callback(ImportProgress(total_records, imported, failed, 1.0))
+
             duration = (datetime.now() - start_time).total_seconds()
 
             success = failed == 0 or imported > 0
@@ -274,3 +329,113 @@ class BaseImporter(ABC, LoggerMixin):
             Tuple of (imported_count, failed_count)
         """
         pass
+
+    def _import_streaming(
+        self,
+        file_path: Path,
+        chunk_size: int,
+        progress_callback: Optional[ProgressCallback],
+        start_time: datetime
+    ) -> ImportResult:
+        """
+        Import a file chunk by chunk with bounded memory.
+
+        Columns are checked on the first chunk; each chunk is then handed
+        to ``_process_chunk`` and committed before the next one is read.
+
+        Args:
+            file_path: Path to file to import
+            chunk_size: Rows per chunk
+            progress_callback: Optional callable receiving ImportProgress
+            start_time: When the import started
+
+        Returns:
+            ImportResult with totals across all chunks
+        """
+        filename = file_path.name
+        total_records = imported = failed = 0
+        self.logger.info(f"Streaming import in chunks of {chunk_size} rows")
+
+        try:
+            for chunk, fraction in self.read_chunks(file_path, chunk_size):
+                chunk = self.normalize_columns(chunk)
+
+                if total_records == 0 and not self.validate_columns(chunk):
+                    duration = (datetime.now() - start_time).total_seconds()
+                    return ImportResult(
+                        success=False,
+                        data_type=self.data_type,
+                        filename=filename,
+                        total_records=len(chunk),
+                        imported_records=0,
+                        failed_records=len(chunk),
+                        errors=self.errors,
+                        warnings=self.warnings,
+                        duration_seconds=duration
+                    )
+
+                chunk_imported, chunk_failed = self._process_chunk(chunk)
+                total_records += len(chunk)
+                imported += chunk_imported
+                failed += chunk_failed
+
+                if progress_callback:
+                    progress_callback(
+                        ImportProgress(total_records, imported, failed, fraction)
+                    )
+
+            if total_records == 0:
+                self.warnings.append("File contains no data records")
+            else:
+                self._finish_streaming(total_records, imported, failed)
+
+        except Exception as e:
+            self.logger.error(f"Import failed after {total_records} records: {e}")
+            self.errors.append({"type": "exception", "message": str(e)})
+            duration = (datetime.now() - start_time).total_seconds()
+            return ImportResult(
+                success=False,
+                data_type=self.data_type,
+                filename=filename,
+                total_records=total_records,
+                imported_records=imported,
+                failed_records=failed,
+                errors=self.errors,
+                warnings=self.warnings,
+                duration_seconds=duration
+            )
+
+        self.logger.info(f"Read {total_records} records from file")
+        duration = (datetime.now() - start_time).total_seconds()
+
+        return ImportResult(
+            success=failed == 0 or imported > 0,
+            data_type=self.data_type,
+            filename=filename,
+            total_records=total_records,
+            imported_records=imported,
+            failed_records=failed,
+            errors=self.errors,
+            warnings=self.warnings,
+            duration_seconds=duration
+        )
+
+    def _process_chunk(self, df: pd.DataFrame) -> Tuple[int, int]:
+        """
+        Process and commit one chunk of a streaming import.
+
+        Defaults to ``_process_data``; subclasses that log per call
+        override it and log once in ``_finish_streaming`` instead.
+
+        Args:
+            df: Chunk with normalized columns
+
+        Returns:
+            Tuple of (imported_count, failed_count)
+        """
+        return self._process_data(df)
+
+    def _finish_streaming(self, total: int, imported: int, failed: int):
+        """Hook called once after the last chunk of a streaming import."""
+        pass
+
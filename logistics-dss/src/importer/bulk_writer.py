@@ -0,0 +1,205 @@
+"""
+Bulk Writer
+Vectorized type conversion and batched upserts for validated import data.
+
+Columns are converted once per DataFrame with pandas instead of per record,
+and rows are written in ``settings.BATCH_SIZE`` chunks through SQLAlchemy
+Core using SQLite ``INSERT ... ON CONFLICT DO UPDATE``.  A chunk that fails
+is rolled back to a savepoint and retried row by row so a single bad record
+is reported without losing the rest of the batch.
+"""
+
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from config import settings
+from src.database.models import InventoryLevel, SalesRecord
+from src.logger import LoggerMixin
+
+
+# Column name → conversion kind (mirrors CSVImporter._convert_record_types)
+COLUMN_KINDS = {
+    "unit_cost": "decimal",
+    "unit_price": "decimal",
+    "revenue": "decimal",
+    "quantity": "int",
+    "quantity_sold": "int",
+    "capacity": "int",
+    "lead_time_days": "int",
+    "min_order_qty": "int",
+    "date": "date",
+    "last_updated": "datetime",
+}
+
+DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y/%m/%d"]
+DATETIME_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]
+
+# Natural-key conflict targets for tables whose primary key is a surrogate id.
+# Tables not listed here upsert on their primary key; SalesRecord is append-only.
+CONFLICT_TARGETS = {
+    InventoryLevel.__tablename__: ["product_id", "warehouse_id"],
+    SalesRecord.__tablename__: None,
+}
+
+
+def _parse_with_formats(values: pd.Series, formats: List[str]) -> pd.Series:
+    """Parse strings trying each format in order; unparsable values become NaT."""
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    for fmt in formats:
+        remaining = parsed.isna() & values.notna()
+        if not remaining.any():
+            break
+        parsed[remaining] = pd.to_datetime(values[remaining], format=fmt, errors="coerce")
+    return parsed
+
+
+def _to_decimal(text: str) -> Optional[Decimal]:
+    """Exact Decimal of a numeric string; None if unparsable or not finite."""
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        return None
+    return value if value.is_finite() else None
+
+
+def convert_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert string columns to database types, one column at a time.
+
+    Semantics match ``CSVImporter._convert_record_types``: missing values
+    become None, unparsable numbers/dates become None, unparsable
+    ``last_updated`` values fall back to the current time, and all other
+    columns are stripped strings.
+
+    Returns:
+        DataFrame of Python objects (None for missing) ready for insertion.
+    """
+    converted: Dict[str, pd.Series] = {}
+
+    for column in df.columns:
+        raw = df[column]
+        missing = raw.isna()
+        text = raw.where(missing, raw.astype(str).str.strip())
+        kind = COLUMN_KINDS.get(column)
+
+        if kind == "decimal":
+            # Decimal from the text, not via float, so values stay exact
+            values = text.map(_to_decimal, na_action="ignore")
+        elif kind == "int":
+            numbers = pd.to_numeric(text, errors="coerce").astype(float)
+            numbers = numbers.where(np.isfinite(numbers))
+            values = np.trunc(numbers).astype("Int64")
+        elif kind == "date":
+            values = _parse_with_formats(text, DATE_FORMATS).dt.date
+        elif kind == "datetime":
+            iso = pd.to_datetime(text, format="ISO8601", errors="coerce")
+            fallback = _parse_with_formats(text.where(iso.isna()), DATETIME_FORMATS)
+            values = iso.fillna(fallback)
+            values = values.where(missing | values.notna(), pd.Timestamp(datetime.now()))
+            values = values.dt.to_pydatetime()
+            values = pd.Series(values, index=raw.index, dtype=object)
+        else:
+            values = text
+
+        values = values.astype(object)
+        converted[column] = values.where(values.notna() & ~missing, None)
+
+    return pd.DataFrame(converted, index=df.index)
+
+
+class BulkWriter(LoggerMixin):
+    """Batched upsert of converted records into a single ORM table."""
+
+    def __init__(self, model_class, batch_size: Optional[int] = None):
+        """
+        Initialize bulk writer.
+
+        Args:
+            model_class: ORM model whose table receives the records
+            batch_size: Rows per INSERT batch (defaults to settings.BATCH_SIZE)
+        """
+        self.model_class = model_class
+        self.table = model_class.__table__
+        self.batch_size = batch_size or settings.BATCH_SIZE
+
+    def _build_statement(self, columns: List[str]):
+        """Build the INSERT (… ON CONFLICT DO UPDATE) statement for ``columns``."""
+        stmt = sqlite_insert(self.table)
+
+        if self.table.name in CONFLICT_TARGETS:
+            conflict_cols = CONFLICT_TARGETS[self.table.name]
+        else:
+            conflict_cols = [c.name for c in self.table.primary_key.columns]
+
+        if not conflict_cols or not set(conflict_cols).issubset(columns):
+            return stmt
+
+        update_cols = {
+            c: stmt.excluded[c] for c in columns if c not in conflict_cols
+        }
+        if "updated_at" in self.table.c and "updated_at" not in columns:
+            update_cols["updated_at"] = func.now()
+        if not update_cols:
+            return stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+        return stmt.on_conflict_do_update(index_elements=conflict_cols, set_=update_cols)
+
+    def write(
+        self, session, df: pd.DataFrame
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Upsert a converted DataFrame in batches.
+
+        Args:
+            session: Database session (committed by the caller)
+            df: Output of :func:`convert_dataframe`
+
+        Returns:
+            Tuple of (saved_count, errors) where each error has the
+            ``record_save_error`` shape used by ``ImportResult.errors``.
+        """
+        columns = [c for c in df.columns if c in self.table.c]
+        ignored = [c for c in df.columns if c not in self.table.c]
+        if ignored:
+            self.logger.debug(f"Ignoring columns not in {self.table.name}: {ignored}")
+
+        stmt = self._build_statement(columns)
+        records = df[columns].to_dict("records")
+
+        saved = 0
+        errors: List[Dict[str, Any]] = []
+
+        for start in range(0, len(records), self.batch_size):
+            batch = records[start:start + self.batch_size]
+            try:
+                with session.begin_nested():
+                    session.execute(stmt, batch)
+                saved += len(batch)
+            except Exception as batch_error:
+                self.logger.debug(f"Batch at row {start} failed, retrying per row: {batch_error}")
+                for record in batch:
+                    try:
+                        with session.begin_nested():
+                            session.execute(stmt, [record])
+                        saved += 1
+                    except Exception as e:
+                        self.logger.warning(f"Failed to save record: {e}")
+                        errors.append({
+                            "type": "record_save_error",
+                            "message": str(e),
+                            "record": record,
+                        })
+
+        return saved, errors
@@ -0,0 +1,191 @@
+"""
+Chunk Reader
+Bounded-memory iteration over CSV and Excel files.
+
+CSV files are parsed with ``pd.read_csv(chunksize=...)`` and ``.xlsx``
+workbooks with openpyxl's read-only row iterator, so only one chunk of rows
+is materialized at a time.  Every chunk is yielded together with the
+fraction of the file consumed so far, which importers forward to their
+progress callbacks.  Chunk indexes continue across chunks, exactly as if
+the file had been read in one piece.
+"""
+
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+import sys
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from config import settings
+
+
+# Strings treated as missing values by the importers
+NA_VALUES = ["", "NA", "N/A", "null", "NULL", "None", "none"]
+
+Chunk = Tuple[pd.DataFrame, Optional[float]]
+
+
+def should_stream(file_path: Path) -> bool:
+    """True when a file is large enough to be imported chunk by chunk."""
+    return Path(file_path).stat().st_size > settings.STREAMING_THRESHOLD_MB * 1024 * 1024
+
+
+def iter_csv_chunks(
+    file_path: Path,
+    chunksize: int,
+    encoding: str = "utf-8",
+    **read_options: Any
+) -> Iterator[Chunk]:
+    """
+    Yield ``(chunk, fraction)`` pairs from a CSV file.
+
+    Args:
+        file_path: Path to CSV file
+        chunksize: Rows per chunk
+        encoding: Text encoding of the file
+        **read_options: Extra keyword arguments for ``pd.read_csv``
+
+    Yields:
+        DataFrame chunks and the fraction of bytes consumed so far
+    """
+    total_bytes = Path(file_path).stat().st_size or 1
+
+    with open(file_path, "rb") as fh:
+        with pd.read_csv(fh, encoding=encoding, chunksize=chunksize, **read_options) as reader:
+            for chunk in reader:
+                yield chunk, min(fh.tell() / total_bytes, 1.0)
+
+
+def _excel_text(value: Any, na_values: Sequence[str]) -> Any:
+    """Render a cell the way ``pd.read_excel(dtype=str)`` does."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value)
+    return None if text in na_values else text
+
+
+def _header_names(header: Sequence[Any]) -> List[str]:
+    """Column names from the header row; blank cells become ``Unnamed: N``."""
+    return [
+        str(name) if name is not None else f"Unnamed: {i}"
+        for i, name in enumerate(header)
+    ]
+
+
+def _data_rows(rows: Iterator[tuple], width: int) -> Iterator[tuple]:
+    """
+    Pad or trim rows to ``width`` and drop trailing blank rows.
+
+    Blank rows between data rows are kept, matching ``pd.read_excel``.
+    """
+    blank_run: List[tuple] = []
+    for row in rows:
+        row = tuple(row[:width]) + (None,) * (width - len(row))
+        if all(v is None for v in row):
+            blank_run.append(row)
+            continue
+        yield from blank_run
+        blank_run.clear()
+        yield row
+
+
+def iter_excel_chunks(
+    file_path: Path,
+    chunksize: int,
+    sheet_name: Optional[str] = None,
+    as_text: bool = True,
+    na_values: Sequence[str] = NA_VALUES
+) -> Iterator[Chunk]:
+    """
+    Yield ``(chunk, fraction)`` pairs from an Excel workbook.
+
+    ``.xlsx`` files are streamed with openpyxl in read-only mode.  Legacy
+    ``.xls`` files have no streaming reader, so they are loaded once and
+    sliced.
+
+    Args:
+        file_path: Path to Excel file
+        chunksize: Rows per chunk
+        sheet_name: Sheet to read (defaults to the first sheet)
+        as_text: Render cells as strings like ``pd.read_excel(dtype=str)``
+        na_values: Cell strings treated as missing when ``as_text`` is set
+
+    Yields:
+        DataFrame chunks and the fraction of rows consumed so far
+        (None when the sheet does not declare its dimensions)
+    """
+    file_path = Path(file_path)
+
+    if file_path.suffix.lower() != ".xlsx":
+        df = pd.read_excel(
+            file_path,
+            sheet_name=sheet_name or 0,
+            dtype=str if as_text else None,
+            na_values=list(na_values),
+            keep_default_na=True,
+            engine="xlrd",
+        )
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize], min((start + chunksize) / len(df), 1.0)
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        columns = _header_names(header)
+        data = _data_rows(rows, len(columns))
+        total_rows = (sheet.max_row or 0) - 1
+        start = 0
+
+        while True:
+            buffer = list(islice(data, chunksize))
+            if not buffer:
+                break
+            if as_text:
+                buffer = [tuple(_excel_text(v, na_values) for v in row) for row in buffer]
+            chunk = pd.DataFrame(
+                buffer,
+                columns=columns,
+                index=pd.RangeIndex(start, start + len(buffer)),
+                dtype=object,
+            )
+            if not as_text:
+                chunk = chunk.infer_objects()
+            start += len(buffer)
+            yield chunk, min(start / total_rows, 1.0) if total_rows > 0 else None
+    finally:
+        workbook.close()
+
+
+def iter_file_chunks(
+    file_path: Path,
+    chunksize: Optional[int] = None,
+    **options: Any
+) -> Iterator[Chunk]:
+    """
+    Dispatch to the CSV or Excel chunk iterator based on the file suffix.
+
+    Args:
+        file_path: Path to CSV or Excel file
+        chunksize: Rows per chunk (defaults to settings.IMPORT_CHUNK_SIZE)
+        **options: Passed to :func:`iter_csv_chunks` or :func:`iter_excel_chunks`
+    """
+    chunksize = chunksize or settings.IMPORT_CHUNK_SIZE
+    if Path(file_path).suffix.lower() in (".xlsx", ".xls"):
+        return iter_excel_chunks(file_path, chunksize, **options)
+    return iter_csv_chunks(file_path, chunksize, **options)
@@ -3,8 +3,9 @@ CSV File Importer
 Handles importing data from CSV files.
 """
 
+from dataclasses import replace
 from pathlib import Path
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Iterator, Optional
 from datetime import datetime
 from decimal import Decimal
 
@@ -17,7 +18,13 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from config.constants import DataType, ImportStatus
+from config.settings import MAX_VALIDATION_ERRORS
 from src.importer.base import BaseImporter, ImportResult
+from src.importer.bulk_writer import BulkWriter, convert_dataframe
+from src.importer.chunk_reader import NA_VALUES, iter_csv_chunks
+from src.importer.sniffer import (
+    CSVDialect, dialect_fits, is_utf8, read_sample, sniff_dialect
+)
 from src.validator.data_validator import DataValidator
 from src.database.connection import get_db_manager
 from src.database.models import (
@@ -28,6 +35,14 @@ from src.database.models import (
 class CSVImporter(BaseImporter):
     """Import data from CSV files."""
 
+    # pd.read_csv options shared by whole-file and chunked reads
+    READ_OPTIONS = {
+        "dtype": str,  # Read all as strings initially
+        "na_values": NA_VALUES,
+        "keep_default_na": True,
+        "skipinitialspace": True,
+    }
+
     def __init__(self, data_type: DataType):
         """
         Initialize CSV importer.
@@ -38,11 +53,17 @@ class CSVImporter(BaseImporter):
         super().__init__(data_type)
         self.validator = DataValidator(data_type)
         self.db_manager = get_db_manager()
+        self.dialect: Optional[CSVDialect] = None
+        self._dialect_reused = False
 
     def read_file(self, file_path: Path) -> pd.DataFrame:
         """
         Read CSV file into DataFrame.
 
+        The dialect (encoding, delimiter, header) is detected up front, or
+        reused from the last import of the same file, and the file is
+        parsed once.
+
         Args:
             file_path: Path to CSV file
 
@@ -50,26 +71,102 @@ class CSVImporter(BaseImporter):
             DataFrame with file contents
         """
         self.logger.info(f"Reading CSV file: {file_path}")
+        dialect = self._resolve_dialect(file_path)
 
-        # Try different encodings
-        encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252", "iso-8859-1"]
+        try:
+            return self._read_csv(file_path, dialect)
+        except UnicodeDecodeError:
+            if not self._dialect_reused:
+                raise
+            # The feed changed encoding since the dialect was stored
+            self.logger.info("Stored dialect no longer decodes the file, re-detecting")
+            self.dialect = sniff_dialect(file_path, self.required_columns)
+            self._dialect_reused = False
+            return self._read_csv(file_path, self.dialect)
+
+    def read_chunks(
+        self, file_path: Path, chunk_size: int
+    ) -> Iterator[Tuple[pd.DataFrame, Optional[float]]]:
+        """
+        Read CSV file in chunks of ``chunk_size`` rows.
 
-        for encoding in encodings:
-            try:
-                df = pd.read_csv(
-                    file_path,
-                    encoding=encoding,
-                    dtype=str,  # Read all as strings initially
-                    na_values=["", "NA", "N/A", "null", "NULL", "None", "none"],
-                    keep_default_na=True,
-                    skipinitialspace=True
-                )
-                self.logger.debug(f"Successfully read file with {encoding} encoding")
-                return df
-            except UnicodeDecodeError:
-                continue
+        The encoding is settled before parsing starts, so a bad byte near
+        the end cannot abort the import after earlier chunks were
+        committed; a reused UTF-8 dialect is re-verified by a byte scan.
+
+        Args:
+            file_path: Path to CSV file
+            chunk_size: Rows per chunk
+
+        Yields:
+            Tuples of (chunk, fraction of bytes consumed)
+        """
+        dialect = self._resolve_dialect(file_path)
+        if self._dialect_reused and dialect.encoding.startswith("utf-8") and not is_utf8(file_path):
+            self.logger.info("Stored dialect no longer decodes the file, re-detecting")
+            dialect = self.dialect = sniff_dialect(file_path, self.required_columns)
+            self._dialect_reused = False
+
+        self.logger.info(f"Streaming CSV file: {file_path} ({dialect.encoding})")
+        yield from iter_csv_chunks(
+            file_path,
+            chunk_size,
+            **dialect.read_options(self.required_columns),
+            **self.READ_OPTIONS
+        )
+
+    def _read_csv(self, file_path: Path, dialect: CSVDialect) -> pd.DataFrame:
+        """Parse the whole file with a known dialect."""
+        df = pd.read_csv(
+            file_path, **dialect.read_options(self.required_columns), **self.READ_OPTIONS
+        )
+        self.logger.debug(f"Successfully read file with {dialect.encoding} encoding")
+        return df
+
+    def _resolve_dialect(self, file_path: Path) -> CSVDialect:
+        """
+        Dialect for parsing ``file_path``.
+
+        The dialect recorded by the last import of the same file name and
+        data type is reused when it still fits the file's first bytes;
+        otherwise the file is sniffed.  A reused non-UTF-8 encoding is
+        switched to UTF-8 when the whole file turns out to be valid UTF-8,
+        since decoding UTF-8 text as latin-1 never fails.
+        """
+        sample = read_sample(file_path)
+        stored = self._stored_dialect(Path(file_path).name)
+
+        if stored and dialect_fits(stored, sample, self.required_columns):
+            if not stored.encoding.startswith("utf-8") and is_utf8(file_path):
+                stored = replace(stored, encoding="utf-8")
+            self.logger.debug(f"Reusing dialect from previous import: {stored}")
+            self.dialect, self._dialect_reused = stored, True
+        else:
+            self.dialect = sniff_dialect(file_path, self.required_columns, sample=sample)
+            self._dialect_reused = False
+            self.logger.debug(f"Detected dialect: {self.dialect}")
 
-        raise ValueError(f"Could not decode file with any supported encoding: {encodings}")
+        return self.dialect
+
+    def _stored_dialect(self, filename: str) -> Optional[CSVDialect]:
+        """Dialect recorded by the most recent import of ``filename``, if any."""
+        try:
+            with self.db_manager.get_session() as session:
+                stored = (
+                    session.query(ImportLog.dialect)
+                    .filter(
+                        ImportLog.filename == filename,
+                        ImportLog.data_type == self.data_type.value,
+                        ImportLog.dialect.isnot(None),
+                    )
+                    .order_by(ImportLog.id.desc())
+                    .limit(1)
+                    .scalar()
+                )
+        except Exception as e:
+            self.logger.debug(f"Could not look up stored dialect: {e}")
+            return None
+        return CSVDialect.from_json(stored)
 
     def _process_data(self, df: pd.DataFrame) -> Tuple[int, int]:
         """
@@ -95,7 +192,8 @@ class CSVImporter(BaseImporter):
         with self.db_manager.get_session() as session:
             try:
                 imported = self._save_to_database(session, valid_df)
-                self._log_import(session, df, imported, failed)
+                failed += len(valid_df) - imported
+                self._log_import(session, len(df), imported, failed)
                 self.logger.info(f"Successfully imported {imported} records")
                 return imported, failed
             except Exception as e:
@@ -106,10 +204,58 @@ class CSVImporter(BaseImporter):
                 })
                 return 0, len(df)
 
+    def _process_chunk(self, df: pd.DataFrame) -> Tuple[int, int]:
+        """
+        Validate and commit one chunk of a streaming import.
+
+        ``MAX_VALIDATION_ERRORS`` applies to the whole file: once it is
+        used up, the remaining chunks are counted as failed without being
+        validated, as ``validate_dataframe`` does for a single DataFrame.
+
+        Args:
+            df: Chunk to process
+
+        Returns:
+            Tuple of (imported_count, failed_count)
+        """
+        remaining = MAX_VALIDATION_ERRORS - len(self.errors)
+        if remaining <= 0:
+            return 0, len(df)
+
+        is_valid, errors, valid_df = self.validator.validate_dataframe(df, max_errors=remaining)
+        self.errors.extend(errors)
+
+        failed = len(df) - len(valid_df)
+
+        if valid_df.empty:
+            return 0, failed
+
+        with self.db_manager.get_session() as session:
+            try:
+                imported = self._save_to_database(session, valid_df)
+                return imported, failed + len(valid_df) - imported
+            except Exception as e:
+                self.logger.error(f"Database save failed: {e}")
+                self.errors.append({
+                    "type": "database_error",
+                    "message": str(e)
+                })
+                return 0, len(df)
+
+    def _finish_streaming(self, total: int, imported: int, failed: int):
+        """Write a single ImportLog entry for a streaming import."""
+        self.logger.info(f"Successfully imported {imported} records")
+        with self.db_manager.get_session() as session:
+            self._log_import(session, total, imported, failed)
+
     def _save_to_database(self, session, df: pd.DataFrame) -> int:
         """
         Save DataFrame records to appropriate table.
 
+        Records are converted column-wise and upserted in
+        ``settings.BATCH_SIZE`` batches; rows rejected by the database are
+        reported as ``record_save_error`` entries in ``self.errors``.
+
         Args:
             session: Database session
             df: DataFrame with validated records
@@ -126,22 +272,11 @@ class CSVImporter(BaseImporter):
         }
 
         model_class = model_map[self.data_type]
-        records = df.to_dict("records")
 
-        count = 0
-        for record in records:
-            try:
-                converted = self._convert_record_types(record)
-                instance = model_class(**converted)
-                session.merge(instance)  # Use merge for upsert behavior
-                count += 1
-            except Exception as e:
-                self.logger.warning(f"Failed to save record: {e}")
-                self.errors.append({
-                    "type": "record_save_error",
-                    "message": str(e),
-                    "record": record
-                })
+        # Column-wise conversion, then batched INSERT ... ON CONFLICT DO UPDATE
+        converted = convert_dataframe(df)
+        count, errors = BulkWriter(model_class).write(session, converted)
+        self.errors.extend(errors)
 
         return count
 
@@ -238,13 +373,13 @@ class CSVImporter(BaseImporter):
 
         return datetime.now()
 
-    def _log_import(self, session, df: pd.DataFrame, imported: int, failed: int):
+    def _log_import(self, session, total: int, imported: int, failed: int):
         """
         Log the import operation.
 
         Args:
             session: Database session
-            df: Original DataFrame
+            total: Number of records read from the file
             imported: Number of records imported
             failed: Number of records failed
         """
@@ -263,11 +398,12 @@ class CSVImporter(BaseImporter):
         log_entry = ImportLog(
             filename=getattr(self, '_current_filename', 'unknown'),
             data_type=self.data_type.value,
-            records_total=len(df),
+            records_total=total,
             records_imported=imported,
             records_failed=failed,
             status=status,
-            error_details=error_details
+            error_details=error_details,
+            dialect=self.dialect.to_json() if self.dialect else None
         )
 
         session.add(log_entry)
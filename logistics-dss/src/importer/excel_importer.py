@@ -4,7 +4,7 @@ Handles importing data from Excel files (.xlsx, .xls).
 """
 
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List, Tuple
 
 import pandas as pd
 
@@ -15,6 +15,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from config.constants import DataType
+from src.importer.chunk_reader import NA_VALUES, iter_excel_chunks
 from src.importer.csv_importer import CSVImporter
 
 
@@ -58,7 +59,7 @@ class ExcelImporter(CSVImporter):
                 file_path,
                 sheet_name=self.sheet_name or 0,  # Default to first sheet
                 dtype=str,  # Read all as strings initially
-                na_values=["", "NA", "N/A", "null", "NULL", "None", "none"],
+                na_values=NA_VALUES,
                 keep_default_na=True,
                 engine=engine
             )
@@ -70,6 +71,25 @@ class ExcelImporter(CSVImporter):
             self.logger.error(f"Failed to read Excel file: {e}")
             raise
 
+    def read_chunks(
+        self, file_path: Path, chunk_size: int
+    ) -> Iterator[Tuple[pd.DataFrame, Optional[float]]]:
+        """
+        Read Excel file in chunks of ``chunk_size`` rows.
+
+        ``.xlsx`` sheets are iterated with openpyxl in read-only mode, so
+        the workbook is never loaded into memory as a whole.
+
+        Args:
+            file_path: Path to Excel file
+            chunk_size: Rows per chunk
+
+        Yields:
+            Tuples of (chunk, fraction of rows consumed)
+        """
+        self.logger.info(f"Streaming Excel file: {file_path}")
+        yield from iter_excel_chunks(file_path, chunk_size, sheet_name=self.sheet_name)
+
     def get_sheet_names(self, file_path: Path) -> List[str]:
         """
         Get list of sheet names in Excel file.
@@ -0,0 +1,228 @@
+"""
+CSV Sniffer
+Decides a CSV file's encoding, delimiter and header row before parsing.
+
+Delimiter and header are read from a bounded prefix sample.  The encoding
+comes from a BOM check plus one byte-level pass that verifies UTF-8
+(all-ASCII blocks are skipped without decoding), falling back to latin-1,
+which accepts any byte sequence.  The file is then parsed exactly once
+with the resulting :class:`CSVDialect`, instead of being re-parsed for
+every candidate encoding.
+"""
+
+import codecs
+import csv
+import io
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+SAMPLE_BYTES = 64 * 1024
+SAMPLE_LINES = 50
+DELIMITERS = [",", ";", "\t", "|"]
+FALLBACK_ENCODING = "latin-1"
+
+_SCAN_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CSVDialect:
+    """How a CSV file is encoded and laid out."""
+    encoding: str = "utf-8"
+    delimiter: str = ","
+    has_header: bool = True
+
+    def to_json(self) -> str:
+        """Serialize for storage in ``ImportLog.dialect``."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, text: Any) -> Optional["CSVDialect"]:
+        """Deserialize a stored dialect; None if missing or malformed."""
+        if not isinstance(text, str):
+            return None
+        try:
+            return cls(**json.loads(text))
+        except (TypeError, ValueError):
+            return None
+
+    def read_options(self, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Keyword arguments for ``pd.read_csv``.
+
+        Args:
+            columns: Column names to assign when the file has no header row
+        """
+        options: Dict[str, Any] = {"encoding": self.encoding, "sep": self.delimiter}
+        if not self.has_header:
+            options["header"] = None
+            options["names"] = list(columns or [])
+        return options
+
+
+def read_sample(file_path: Path, size: int = SAMPLE_BYTES) -> bytes:
+    """Read at most ``size`` bytes from the start of a file."""
+    with open(file_path, "rb") as fh:
+        return fh.read(size)
+
+
+def is_utf8(file_path: Path) -> bool:
+    """True if the whole file is valid UTF-8, scanned in fixed-size blocks."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(file_path, "rb") as fh:
+            for block in iter(lambda: fh.read(_SCAN_BLOCK_SIZE), b""):
+                # ASCII is valid UTF-8 unless a multi-byte sequence is pending
+                if block.isascii() and not decoder.getstate()[0]:
+                    continue
+                decoder.decode(block)
+            decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_encoding(file_path: Path, sample: Optional[bytes] = None) -> str:
+    """
+    Pick the encoding for a CSV file.
+
+    Args:
+        file_path: Path to CSV file
+        sample: Prefix of the file, if already read
+
+    Returns:
+        ``utf-8-sig`` for files with a UTF-8 BOM, ``utf-8`` for valid UTF-8,
+        otherwise latin-1
+    """
+    if sample is None:
+        sample = read_sample(file_path)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    return "utf-8" if is_utf8(file_path) else FALLBACK_ENCODING
+
+
+def _decode_sample(sample: bytes, encoding: str, complete: bool) -> str:
+    """Decode a sample, dropping a partial trailing line unless it is the whole file."""
+    text = sample.decode(encoding, errors="replace")
+    if not complete and "\n" in text:
+        text = text[:text.rindex("\n")]
+    return "\n".join(text.splitlines()[:SAMPLE_LINES])
+
+
+def _rows(text: str, delimiter: str) -> List[List[str]]:
+    return [row for row in csv.reader(io.StringIO(text), delimiter=delimiter) if row]
+
+
+def detect_delimiter(text: str) -> str:
+    """
+    Pick the delimiter from decoded sample lines.
+
+    A comma is kept whenever it splits every sampled line into the same
+    number (>1) of fields; otherwise ``csv.Sniffer`` chooses among
+    :data:`DELIMITERS`, defaulting to a comma.
+    """
+    rows = _rows(text, ",")
+    if rows and len(rows[0]) > 1 and all(len(r) == len(rows[0]) for r in rows):
+        return ","
+    try:
+        return csv.Sniffer().sniff(text, delimiters="".join(DELIMITERS)).delimiter
+    except csv.Error:
+        return ","
+
+
+def detect_header(
+    text: str,
+    delimiter: str,
+    expected_columns: Optional[Sequence[str]] = None
+) -> bool:
+    """
+    Decide whether the first sampled line is a header row.
+
+    With ``expected_columns`` the first row is a header if any cell names
+    an expected column.  It is treated as data only when it has exactly
+    one field per expected column and ``csv.Sniffer`` agrees, so that
+    positional column names are safe to assign.
+    """
+    rows = _rows(text, delimiter)
+    if not rows:
+        return True
+
+    if expected_columns is not None:
+        expected = {c.lower() for c in expected_columns}
+        if any(cell.strip().lower() in expected for cell in rows[0]):
+            return True
+        if len(rows[0]) != len(expected_columns):
+            return True
+
+    try:
+        return csv.Sniffer().has_header(text)
+    except csv.Error:
+        return True
+
+
+def sniff_dialect(
+    file_path: Path,
+    expected_columns: Optional[Sequence[str]] = None,
+    sample: Optional[bytes] = None
+) -> CSVDialect:
+    """
+    Detect the dialect of a CSV file.
+
+    Args:
+        file_path: Path to CSV file
+        expected_columns: Column names the importer requires, used to
+            recognize the header row
+        sample: Prefix of the file, if already read
+
+    Returns:
+        CSVDialect for parsing the file
+    """
+    if sample is None:
+        sample = read_sample(file_path)
+    encoding = detect_encoding(file_path, sample)
+    text = _decode_sample(sample, encoding, complete=len(sample) < SAMPLE_BYTES)
+    delimiter = detect_delimiter(text)
+    return CSVDialect(
+        encoding=encoding,
+        delimiter=delimiter,
+        has_header=detect_header(text, delimiter, expected_columns),
+    )
+
+
+def dialect_fits(
+    dialect: CSVDialect,
+    sample: bytes,
+    expected_columns: Optional[Sequence[str]] = None
+) -> bool:
+    """
+    Cheap check that a previously detected dialect still fits a file.
+
+    The sample must decode under the dialect's encoding and its first line
+    must split the same way (delimiter and header) as when detected.  A
+    fallback encoding such as latin-1 decodes any bytes, so it no longer
+    fits once the sample holds non-ASCII text that is valid UTF-8.
+    """
+    if (dialect.encoding == "utf-8-sig") != sample.startswith(codecs.BOM_UTF8):
+        return False
+    if not dialect.encoding.startswith("utf-8") and not sample.isascii():
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(sample)
+            return False
+        except UnicodeDecodeError:
+            pass
+
+    decoder = codecs.getincrementaldecoder(dialect.encoding)()
+    try:
+        decoder.decode(sample)   # a truncated trailing sequence is not an error
+    except (UnicodeDecodeError, LookupError):
+        return False
+
+    text = _decode_sample(sample, dialect.encoding, complete=len(sample) < SAMPLE_BYTES)
+    rows = _rows(text, dialect.delimiter)
+    if not rows:
+        return True
+    if len(rows[0]) == 1 and any(d in text for d in DELIMITERS if d != dialect.delimiter):
+        return False
+    return detect_header(text, dialect.delimiter, expected_columns) == dialect.has_header
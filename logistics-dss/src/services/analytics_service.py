@@ -18,19 +18,22 @@ from src.database.connection import get_db_manager
 from src.database.models import Product, InventoryLevel, SalesRecord
 from src.analytics.abc_analysis import classify, summarize, ABCItem
 from src.logger import LoggerMixin
+from src.services.report_context import ReportContext, context_memoized
 from config.constants import ABC_A_THRESHOLD, ABC_B_THRESHOLD, DEFAULT_ANALYTICS_DAYS
 
 
 class AnalyticsService(LoggerMixin):
     """Provides ABC classification and inventory turnover analytics."""
 
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, context: Optional[ReportContext] = None):
         self.db_manager = db_manager or get_db_manager()
+        self.context = context
 
     def _lookback_date(self, days: int) -> date:
         """Calculate the start date for a lookback period."""
         return date.today() - timedelta(days=days)
 
+    @context_memoized
     def _get_product_revenue(
         self,
         days: int,
@@ -72,6 +75,7 @@ class AnalyticsService(LoggerMixin):
                 for r in rows
             ]
 
+    @context_memoized
     def _get_stock_map(self, category: Optional[str] = None) -> Dict[str, int]:
         """Return {product_id: total_stock} for all (or category-filtered) products."""
         with self.db_manager.get_session() as session:
@@ -20,10 +20,13 @@ from src.database.connection import get_db_manager
 from src.database.models import Product, InventoryLevel, SalesRecord
 from src.analytics.forecasting import (
     build_series,
+    build_series_batch,
     forecast as compute_forecast,
+    forecast_batch,
     ForecastResult,
 )
 from src.logger import LoggerMixin
+from src.services.report_context import ReportContext, context_memoized
 from config.constants import (
     DEFAULT_ANALYTICS_DAYS,
     DEFAULT_FORECAST_HORIZON_DAYS,
@@ -36,8 +39,9 @@ from config.constants import (
 class ForecastService(LoggerMixin):
     """Provides demand forecasting and reorder recommendation services."""
 
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, context: Optional[ReportContext] = None):
         self.db_manager = db_manager or get_db_manager()
+        self.context = context
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -71,6 +75,46 @@ class ForecastService(LoggerMixin):
                 for r in rows
             ]
 
+    @context_memoized
+    def _get_daily_demand_rows_by_product(
+        self, days: int, category: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return per-day sales totals for every product in a single grouped query.
+
+        Keyed by product_id; each value has the same shape as
+        ``_get_daily_demand_rows``.  Products without sales are absent.
+        """
+        start = self._lookback_date(days)
+        rows_by_product: Dict[str, List[Dict[str, Any]]] = {}
+
+        with self.db_manager.get_session() as session:
+            query = (
+                session.query(
+                    SalesRecord.product_id.label("product_id"),
+                    SalesRecord.date.label("date"),
+                    func.sum(SalesRecord.quantity_sold).label("total_quantity"),
+                )
+                .filter(SalesRecord.date >= start)
+            )
+            if category:
+                query = (
+                    query.join(Product, Product.id == SalesRecord.product_id)
+                    .filter(Product.category == category)
+                )
+            query = (
+                query.group_by(SalesRecord.product_id, SalesRecord.date)
+                .order_by(SalesRecord.product_id.asc(), SalesRecord.date.asc())
+            )
+
+            for r in query.yield_per(5000):
+                rows_by_product.setdefault(r.product_id, []).append(
+                    {"date": str(r.date), "total_quantity": int(r.total_quantity)}
+                )
+
+        return rows_by_product
+
+    @context_memoized
     def _get_all_products_with_stock(
         self, category: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -168,6 +212,7 @@ class ForecastService(LoggerMixin):
             self.logger.error(f"Forecast failed for {product_id}: {e}")
             return None
 
+    @context_memoized
     def get_reorder_recommendations(
         self,
         category: Optional[str] = None,
@@ -197,19 +242,17 @@ class ForecastService(LoggerMixin):
             start = self._lookback_date(days)
             end = date.today() - timedelta(days=1)
 
+            rows_by_product = self._get_daily_demand_rows_by_product(days, category)
+            all_series = build_series_batch(products, rows_by_product, start, end)
+            results = forecast_batch(
+                all_series, method=method, horizon_days=horizon_days,
+                window=FORECAST_SMA_WINDOW
+            )
+
             recommendations = []
 
-            for p in products:
+            for p, result in zip(products, results):
                 pid = p["product_id"]
-                raw = self._get_daily_demand_rows(pid, days)
-                series = build_series(
-                    pid, p["product_name"], p["category"], raw, start, end
-                )
-
-                result: ForecastResult = compute_forecast(
-                    series, method=method, horizon_days=horizon_days,
-                    window=FORECAST_SMA_WINDOW
-                )
 
                 stock = p["total_stock"]
                 daily_fcst = result.forecast_daily
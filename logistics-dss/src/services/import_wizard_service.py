@@ -4,21 +4,30 @@ Validation, preview, and import orchestration for three data types:
   - PRODUCTS  (product master: sku, name, category, unit_cost, ...)
   - DEMAND    (historical demand: sku, date, quantity)
   - SUPPLIERS (supplier master: name, default_lead_time_days, ...)
+
+Each flow is a single pass over the file: every chunk is checked with
+vectorized column operations against key sets fetched once up front, and
+the rows that pass are written with batched Core inserts/upserts.  The
+validate_* methods run the same checks without writing.
 """
 
-import re
 import sys
-from datetime import datetime, date
+import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.database.connection import get_db_manager
-from src.database.models import Product, Supplier, SalesRecord
+from src.database.models import Product, Supplier, SalesRecord, Warehouse
+from src.importer.base import ImportProgress, ProgressCallback
+from src.importer.bulk_writer import BulkWriter
+from src.importer.chunk_reader import iter_file_chunks
 from src.services.audit_service import AuditService
 from src.services.auth_service import AuthService
 from config.constants import (
@@ -27,6 +36,8 @@ from config.constants import (
     IMPORT_TYPE_SUPPLIERS,
 )
 
+DEFAULT_WAREHOUSE = "WH-DEFAULT"  # demand rows are booked against this warehouse
+
 
 # ---------------------------------------------------------------------------
 # Custom exceptions
@@ -53,8 +64,12 @@ class ImportWizardService:
 
     def get_import_preview(self, path: str, import_type: str) -> list[dict]:
         """Return the first 10 rows as a list of dicts (CSV or Excel auto-detected)."""
-        df = self._read_file(path)
-        return df.head(10).fillna("").to_dict(orient="records")
+        chunks = self._iter_chunks(path, chunksize=10)
+        try:
+            df, _ = next(chunks, (pd.DataFrame(), None))
+        finally:
+            chunks.close()
+        return df.fillna("").to_dict(orient="records")
 
     # ------------------------------------------------------------------
     # Validation
@@ -69,47 +84,22 @@ class ImportWizardService:
         """
         errors: list[str] = []
         warnings: list[str] = []
+        row_count = 0
 
         try:
-            df = self._read_file(path)
+            for df, _ in self._iter_chunks(path):
+                if row_count == 0:
+                    missing = self._missing_columns(df, ("sku", "name"))
+                    if missing:
+                        return {"errors": missing, "warnings": [], "row_count": len(df)}
+                check = self._check_products(df)
+                errors.extend(check.errors)
+                warnings.extend(check.warnings)
+                row_count += len(df)
         except Exception as exc:
             return {"errors": [f"Cannot read file: {exc}"], "warnings": [], "row_count": 0}
 
-        # Required columns
-        for col in ("sku", "name"):
-            if col not in df.columns:
-                errors.append(f"Required column '{col}' not found")
-
-        if errors:
-            return {"errors": errors, "warnings": warnings, "row_count": len(df)}
-
-        for i, row in df.iterrows():
-            row_num = i + 2  # 1-based + header
-            sku = str(row.get("sku", "")).strip()
-            name = str(row.get("name", "")).strip()
-
-            if not sku or len(sku) > 32 or re.search(r"\s", sku):
-                errors.append(f"Row {row_num}: sku must be 1–32 non-whitespace characters")
-            if not name or len(name) > 128:
-                errors.append(f"Row {row_num}: name must be 1–128 characters")
-
-            unit_cost = row.get("unit_cost")
-            if pd.notna(unit_cost):
-                try:
-                    cost = float(unit_cost)
-                    if cost < 0:
-                        errors.append(f"Row {row_num}: unit_cost must be ≥ 0")
-                except (ValueError, TypeError):
-                    errors.append(f"Row {row_num}: unit_cost must be a number")
-
-            abc = row.get("abc_class")
-            if pd.notna(abc) and str(abc).strip() not in ("A", "B", "C", ""):
-                errors.append(f"Row {row_num}: abc_class must be A, B, or C")
-
-            if pd.isna(row.get("abc_class")) or str(row.get("abc_class", "")).strip() == "":
-                warnings.append(f"Row {row_num}: abc_class blank, defaulting to A")
-
-        return {"errors": errors, "warnings": warnings, "row_count": len(df)}
+        return {"errors": errors, "warnings": warnings, "row_count": row_count}
 
     def validate_demand_file(self, path: str) -> dict:
         """
@@ -121,51 +111,34 @@ class ImportWizardService:
         """
         errors: list[str] = []
         warnings: list[str] = []
+        row_count = 0
 
-        try:
-            df = self._read_file(path)
-        except Exception as exc:
-            return {"errors": [f"Cannot read file: {exc}"], "warnings": [], "row_count": 0}
-
-        for col in ("sku", "date", "quantity"):
-            if col not in df.columns:
-                errors.append(f"Required column '{col}' not found")
-
-        if errors:
-            return {"errors": errors, "warnings": warnings, "row_count": len(df)}
-
-        # Cross-check SKUs against Product table
-        with self._db.get_session() as session:
-            known_skus = {
-                r[0] for r in session.query(Product.id).all()
-            }
-
+        known_skus = self._fetch_keys(Product.id)
         if len(known_skus) < 5:
             warnings.append(
                 "Product table has fewer than 5 rows — ensure products are imported first."
             )
 
-        unknown = set()
-        for i, row in df.iterrows():
-            row_num = i + 2
-            sku = str(row.get("sku", "")).strip()
-            if sku not in known_skus:
-                unknown.add(sku)
-
-            qty = row.get("quantity")
-            if pd.notna(qty):
-                try:
-                    if int(qty) < 0:
-                        errors.append(f"Row {row_num}: quantity must be ≥ 0")
-                except (ValueError, TypeError):
-                    errors.append(f"Row {row_num}: quantity must be an integer")
+        unknown: set[str] = set()
+        try:
+            for df, _ in self._iter_chunks(path):
+                if row_count == 0:
+                    missing = self._missing_columns(df, ("sku", "date", "quantity"))
+                    if missing:
+                        return {"errors": missing, "warnings": [], "row_count": len(df)}
+                check = self._check_demand(df, known_skus)
+                unknown.update(check.unknown)
+                errors.extend(check.errors)
+                row_count += len(df)
+        except Exception as exc:
+            return {"errors": [f"Cannot read file: {exc}"], "warnings": [], "row_count": 0}
 
         if unknown:
             raise ImportValidationError(
                 f"Unknown SKU(s) not in Product table: {sorted(unknown)}"
             )
 
-        return {"errors": errors, "warnings": warnings, "row_count": len(df)}
+        return {"errors": errors, "warnings": warnings, "row_count": row_count}
 
     def validate_supplier_file(self, path: str) -> dict:
         """
@@ -174,98 +147,74 @@ class ImportWizardService:
         """
         errors: list[str] = []
         warnings: list[str] = []
+        row_count = 0
+        seen_names: set[str] = set()
 
         try:
-            df = self._read_file(path)
+            for df, _ in self._iter_chunks(path):
+                if row_count == 0:
+                    missing = self._missing_columns(df, ("name", "default_lead_time_days"))
+                    if missing:
+                        return {"errors": missing, "warnings": [], "row_count": len(df)}
+                check = self._check_suppliers(df, seen_names)
+                errors.extend(check.errors)
+                row_count += len(df)
         except Exception as exc:
             return {"errors": [f"Cannot read file: {exc}"], "warnings": [], "row_count": 0}
 
-        for col in ("name", "default_lead_time_days"):
-            if col not in df.columns:
-                errors.append(f"Required column '{col}' not found")
-
-        if errors:
-            return {"errors": errors, "warnings": warnings, "row_count": len(df)}
-
-        seen_names: set[str] = set()
-        for i, row in df.iterrows():
-            row_num = i + 2
-            name = str(row.get("name", "")).strip()
-            if not name or len(name) > 128:
-                errors.append(f"Row {row_num}: name must be 1–128 characters")
-            if name in seen_names:
-                errors.append(f"Row {row_num}: duplicate supplier name '{name}' within file")
-            seen_names.add(name)
-
-            ltd = row.get("default_lead_time_days")
-            if pd.notna(ltd):
-                try:
-                    if int(ltd) < 1:
-                        errors.append(f"Row {row_num}: default_lead_time_days must be ≥ 1")
-                except (ValueError, TypeError):
-                    errors.append(f"Row {row_num}: default_lead_time_days must be an integer")
-
-        return {"errors": errors, "warnings": warnings, "row_count": len(df)}
+        return {"errors": errors, "warnings": warnings, "row_count": row_count}
 
     # ------------------------------------------------------------------
     # Import
     # ------------------------------------------------------------------
 
-    def import_products(self, path: str, overwrite_existing: bool = False) -> dict:
+    def import_products(
+        self,
+        path: str,
+        overwrite_existing: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> dict:
         """
-        Commit valid product rows to DB.
+        Commit valid product rows to DB, one chunk of the file at a time.
+
+        New SKUs are inserted; existing SKUs are updated when
+        ``overwrite_existing`` is set and skipped otherwise.
 
         Returns:
             {imported_count, skipped_count, errors}
         """
-        df = self._read_file(path)
         imported = 0
         skipped = 0
         errors: list[str] = []
-
         actor = self._get_actor()
 
-        with self._db.get_session() as session:
-            existing_ids = {r[0] for r in session.query(Product.id).all()}
-
-            for i, row in df.iterrows():
-                sku = str(row.get("sku", "")).strip()
-                name = str(row.get("name", "")).strip()
-                if not sku or not name:
-                    errors.append(f"Row {i + 2}: missing sku or name — skipped")
-                    skipped += 1
-                    continue
-
-                category = str(row.get("category", "")).strip() or ""
-                unit_cost = self._safe_float(row.get("unit_cost"), 0.0)
-                unit_price = self._safe_float(row.get("unit_price"), unit_cost)
-                abc_class = str(row.get("abc_class", "A")).strip() or "A"
-
-                if sku in existing_ids:
-                    if overwrite_existing:
-                        product = session.get(Product, sku)
-                        if product:
-                            product.name = name
-                            product.category = category
-                            product.unit_cost = unit_cost
-                            product.unit_price = unit_price
-                            product.updated_at = datetime.utcnow()
-                            imported += 1
-                    else:
-                        skipped += 1
-                else:
-                    product = Product(
-                        id=sku,
-                        name=name,
-                        category=category,
-                        unit_cost=unit_cost,
-                        unit_price=unit_price,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                    )
-                    session.add(product)
-                    existing_ids.add(sku)
-                    imported += 1
+        existing_ids = self._fetch_keys(Product.id)
+        writer = BulkWriter(Product)
+
+        for df, fraction in self._iter_chunks(path):
+            check = self._check_products(df)
+            errors.extend(f"{e} — skipped" for e in check.errors)
+
+            keep = ~check.invalid
+            if not overwrite_existing:
+                skus = check.values["sku"][keep]
+                keep[keep] = (~skus.isin(existing_ids) & ~skus.duplicated()).to_numpy()
+            skipped += len(df) - int(keep.sum())
+
+            if keep.any():
+                rows = pd.DataFrame({
+                    "id": check.values["sku"][keep],
+                    "name": check.values["name"][keep],
+                    "category": check.values["category"][keep],
+                    "unit_cost": check.values["unit_cost"][keep],
+                    "unit_price": check.values["unit_price"][keep],
+                })
+                saved, failed = self._write(writer, rows, "id", "SKU", errors)
+                imported += saved
+                skipped += failed
+                existing_ids.update(rows["id"])
+
+            self._report_progress(progress_callback, imported, skipped, fraction)
 
         self._audit.log(
             IMPORT_TYPE_PRODUCTS,
@@ -278,58 +227,45 @@ class ImportWizardService:
         )
         return {"imported_count": imported, "skipped_count": skipped, "errors": errors}
 
-    def import_demand_history(self, path: str) -> dict:
+    def import_demand_history(
+        self, path: str, progress_callback: Optional[ProgressCallback] = None
+    ) -> dict:
         """
         Append demand rows; returns {imported_count, skipped_count, errors}.
-        Deduplicates by (product_id, date, warehouse_id).
+        Rows with unknown SKUs, bad dates or bad quantities are skipped.
+        Each chunk of the file is committed before the next one is read.
         """
-        df = self._read_file(path)
         imported = 0
         skipped = 0
         errors: list[str] = []
         actor = self._get_actor()
 
-        # Use a default warehouse id for demand import
-        default_warehouse = "WH-DEFAULT"
-
-        with self._db.get_session() as session:
-            known_skus = {r[0] for r in session.query(Product.id).all()}
-
-            for i, row in df.iterrows():
-                sku = str(row.get("sku", "")).strip()
-                date_str = str(row.get("date", "")).strip()
-                qty = row.get("quantity")
-
-                if sku not in known_skus:
-                    errors.append(f"Row {i + 2}: SKU '{sku}' not found — skipped")
-                    skipped += 1
-                    continue
-
-                try:
-                    record_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                except ValueError:
-                    errors.append(f"Row {i + 2}: invalid date '{date_str}' — skipped")
-                    skipped += 1
-                    continue
-
-                try:
-                    quantity = int(qty)
-                    if quantity < 0:
-                        raise ValueError
-                except (ValueError, TypeError):
-                    errors.append(f"Row {i + 2}: invalid quantity — skipped")
-                    skipped += 1
-                    continue
-
-                record = SalesRecord(
-                    date=record_date,
-                    product_id=sku,
-                    warehouse_id=default_warehouse,
-                    quantity_sold=quantity,
-                    revenue=0,
-                )
-                session.add(record)
-                imported += 1
+        known_skus = self._fetch_keys(Product.id)
+        if DEFAULT_WAREHOUSE not in self._fetch_keys(Warehouse.id):
+            raise ImportValidationError(
+                f"Warehouse '{DEFAULT_WAREHOUSE}' must exist before importing demand history"
+            )
+        writer = BulkWriter(SalesRecord)
+
+        for df, fraction in self._iter_chunks(path):
+            check = self._check_demand(df, known_skus)
+            errors.extend(f"{e} — skipped" for e in check.errors)
+            skipped += int(check.invalid.sum())
+
+            keep = ~check.invalid
+            if keep.any():
+                rows = pd.DataFrame({
+                    "date": check.values["date"][keep],
+                    "product_id": check.values["sku"][keep],
+                    "warehouse_id": DEFAULT_WAREHOUSE,
+                    "quantity_sold": check.values["quantity"][keep],
+                    "revenue": 0,
+                })
+                saved, failed = self._write(writer, rows, "product_id", "SKU", errors)
+                imported += saved
+                skipped += failed
+
+            self._report_progress(progress_callback, imported, skipped, fraction)
 
         self._audit.log(
             IMPORT_TYPE_DEMAND,
@@ -338,47 +274,44 @@ class ImportWizardService:
         )
         return {"imported_count": imported, "skipped_count": skipped, "errors": errors}
 
-    def import_suppliers(self, path: str) -> dict:
+    def import_suppliers(
+        self, path: str, progress_callback: Optional[ProgressCallback] = None
+    ) -> dict:
         """
-        Create Supplier rows; skip duplicates by name.
+        Create Supplier rows; skip duplicates by name (case-insensitive).
         Returns {imported_count, skipped_count, errors}.
         """
-        df = self._read_file(path)
         imported = 0
         skipped = 0
         errors: list[str] = []
         actor = self._get_actor()
 
-        with self._db.get_session() as session:
-            existing_names = {
-                r[0].lower() for r in session.query(Supplier.name).all()
-            }
-
-            for i, row in df.iterrows():
-                name = str(row.get("name", "")).strip()
-                if not name:
-                    errors.append(f"Row {i + 2}: missing name — skipped")
-                    skipped += 1
-                    continue
-
-                if name.lower() in existing_names:
-                    skipped += 1
-                    continue
-
-                lead_time = self._safe_int(row.get("default_lead_time_days"), 7)
-
-                import uuid
-                supplier = Supplier(
-                    id=str(uuid.uuid4())[:20],
-                    name=name,
-                    lead_time_days=max(1, lead_time),
-                    min_order_qty=1,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                session.add(supplier)
-                existing_names.add(name.lower())
-                imported += 1
+        existing_names = {name.lower() for name in self._fetch_keys(Supplier.name)}
+        writer = BulkWriter(Supplier)
+
+        for df, fraction in self._iter_chunks(path):
+            check = self._check_suppliers(df)
+            errors.extend(f"{e} — skipped" for e in check.errors)
+
+            names = check.values["name"]
+            lowered = names.str.lower()
+            is_new = ~check.invalid & ~lowered.isin(existing_names) & ~lowered.duplicated()
+            skipped += len(df) - int(is_new.sum())
+
+            if is_new.any():
+                new_names = names[is_new]
+                rows = pd.DataFrame({
+                    "id": [str(uuid.uuid4())[:20] for _ in range(len(new_names))],
+                    "name": new_names.to_numpy(),
+                    "lead_time_days": check.values["lead_time"][is_new].to_numpy(),
+                    "min_order_qty": 1,
+                })
+                saved, failed = self._write(writer, rows, "name", "Supplier", errors)
+                imported += saved
+                skipped += failed
+                existing_names.update(lowered[is_new])
+
+            self._report_progress(progress_callback, imported, skipped, fraction)
 
         self._audit.log(
             IMPORT_TYPE_SUPPLIERS,
@@ -387,34 +320,225 @@ class ImportWizardService:
         )
         return {"imported_count": imported, "skipped_count": skipped, "errors": errors}
 
+    # ------------------------------------------------------------------
+    # Row checks (shared by validate_* and import_*)
+    # ------------------------------------------------------------------
+
+    def _check_products(self, df: pd.DataFrame) -> "_ChunkCheck":
+        sku = _text(df, "sku")
+        name = _text(df, "name")
+        raw_cost = _column(df, "unit_cost")
+        cost = _as_float(raw_cost)
+        price = _as_float(_column(df, "unit_price"))
+        abc = _text(df, "abc_class")
+
+        cost_given = raw_cost.notna().to_numpy()
+        check = _ChunkCheck.from_masks(df.index, [
+            ((sku == "") | (sku.str.len() > 32) | sku.str.contains(r"\s"),
+             "Row {row}: sku must be 1–32 non-whitespace characters", None),
+            ((name == "") | (name.str.len() > 128),
+             "Row {row}: name must be 1–128 characters", None),
+            (cost_given & cost.isna().to_numpy(),
+             "Row {row}: unit_cost must be a number", None),
+            (cost_given & (cost < 0).to_numpy(),
+             "Row {row}: unit_cost must be ≥ 0", None),
+            (~abc.isin(["A", "B", "C", ""]),
+             "Row {row}: abc_class must be A, B, or C", None),
+        ])
+        check.warnings = [
+            f"Row {n}: abc_class blank, defaulting to A"
+            for n in _row_numbers(df.index)[(abc == "").to_numpy()]
+        ]
+
+        cost = cost.fillna(0.0)
+        check.values = {
+            "sku": sku,
+            "name": name,
+            "category": _text(df, "category"),
+            "unit_cost": cost,
+            "unit_price": price.fillna(cost),
+        }
+        return check
+
+    def _check_demand(self, df: pd.DataFrame, known_skus: set) -> "_ChunkCheck":
+        sku = _text(df, "sku")
+        date_text = _text(df, "date")
+        dates = pd.to_datetime(date_text, format="%Y-%m-%d", errors="coerce")
+        quantity = _as_int(_column(df, "quantity"))
+
+        unknown = ~sku.isin(known_skus)
+        check = _ChunkCheck.from_masks(df.index, [
+            (unknown, "Row {row}: SKU '{value}' not found", sku),
+            (dates.isna(), "Row {row}: invalid date '{value}'", date_text),
+            (quantity.isna(), "Row {row}: quantity must be an integer", None),
+            (quantity < 0, "Row {row}: quantity must be ≥ 0", None),
+        ])
+        check.unknown = set(sku[unknown])
+        check.values = {
+            "sku": sku,
+            "date": dates.dt.date,
+            "quantity": quantity.astype("Int64").astype(object),
+        }
+        return check
+
+    def _check_suppliers(
+        self, df: pd.DataFrame, seen_names: Optional[set] = None
+    ) -> "_ChunkCheck":
+        """
+        With ``seen_names`` (validation), names repeated within the file are
+        errors; without it (import) they are left to the caller to skip.
+        """
+        name = _text(df, "name")
+        raw_lead_time = _column(df, "default_lead_time_days")
+        lead_time = _as_int(raw_lead_time)
+
+        duplicate = pd.Series(False, index=df.index)
+        if seen_names is not None:
+            duplicate = name.duplicated() | name.isin(seen_names)
+            seen_names.update(name)
+
+        given = raw_lead_time.notna().to_numpy()
+        check = _ChunkCheck.from_masks(df.index, [
+            ((name == "") | (name.str.len() > 128),
+             "Row {row}: name must be 1–128 characters", None),
+            (duplicate, "Row {row}: duplicate supplier name '{value}' within file", name),
+            (given & lead_time.isna().to_numpy(),
+             "Row {row}: default_lead_time_days must be an integer", None),
+            (given & (lead_time < 1).to_numpy(),
+             "Row {row}: default_lead_time_days must be ≥ 1", None),
+        ])
+        check.values = {
+            "name": name,
+            "lead_time": lead_time.fillna(7).clip(lower=1).astype(int),
+        }
+        return check
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def _write(
+        self,
+        writer: BulkWriter,
+        rows: pd.DataFrame,
+        key: str,
+        label: str,
+        errors: list[str],
+    ) -> Tuple[int, int]:
+        """Write one chunk in its own transaction; returns (saved, failed)."""
+        with self._db.get_session() as session:
+            saved, save_errors = writer.write(session, rows)
+        errors.extend(
+            f"{label} '{e['record'].get(key)}': {e['message']} — skipped" for e in save_errors
+        )
+        return saved, len(save_errors)
+
+    def _fetch_keys(self, column) -> set:
+        """All values of one column, fetched once per import."""
+        with self._db.get_session() as session:
+            return {r[0] for r in session.query(column).all()}
+
     @staticmethod
-    def _read_file(path: str) -> pd.DataFrame:
-        """Auto-detect CSV vs Excel by extension."""
-        p = Path(path)
-        suffix = p.suffix.lower()
-        if suffix in (".xlsx", ".xls"):
-            return pd.read_excel(p)
-        return pd.read_csv(p, encoding="utf-8")
+    def _missing_columns(df: pd.DataFrame, required: Sequence[str]) -> list[str]:
+        return [f"Required column '{col}' not found" for col in required if col not in df.columns]
 
     @staticmethod
-    def _safe_float(value, default: float) -> float:
-        try:
-            return float(value) if pd.notna(value) else default
-        except (ValueError, TypeError):
-            return default
+    def _iter_chunks(
+        path: str, chunksize: Optional[int] = None
+    ) -> Iterator[Tuple[pd.DataFrame, Optional[float]]]:
+        """
+        Stream the file in settings.IMPORT_CHUNK_SIZE chunks (CSV or Excel by extension).
+
+        Cells are read as text so that every chunk renders a column the same
+        way; per-chunk type inference would turn ``1001`` into ``1001.0`` in
+        chunks with a blank cell.  ``_as_float``/``_as_int`` parse numbers.
+        """
+        p = Path(path)
+        if p.suffix.lower() in (".xlsx", ".xls"):
+            return iter_file_chunks(p, chunksize, as_text=True)
+        return iter_file_chunks(p, chunksize, encoding="utf-8", dtype=str, keep_default_na=True)
 
     @staticmethod
-    def _safe_int(value, default: int) -> int:
-        try:
-            return int(value) if pd.notna(value) else default
-        except (ValueError, TypeError):
-            return default
+    def _report_progress(
+        callback: Optional[ProgressCallback],
+        imported: int,
+        skipped: int,
+        fraction: Optional[float],
+    ) -> None:
+        if callback:
+            callback(ImportProgress(imported + skipped, imported, skipped, fraction))
 
     @staticmethod
     def _get_actor() -> str:
         user = AuthService.get_current_user()
         return user.username if user else "system"
+
+
+# ---------------------------------------------------------------------------
+# Vectorized column helpers
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _ChunkCheck:
+    """Outcome of checking one chunk: invalid rows, messages and parsed values."""
+    invalid: np.ndarray
+    errors: list[str]
+    warnings: list[str] = field(default_factory=list)
+    values: dict = field(default_factory=dict)
+    unknown: set = field(default_factory=set)
+
+    @classmethod
+    def from_masks(cls, index: pd.Index, checks: list) -> "_ChunkCheck":
+        """
+        Build messages from (mask, template, values) checks.
+
+        Messages are ordered by row, then by check; ``{row}`` is the
+        1-based file line (header is line 1) and ``{value}`` the cell.
+        """
+        masks = [np.asarray(mask, dtype=bool) for mask, _, _ in checks]
+        rows = _row_numbers(index)
+        entries = []
+        for order, (mask, (_, template, values)) in enumerate(zip(masks, checks)):
+            for pos in np.flatnonzero(mask):
+                value = values.iat[pos] if values is not None else None
+                entries.append((pos, order, template.format(row=rows[pos], value=value)))
+        entries.sort(key=lambda e: (e[0], e[1]))
+
+        invalid = np.logical_or.reduce(masks) if masks else np.zeros(len(index), dtype=bool)
+        return cls(invalid=invalid, errors=[e[2] for e in entries])
+
+
+def _row_numbers(index: pd.Index) -> np.ndarray:
+    """File line numbers for a chunk index (1-based, header on line 1)."""
+    return np.asarray(index) + 2
+
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Column ``name``, or an all-missing column when absent."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(np.nan, index=df.index, dtype=object)
+
+
+def _text(df: pd.DataFrame, name: str) -> pd.Series:
+    """Column values as stripped strings; missing cells become ''."""
+    values = _column(df, name)
+    return values.astype(object).where(values.notna(), "").astype(str).str.strip()
+
+
+def _as_float(values: pd.Series) -> pd.Series:
+    """Parse numbers; unparsable or missing cells become NaN."""
+    if values.dtype.kind in "iuf":
+        return values.astype(float)
+    return pd.to_numeric(values.astype(object).where(values.notna()).astype(str).str.strip(),
+                         errors="coerce")
+
+
+def _as_int(values: pd.Series) -> pd.Series:
+    """
+    Parse numbers and truncate them the way ``int()`` would; failures become NaN.
+
+    ``"5.0"`` (as pandas writes a column with blanks) parses as 5.
+    """
+    numbers = _as_float(values)
+    return np.trunc(numbers.where(np.isfinite(numbers)))
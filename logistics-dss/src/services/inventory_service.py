@@ -18,13 +18,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from src.database.connection import get_db_manager
 from src.database.models import Product, Warehouse, InventoryLevel, SalesRecord
 from src.logger import LoggerMixin
+from src.services.report_context import ReportContext, context_memoized
 
 
 class InventoryService(LoggerMixin):
     """Provides inventory query and aggregation methods."""
 
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, context: Optional[ReportContext] = None):
         self.db_manager = db_manager or get_db_manager()
+        self.context = context
 
     def get_all_products(
         self,
@@ -97,6 +99,7 @@ class InventoryService(LoggerMixin):
                 for r in rows
             ]
 
+    @context_memoized
     def get_stock_summary(
         self,
         category: Optional[str] = None,
@@ -20,15 +20,19 @@ from src.database.connection import get_db_manager
 from src.services.inventory_service import InventoryService
 from src.services.sales_service import SalesService
 from src.logger import LoggerMixin
+from src.services.report_context import ReportContext
 
 
 class KPIService(LoggerMixin):
     """Compute all dashboard KPIs."""
 
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, context: Optional[ReportContext] = None):
         self.db_manager = db_manager or get_db_manager()
-        self.inventory_service = InventoryService(self.db_manager)
-        self.sales_service = SalesService(self.db_manager)
+        self.context = context
+        # Sub-services share the context so get_all_kpis() reads the
+        # stock summary and period revenue once per report.
+        self.inventory_service = InventoryService(self.db_manager, context)
+        self.sales_service = SalesService(self.db_manager, context)
 
     def get_stock_health_kpis(
         self,
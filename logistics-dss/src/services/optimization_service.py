@@ -21,6 +21,7 @@ from src.database.connection import get_db_manager
 from src.database.models import Product, InventoryLevel, SalesRecord
 from src.analytics.optimization import optimize, OptimizationResult
 from src.logger import LoggerMixin
+from src.services.report_context import ReportContext, context_memoized
 from config.constants import (
     CARRYING_COST_RATE,
     DEFAULT_ANALYTICS_DAYS,
@@ -35,8 +36,9 @@ from config.constants import (
 class OptimizationService(LoggerMixin):
     """Computes EOQ-based inventory optimization for all products."""
 
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, context: Optional[ReportContext] = None):
         self.db_manager = db_manager or get_db_manager()
+        self.context = context
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -45,6 +47,7 @@ class OptimizationService(LoggerMixin):
     def _lookback_date(self, days: int) -> date:
         return date.today() - timedelta(days=days)
 
+    @context_memoized
     def _get_product_demand_stats(
         self, days: int, category: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -130,6 +133,7 @@ class OptimizationService(LoggerMixin):
     # Public API
     # ------------------------------------------------------------------
 
+    @context_memoized
     def get_optimization_report(
         self,
         category: Optional[str] = None,
@@ -0,0 +1,66 @@
+"""
+Report Context
+Per-request memo shared by the analytical services while a report is assembled.
+
+A ReportContext lives for exactly one report build.  Services constructed
+with the same context return the memoized result of any method decorated
+with ``@context_memoized`` instead of re-running its queries, so the stock
+summary, demand snapshot and EOQ pipeline are each computed once per report.
+Services constructed without a context behave exactly as before.
+"""
+
+import functools
+import inspect
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class ReportContext:
+    """Memoizes intermediate analytics results for a single report build."""
+
+    def __init__(self):
+        self._memo: Dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it on first use."""
+        if key in self._memo:
+            self.hits += 1
+            return self._memo[key]
+        self.misses += 1
+        value = compute()
+        self._memo[key] = value
+        return value
+
+    def computed_keys(self) -> Tuple[Hashable, ...]:
+        """Keys computed so far, in computation order."""
+        return tuple(self._memo)
+
+    def __len__(self) -> int:
+        return len(self._memo)
+
+
+def context_memoized(method: Callable) -> Callable:
+    """
+    Memoize a service method in ``self.context`` when one is set.
+
+    The cache key is the method's qualified name plus its bound arguments
+    (defaults applied), so positional and keyword calls share an entry.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        context = getattr(self, "context", None)
+        if context is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (
+            method.__qualname__,
+            tuple(v for k, v in bound.arguments.items() if k != "self"),
+        )
+        return context.get_or_compute(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
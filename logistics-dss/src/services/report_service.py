@@ -23,6 +23,7 @@ from src.services.kpi_service import KPIService
 from src.services.analytics_service import AnalyticsService
 from src.services.forecast_service import ForecastService
 from src.services.optimization_service import OptimizationService
+from src.services.report_context import ReportContext
 from src.logger import LoggerMixin
 from config.constants import DEFAULT_ANALYTICS_DAYS
 
@@ -32,25 +33,28 @@ class ReportService(LoggerMixin):
     Aggregates data from all analytical services and exports reports.
 
     All sub-services share the same db_manager to avoid redundant connections.
+    Each executive report is assembled with a fresh ReportContext so that
+    intermediate results (stock summary, demand snapshot, EOQ report) are
+    computed once per report and shared across the KPI, ABC, forecast and
+    optimization services.
     """
 
     def __init__(self, db_manager=None):
         self.db_manager = db_manager or get_db_manager()
-        self._inventory = InventoryService(self.db_manager)
-        self._sales = SalesService(self.db_manager)
-        self._kpi = KPIService(self.db_manager)
-        self._analytics = AnalyticsService(self.db_manager)
-        self._forecast = ForecastService(self.db_manager)
-        self._optimization = OptimizationService(self.db_manager)
 
     # ------------------------------------------------------------------
     # Executive report assembly
     # ------------------------------------------------------------------
 
-    def get_executive_report(self, days: int = None) -> Dict[str, Any]:
+    def get_executive_report(
+        self, days: int = None, context: Optional[ReportContext] = None
+    ) -> Dict[str, Any]:
         """
         Build a consolidated executive report covering all modules.
 
+        ``context`` defaults to a fresh ReportContext; pass one explicitly
+        to inspect or reuse the memoized intermediate results.
+
         Returns a dict with sections:
             period_days         — analysis window
             generated_at        — ISO timestamp
@@ -66,44 +70,53 @@ class ReportService(LoggerMixin):
             stock_by_category   — stock value per category
         """
         days = days or DEFAULT_ANALYTICS_DAYS
+        context = context if context is not None else ReportContext()
 
         try:
+            # Sub-services are per-report so concurrent builds never share a context
+            inventory = InventoryService(self.db_manager, context)
+            sales = SalesService(self.db_manager, context)
+            kpi = KPIService(self.db_manager, context)
+            analytics = AnalyticsService(self.db_manager, context)
+            forecast = ForecastService(self.db_manager, context)
+            optimization = OptimizationService(self.db_manager, context)
+
             report: Dict[str, Any] = {
                 "period_days": days,
                 "generated_at": datetime.now().isoformat(timespec="seconds"),
             }
 
             # Financial & stock KPIs
-            kpis = self._kpi.get_all_kpis(days=days)
+            kpis = kpi.get_all_kpis(days=days)
             report["financial_summary"] = kpis.get("financial", {})
             report["stock_health"] = kpis.get("stock_health", {})
             report["service_level"] = kpis.get("service_level", {})
 
             # ABC class distribution
-            report["abc_summary"] = self._analytics.get_abc_summary(days=days)
+            report["abc_summary"] = analytics.get_abc_summary(days=days)
 
             # Top products by revenue
-            report["top_products"] = self._sales.get_top_products(n=10, days=days)
+            report["top_products"] = sales.get_top_products(n=10, days=days)
 
             # Daily sales trend
-            report["sales_trend"] = self._sales.get_daily_sales_summary(days=days)
+            report["sales_trend"] = sales.get_daily_sales_summary(days=days)
 
             # Reorder alerts (CRITICAL + WARNING only)
-            all_recos = self._forecast.get_reorder_recommendations(days=days)
+            all_recos = forecast.get_reorder_recommendations(days=days)
             report["reorder_alerts"] = [
                 r for r in all_recos
                 if r.get("urgency") in ("CRITICAL", "WARNING")
             ]
 
-            # Optimization summary + top savings SKUs
-            report["optimization_summary"] = self._optimization.get_optimization_summary(
+            # Optimization summary + top savings SKUs (one EOQ run, memoized)
+            report["optimization_summary"] = optimization.get_optimization_summary(
                 days=days
             )
-            opt_report = self._optimization.get_optimization_report(days=days)
+            opt_report = optimization.get_optimization_report(days=days)
             report["top_savings_skus"] = opt_report[:10]
 
             # Stock by category
-            report["stock_by_category"] = self._inventory.get_stock_by_category()
+            report["stock_by_category"] = inventory.get_stock_by_category()
 
             return report
 
@@ -19,13 +19,15 @@ from config.constants import DEFAULT_LOOKBACK_DAYS
 from src.database.connection import get_db_manager
 from src.database.models import Product, SalesRecord
 from src.logger import LoggerMixin
+from src.services.report_context import ReportContext, context_memoized
 
 
 class SalesService(LoggerMixin):
     """Provides sales query and aggregation methods."""
 
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, context: Optional[ReportContext] = None):
         self.db_manager = db_manager or get_db_manager()
+        self.context = context
 
     def _lookback_date(self, days: int = None) -> date:
         """Calculate the start date for a lookback period."""
@@ -160,6 +162,7 @@ class SalesService(LoggerMixin):
                 for r in rows
             ]
 
+    @context_memoized
     def get_total_revenue(
         self, days: int = None, category: Optional[str] = None
     ) -> float:
@@ -177,6 +180,7 @@ class SalesService(LoggerMixin):
 
             return float(query.scalar() or 0)
 
+    @context_memoized
     def get_total_quantity_sold(
         self, days: int = None, category: Optional[str] = None
     ) -> int:
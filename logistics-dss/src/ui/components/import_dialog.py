@@ -16,6 +16,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from config.constants import DataType
 from config.settings import SUPPORTED_EXTENSIONS
+from src.importer.base import ImportProgress
 from src.importer.csv_importer import CSVImporter
 from src.importer.excel_importer import ExcelImporter
 from src.ui.theme import (
@@ -139,6 +140,14 @@ class ImportDialog(ctk.CTkFrame, LoggerMixin):
         }
         return type_map[self._type_var.get()]
 
+    def _on_import_progress(self, progress: ImportProgress):
+        """Show rows processed so far while a chunked import runs."""
+        text = f"Importing... {progress.rows_processed:,} rows"
+        if progress.fraction is not None:
+            text += f" ({progress.fraction:.0%})"
+        self._result_label.configure(text=text)
+        self.update_idletasks()
+
     def _run_import(self):
         """Execute the import."""
         if not self._selected_file:
@@ -157,7 +166,9 @@ class ImportDialog(ctk.CTkFrame, LoggerMixin):
             else:
                 importer = ExcelImporter(data_type)
 
-            result = importer.import_file(self._selected_file)
+            result = importer.import_file(
+                self._selected_file, progress_callback=self._on_import_progress
+            )
 
             # Display result
             if result.success and result.failed_records == 0:
@@ -14,6 +14,7 @@ import customtkinter as ctk
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.importer.base import ImportProgress
 from src.services.import_wizard_service import ImportWizardService, ImportValidationError
 from src.services.auth_service import AuthService
 from src.ui.components.data_table import DataTable
@@ -303,12 +304,15 @@ class ImportWizardView(ctk.CTkFrame, LoggerMixin):
 
         try:
             overwrite = self._overwrite.get()
+            progress = self._on_import_progress
             if self._import_type == IMPORT_TYPE_PRODUCTS:
-                result = self._svc.import_products(self._file_path, overwrite_existing=overwrite)
+                result = self._svc.import_products(
+                    self._file_path, overwrite_existing=overwrite, progress_callback=progress
+                )
             elif self._import_type == IMPORT_TYPE_DEMAND:
-                result = self._svc.import_demand_history(self._file_path)
+                result = self._svc.import_demand_history(self._file_path, progress_callback=progress)
             else:
-                result = self._svc.import_suppliers(self._file_path)
+                result = self._svc.import_suppliers(self._file_path, progress_callback=progress)
 
             self._progress.set(1.0)
             imported = result.get("imported_count", 0)
@@ -325,6 +329,15 @@ class ImportWizardView(ctk.CTkFrame, LoggerMixin):
             self._progress.set(0)
             self._import_btn.configure(state="normal")
 
+    def _on_import_progress(self, progress: ImportProgress):
+        """Show per-chunk progress while a streaming import runs."""
+        if progress.fraction is not None:
+            self._progress.set(max(0.1, progress.fraction))
+        self._import_status.configure(
+            text=f"Importing… {progress.rows_processed:,} rows processed"
+        )
+        self.update_idletasks()
+
     def _reset_wizard(self):
         self._file_path = None
         self._import_type = None
@@ -4,6 +4,8 @@ Main validation class for imported data.
 """
 
 from typing import Dict, Any, List, Tuple
+
+import numpy as np
 import pandas as pd
 
 import sys
@@ -118,6 +120,11 @@ class DataValidator(LoggerMixin):
         """
         Validate an entire DataFrame.
 
+        Each field is checked column-wise with ``rule.validate_series``;
+        as in ``validate_row`` only the first failing rule per field and row
+        is reported.  Errors are returned in row order, and validation stops
+        after the row on which ``max_errors`` is reached.
+
         Args:
             df: Pandas DataFrame to validate
             max_errors: Maximum errors to collect before stopping
@@ -126,26 +133,59 @@ class DataValidator(LoggerMixin):
             Tuple of (all_valid, list of errors, valid_rows_df)
         """
         max_errors = max_errors or MAX_VALIDATION_ERRORS
-        all_errors = []
-        valid_indices = []
-
-        for idx, row in df.iterrows():
-            is_valid, row_errors = self.validate_row(row.to_dict(), idx)
+        n_rows = len(df)
 
-            if is_valid:
-                valid_indices.append(idx)
+        # field -> (cell values, invalid mask, messages)
+        field_results = []
+        for field, field_rules in self.rules.items():
+            if field in df.columns:
+                values = df[field]
             else:
-                all_errors.extend(row_errors)
+                values = pd.Series([None] * n_rows, index=df.index, dtype=object)
+
+            invalid = np.zeros(n_rows, dtype=bool)
+            messages = np.full(n_rows, None, dtype=object)
+            for rule in field_rules:
+                pending = np.flatnonzero(~invalid)
+                if len(pending) == 0:
+                    break
+                valid_mask, rule_messages = rule.validate_series(values.iloc[pending])
+                failed = ~valid_mask.to_numpy()
+                invalid[pending[failed]] = True
+                messages[pending[failed]] = rule_messages.to_numpy()[failed]
+
+            cells = values.to_numpy(dtype=object)
+            field_results.append((field, cells, invalid, messages))
+
+        errors_per_row = np.zeros(n_rows, dtype=int)
+        for _, _, invalid, _ in field_results:
+            errors_per_row += invalid
+
+        # Early exit: keep rows up to the one where max_errors is reached
+        processed = n_rows
+        reached = np.flatnonzero(np.cumsum(errors_per_row) >= max_errors)
+        if len(reached):
+            processed = reached[0] + 1
+            self.logger.warning(f"Stopped validation after {max_errors} errors")
 
-            if len(all_errors) >= max_errors:
-                self.logger.warning(f"Stopped validation after {max_errors} errors")
-                break
+        all_errors = []
+        for pos in np.flatnonzero(errors_per_row[:processed]):
+            idx = df.index[pos]
+            for field, cells, invalid, messages in field_results:
+                if invalid[pos]:
+                    all_errors.append({
+                        "row": idx,
+                        "field": field,
+                        "value": cells[pos],
+                        "message": f"Row {idx}: {messages[pos]}"
+                    })
 
-        valid_df = df.loc[valid_indices] if valid_indices else pd.DataFrame()
+        valid_positions = np.flatnonzero(errors_per_row[:processed] == 0)
+        valid_df = df.iloc[valid_positions] if len(valid_positions) else pd.DataFrame()
 
         self.logger.info(
-            f"Validation complete: {len(df)} rows, "
-            f"{len(valid_indices)} valid, {len(all_errors)} errors"
+            f"Validation complete: {n_rows} rows, "
+            f"{len(valid_positions)} valid, {len(all_errors)} errors"
         )
 
         return len(all_errors) == 0, all_errors, valid_df
@@ -1,6 +1,13 @@
 """
 Validation Rules
 Defines validation rules for different data types.
+
+Every rule validates a single value with ``validate()`` and a whole column
+with ``validate_series()``.  Built-in rules override ``_vectorized_valid()``
+to accept clean cells with pandas string/numeric/datetime operations; only
+the cells it cannot vouch for (missing or suspicious values) go through the
+scalar ``validate()``, so both forms always agree.  Custom rules that do not
+override it fall back to ``validate()`` for every cell.
 """
 
 from typing import Any, Tuple, Optional
@@ -8,6 +15,9 @@ from decimal import Decimal, InvalidOperation
 from datetime import datetime, date
 import re
 
+import numpy as np
+import pandas as pd
+
 import sys
 from pathlib import Path
 
@@ -44,6 +54,78 @@ class ValidationRule:
         """
         raise NotImplementedError("Subclasses must implement validate()")
 
+    def validate_series(self, values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Validate a whole column at once.
+
+        Args:
+            values: Column values to validate
+
+        Returns:
+            Tuple of (valid_mask, messages) aligned with ``values``; messages
+            hold the error text for invalid cells and None elsewhere.
+        """
+        cells = values.to_numpy(dtype=object)
+        valid = np.ones(len(cells), dtype=bool)
+        messages = np.full(len(cells), None, dtype=object)
+
+        present = values.notna().to_numpy()
+        known_valid = np.zeros(len(cells), dtype=bool)
+        if present.any():
+            fast = self._vectorized_valid(values[present])
+            if fast is not None:
+                known_valid[present] = np.asarray(fast, dtype=bool)
+
+        # Scalar fallback for missing values, custom rules and failing cells
+        for pos in np.flatnonzero(~known_valid):
+            is_valid, error_msg = self.validate(cells[pos])
+            if not is_valid:
+                valid[pos] = False
+                messages[pos] = error_msg
+
+        return (
+            pd.Series(valid, index=values.index),
+            pd.Series(messages, index=values.index, dtype=object),
+        )
+
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        """
+        Return a mask of non-missing cells that are certainly valid.
+
+        A False entry only means "check with validate()"; it must never
+        mark a value valid that ``validate()`` would reject.  Returns None
+        when the rule has no vectorized form.
+        """
+        return None
+
+
+def _text(values: pd.Series) -> pd.Series:
+    """String cells stripped of whitespace; NaN for non-string cells."""
+    try:
+        return values.str.strip()
+    except AttributeError:   # no string cells at all
+        return pd.Series(np.nan, index=values.index, dtype=object)
+
+
+def _numeric(values: pd.Series) -> pd.Series:
+    """
+    Parse a column as numbers; unparsable cells become NaN.
+
+    Only numeric dtypes and string cells are parsed, so booleans and other
+    objects are left to the scalar check.
+    """
+    if values.dtype.kind in "iuf":
+        return values
+    return pd.to_numeric(_text(values), errors="coerce")
+
+
+def _fullmatch(text: pd.Series, pattern: str) -> np.ndarray:
+    """Boolean mask of string cells that fully match ``pattern``."""
+    try:
+        return text.str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool)
+    except AttributeError:   # no string cells at all
+        return np.zeros(len(text), dtype=bool)
+
 
 class RequiredRule(ValidationRule):
     """Value must not be null/empty."""
@@ -58,6 +140,9 @@ class RequiredRule(ValidationRule):
 
         return True, None
 
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        return (_text(values) != "").to_numpy()
+
 
 class StringLengthRule(ValidationRule):
     """String must not exceed max length."""
@@ -83,6 +168,9 @@ class StringLengthRule(ValidationRule):
 
         return True, None
 
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        return (values.astype(str).str.len() <= self.max_length).to_numpy()
+
 
 class NumericRangeRule(ValidationRule):
     """Numeric value must be within range."""
@@ -119,6 +207,15 @@ class NumericRangeRule(ValidationRule):
 
         return True, None
 
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        numbers = _numeric(values)
+        ok = numbers.notna()
+        if self.min_val is not None:
+            ok &= numbers >= self.min_val
+        if self.max_val is not None:
+            ok &= numbers <= self.max_val
+        return ok.to_numpy()
+
 
 class DecimalRule(ValidationRule):
     """Value must be a valid decimal number."""
@@ -134,6 +231,9 @@ class DecimalRule(ValidationRule):
         except (InvalidOperation, ValueError):
             return False, f"{self.field_name} must be a valid decimal number"
 
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        return _numeric(values).notna().to_numpy()
+
 
 class IntegerRule(ValidationRule):
     """Value must be a valid integer."""
@@ -152,6 +252,11 @@ class IntegerRule(ValidationRule):
         except (ValueError, TypeError):
             return False, f"{self.field_name} must be a valid integer"
 
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        numbers = _numeric(values).astype(float).to_numpy()
+        with np.errstate(invalid="ignore"):
+            return np.isfinite(numbers) & (numbers == np.trunc(numbers))
+
 
 class DateRule(ValidationRule):
     """Value must be a valid date."""
@@ -185,6 +290,23 @@ class DateRule(ValidationRule):
 
         return False, f"{self.field_name} must be a valid date (YYYY-MM-DD)"
 
+    # Only strings shaped like one of DATE_FORMATS take the pandas path
+    _DATE_SHAPE = r"\d{1,4}[-/]\d{1,2}[-/]\d{1,4}"
+
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        text = _text(values)
+        ok = np.zeros(len(values), dtype=bool)
+        candidates = _fullmatch(text, self._DATE_SHAPE)
+
+        for fmt in self.DATE_FORMATS:
+            pending = candidates & ~ok
+            if not pending.any():
+                break
+            parsed = pd.to_datetime(text[pending], format=fmt, errors="coerce")
+            ok[pending] = parsed.notna().to_numpy()
+
+        return ok
+
 
 class DateTimeRule(ValidationRule):
     """Value must be a valid datetime."""
@@ -225,6 +347,18 @@ class DateTimeRule(ValidationRule):
 
         return False, f"{self.field_name} must be a valid datetime"
 
+    # ISO shapes accepted by both pandas and datetime.fromisoformat
+    _ISO_SHAPE = r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?"
+
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        text = _text(values)
+        candidates = _fullmatch(text, self._ISO_SHAPE)
+        ok = np.zeros(len(values), dtype=bool)
+        if candidates.any():
+            parsed = pd.to_datetime(text[candidates], format="ISO8601", errors="coerce")
+            ok[candidates] = parsed.notna().to_numpy()
+        return ok
+
 
 class PatternRule(ValidationRule):
     """Value must match a regex pattern."""
@@ -251,6 +385,10 @@ class PatternRule(ValidationRule):
 
         return True, None
 
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        matched = values.astype(str).str.match(self.pattern)
+        return matched.fillna(False).to_numpy(dtype=bool)
+
 
 class UniqueRule(ValidationRule):
     """Value must be unique (checked against provided set)."""
@@ -276,6 +414,9 @@ class UniqueRule(ValidationRule):
 
         return True, None
 
+    def _vectorized_valid(self, values: pd.Series) -> Optional[np.ndarray]:
+        return (~values.isin(self.existing_values)).to_numpy()
+
     def add_value(self, value: Any):
         """Add a value to the existing values set."""
         self.existing_values.add(value)
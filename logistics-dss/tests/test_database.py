@@ -237,3 +237,67 @@ class TestDatabaseManager:
         with clean_database.get_session() as session:
             found = session.query(Product).filter_by(id="SKU888").first()
             assert found is None
+
+    def test_create_tables_adds_missing_nullable_columns(self, clean_database):
+        """Tables created by an older schema gain newer optional columns."""
+        from sqlalchemy import inspect, text
+
+        engine = clean_database.get_engine()
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE import_logs DROP COLUMN dialect"))
+        assert "dialect" not in {c["name"] for c in inspect(engine).get_columns("import_logs")}
+
+        clean_database.create_tables()
+
+        assert "dialect" in {c["name"] for c in inspect(engine).get_columns("import_logs")}
+
+
+
+class TestSQLiteProfile:
+    """Tests for the SQLite performance profile."""
+
+    def test_profile_is_active(self, clean_database):
+        """Every configured PRAGMA is applied and reported as active."""
+        report = clean_database.check_sqlite_profile()
+
+        assert all(entry["ok"] for entry in report.values()), report
+        assert report["journal_mode"]["active"].lower() == "wal"
+        assert report["foreign_keys"]["active"] == 1
+
+    def test_profile_applies_to_every_connection(self, clean_database):
+        """Pooled and fresh connections share the same settings."""
+        engine = clean_database.get_engine()
+        with engine.connect() as first, engine.connect() as second:
+            for conn in (first, second):
+                assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+                assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+
+    def test_mismatch_is_reported(self, clean_database, monkeypatch):
+        """A setting that differs from the live connection is flagged."""
+        import config.settings
+
+        monkeypatch.setattr(config.settings, "SQLITE_SYNCHRONOUS", "FULL")
+        report = clean_database.check_sqlite_profile()
+
+        assert report["synchronous"]["ok"] is False
+        assert report["journal_mode"]["ok"] is True
+
+    def test_readers_not_blocked_by_open_write(self, clean_database):
+        """Under WAL a reader sees committed data while a write is pending."""
+        engine = clean_database.get_engine()
+        with clean_database.get_session() as session:
+            session.add(Product(
+                id="SKU-WAL", name="WAL", category="Test",
+                unit_cost=Decimal("1.00"), unit_price=Decimal("2.00"),
+            ))
+
+        with engine.connect() as writer, engine.connect() as reader:
+            writer.exec_driver_sql("BEGIN IMMEDIATE")
+            writer.exec_driver_sql("UPDATE products SET name = 'pending' WHERE id = 'SKU-WAL'")
+
+            name = reader.exec_driver_sql(
+                "SELECT name FROM products WHERE id = 'SKU-WAL'"
+            ).scalar()
+            writer.exec_driver_sql("ROLLBACK")
+
+        assert name == "WAL"
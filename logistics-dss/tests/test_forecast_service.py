@@ -211,6 +211,38 @@ class TestGetReorderRecommendations:
         result = svc.get_reorder_recommendations(days=30)
         assert result == []
 
+    def test_does_not_query_per_product(self, clean_database, monkeypatch):
+        _seed_products(clean_database)
+        svc = ForecastService(db_manager=clean_database)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("per-product demand query used")
+
+        monkeypatch.setattr(svc, "_get_daily_demand_rows", _fail)
+        result = svc.get_reorder_recommendations(days=30)
+        assert {r["product_id"] for r in result} == {"SKU-1", "SKU-2"}
+
+
+# ---------------------------------------------------------------------------
+# _get_daily_demand_rows_by_product
+# ---------------------------------------------------------------------------
+
+class TestDailyDemandRowsByProduct:
+
+    def test_matches_per_product_query(self, clean_database):
+        _seed_products(clean_database)
+        svc = ForecastService(db_manager=clean_database)
+        grouped = svc._get_daily_demand_rows_by_product(30)
+        assert set(grouped) == {"SKU-1", "SKU-2"}
+        for pid, rows in grouped.items():
+            assert rows == svc._get_daily_demand_rows(pid, 30)
+
+    def test_category_filter(self, clean_database):
+        _seed_products(clean_database)
+        svc = ForecastService(db_manager=clean_database)
+        grouped = svc._get_daily_demand_rows_by_product(30, category="Cat2")
+        assert set(grouped) == {"SKU-2"}
+
 
 # ---------------------------------------------------------------------------
 # get_categories / get_products
@@ -15,10 +15,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.analytics.forecasting import (
     build_series,
+    build_series_batch,
     simple_moving_average,
     weighted_moving_average,
     linear_trend_forecast,
     forecast,
+    forecast_batch,
+    forecast_matrix,
+    _walk_forward_mae,
+    _predict_next,
     DemandSeries,
     ForecastResult,
 )
@@ -119,6 +124,41 @@ class TestBuildSeries:
         assert s.category == "Gadgets"
 
 
+class TestBuildSeriesBatch:
+
+    PRODUCTS = [
+        {"product_id": "P1", "product_name": "One", "category": "A"},
+        {"product_id": "P2", "product_name": "Two", "category": "B"},
+    ]
+
+    def test_matches_build_series(self):
+        start = date(2024, 1, 1)
+        end = date(2024, 1, 5)
+        rows = {
+            "P1": [{"date": "2024-01-02", "total_quantity": 4}],
+            "P2": [{"date": "2024-01-01", "total_quantity": 1},
+                   {"date": "2024-01-05", "total_quantity": 7}],
+        }
+        batch = build_series_batch(self.PRODUCTS, rows, start, end)
+        for p, s in zip(self.PRODUCTS, batch):
+            single = build_series(
+                p["product_id"], p["product_name"], p["category"],
+                rows[p["product_id"]], start, end,
+            )
+            assert s == single
+
+    def test_product_without_rows_all_zeros(self):
+        start = date(2024, 1, 1)
+        end = date(2024, 1, 3)
+        batch = build_series_batch(self.PRODUCTS, {}, start, end)
+        assert [s.quantities for s in batch] == [[0, 0, 0], [0, 0, 0]]
+
+    def test_preserves_product_order(self):
+        start = date(2024, 1, 1)
+        batch = build_series_batch(list(reversed(self.PRODUCTS)), {}, start, start)
+        assert [s.product_id for s in batch] == ["P2", "P1"]
+
+
 # ---------------------------------------------------------------------------
 # simple_moving_average
 # ---------------------------------------------------------------------------
@@ -219,6 +259,56 @@ class TestLinearTrend:
         assert all(v == pytest.approx(7.0, abs=0.01) for v in result)
 
 
+# ---------------------------------------------------------------------------
+# _walk_forward_mae — incremental models
+# ---------------------------------------------------------------------------
+
+def _refit_mae(quantities, method, window):
+    """Reference walk-forward MAE that refits the model at every step."""
+    if len(quantities) < window + 1:
+        return 0.0
+    eval_start = max(window, len(quantities) // 2)
+    errors = [
+        abs(_predict_next(quantities[:t], method, window) - quantities[t])
+        for t in range(eval_start, len(quantities))
+    ]
+    return sum(errors) / len(errors)
+
+
+class TestWalkForwardMAE:
+
+    SERIES = [
+        [],
+        [4],
+        [4, 9],
+        [3, 0, 7, 2, 9, 1, 0, 12, 5, 5],
+        [(i * 37) % 23 for i in range(60)],
+        list(range(1, 41)),
+        [40 - i for i in range(40)],
+    ]
+
+    @pytest.mark.parametrize("method", ["SMA", "WMA"])
+    @pytest.mark.parametrize("window", [1, 3, 7])
+    def test_moving_averages_match_refit(self, method, window):
+        for q in self.SERIES:
+            assert _walk_forward_mae(q, method, window) == pytest.approx(
+                _refit_mae(q, method, window), rel=1e-12
+            )
+
+    @pytest.mark.parametrize("window", [1, 3, 7])
+    def test_linear_matches_refit(self, window):
+        for q in self.SERIES:
+            assert _walk_forward_mae(q, "LINEAR", window) == pytest.approx(
+                _refit_mae(q, "LINEAR", window), rel=1e-9
+            )
+
+    def test_too_short_returns_zero(self):
+        assert _walk_forward_mae([1, 2, 3], "SMA", window=3) == 0.0
+
+    def test_perfect_trend_has_zero_linear_error(self):
+        assert _walk_forward_mae(list(range(1, 31)), "LINEAR", 7) == pytest.approx(0.0, abs=1e-9)
+
+
 # ---------------------------------------------------------------------------
 # forecast() — integration of the full pipeline
 # ---------------------------------------------------------------------------
@@ -275,3 +365,85 @@ class TestForecast:
     def test_historical_avg_matches_series(self, flat_series):
         result = forecast(flat_series, method="SMA", horizon_days=7)
         assert result.historical_daily_avg == pytest.approx(10.0)
+
+
+# ---------------------------------------------------------------------------
+# forecast_matrix / forecast_batch — vectorized engine
+# ---------------------------------------------------------------------------
+
+def _random_series(n_products, n_days, seed):
+    import random
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(n_days)]
+    return [
+        DemandSeries(
+            product_id=f"P{p}", product_name=f"Product {p}", category="C",
+            dates=list(dates),
+            quantities=[rng.choice([0, 0, 1, 5, rng.randint(0, 200)])
+                        for _ in range(n_days)],
+        )
+        for p in range(n_products)
+    ]
+
+
+def _assert_results_match(expected, actual):
+    assert actual.product_id == expected.product_id
+    assert actual.method == expected.method
+    assert actual.horizon_days == expected.horizon_days
+    assert actual.forecast_dates == expected.forecast_dates
+    # Vectorized arithmetic may differ in the last ulp, which can flip a
+    # rounding tie at the second decimal.
+    for name in ("historical_daily_avg", "forecast_daily", "std_dev", "mae"):
+        assert getattr(actual, name) == pytest.approx(getattr(expected, name), abs=0.011)
+    assert abs(actual.forecast_total - expected.forecast_total) <= 1
+    assert actual.forecast_values == pytest.approx(expected.forecast_values, abs=0.011)
+
+
+class TestForecastBatch:
+
+    @pytest.mark.parametrize("method", ["SMA", "WMA", "LINEAR"])
+    @pytest.mark.parametrize("n_days", [0, 1, 2, 5, 30, 90])
+    def test_matches_scalar_forecast(self, method, n_days):
+        series = _random_series(6, n_days, seed=n_days)
+        batch = forecast_batch(series, method=method, horizon_days=7, window=7)
+        for sr, actual in zip(series, batch):
+            expected = forecast(sr, method=method, horizon_days=7, window=7)
+            _assert_results_match(expected, actual)
+
+    def test_mixed_lengths_keep_input_order(self, flat_series, zero_series, trending_series):
+        series = [flat_series, zero_series, trending_series]
+        batch = forecast_batch(series, method="SMA", horizon_days=5, window=3)
+        assert [r.product_id for r in batch] == ["P1", "P3", "P2"]
+        for sr, actual in zip(series, batch):
+            _assert_results_match(forecast(sr, method="SMA", horizon_days=5, window=3), actual)
+
+    def test_method_stored_uppercase(self, flat_series):
+        batch = forecast_batch([flat_series], method="wma", horizon_days=3)
+        assert batch[0].method == "WMA"
+
+    def test_empty_list(self):
+        assert forecast_batch([], method="SMA") == []
+
+
+class TestForecastMatrix:
+
+    def test_output_shapes(self):
+        result = forecast_matrix([[1, 2, 3, 4], [0, 0, 0, 0], [5, 5, 5, 5]],
+                                 method="LINEAR", horizon_days=6)
+        assert result.forecast_values.shape == (3, 6)
+        for arr in (result.forecast_daily, result.historical_avg,
+                    result.std_dev, result.mae):
+            assert arr.shape == (3,)
+
+    def test_perfect_trend(self):
+        result = forecast_matrix([[1, 2, 3, 4, 5]], method="LINEAR", horizon_days=3)
+        assert list(result.forecast_values[0]) == pytest.approx([6.0, 7.0, 8.0])
+
+    def test_linear_clipped_at_zero(self):
+        result = forecast_matrix([[10, 8, 6, 4, 2]], method="LINEAR", horizon_days=20)
+        assert (result.forecast_values >= 0).all()
+
+    def test_rejects_1d_input(self):
+        with pytest.raises(ValueError):
+            forecast_matrix([1, 2, 3])
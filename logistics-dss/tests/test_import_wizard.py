@@ -163,3 +163,125 @@ class TestImportWizard:
         detail = json.loads(latest.detail)
         assert detail["import_type"] == IMPORT_TYPE_PRODUCTS
         assert detail["imported"] == result["imported_count"]
+
+    def test_import_demand_streams_in_chunks(self, svc, tmp_path, clean_database, monkeypatch):
+        """Demand file read in 2-row chunks → every chunk committed, progress reported."""
+        import config.settings
+        monkeypatch.setattr(config.settings, "IMPORT_CHUNK_SIZE", 2)
+        _seed_product(clean_database, "SKU001")
+        with clean_database.get_session() as session:
+            session.add(Warehouse(id="WH-DEFAULT", name="Default", location="-", capacity=1000))
+
+        rows = [{"sku": "SKU001", "date": f"2026-01-0{d}", "quantity": d} for d in range(1, 6)]
+        rows.append({"sku": "SKU999", "date": "2026-01-06", "quantity": 1})
+        path = _make_demand_csv(tmp_path, rows)
+
+        progress = []
+        result = svc.import_demand_history(path, progress_callback=progress.append)
+        assert result["imported_count"] == 5
+        assert result["skipped_count"] == 1
+        assert "Row 7" in result["errors"][0]
+        assert [p.rows_processed for p in progress] == [2, 4, 6]
+
+        from src.database.models import SalesRecord
+        with clean_database.get_session() as session:
+            assert session.query(SalesRecord).count() == 5
+
+    def test_numeric_skus_match_across_chunks(self, svc, tmp_path, clean_database, monkeypatch):
+        """A numeric SKU reads the same in a chunk that also has a blank SKU."""
+        import config.settings
+        monkeypatch.setattr(config.settings, "IMPORT_CHUNK_SIZE", 2)
+        _seed_product(clean_database, "1001")
+        with clean_database.get_session() as session:
+            session.add(Warehouse(id="WH-DEFAULT", name="Default", location="-", capacity=1000))
+
+        path = tmp_path / "demand.csv"
+        path.write_text(
+            "sku,date,quantity\n"
+            "1001,2026-01-01,1\n1001,2026-01-02,2\n"
+            "1001,2026-01-03,3\n,2026-01-04,4\n"
+        )
+        result = svc.import_demand_history(str(path))
+        assert result["imported_count"] == 3
+        assert result["skipped_count"] == 1
+
+    def test_import_products_skips_invalid_and_repeated_rows(self, svc, tmp_path, clean_database):
+        """Rows failing validation and repeated SKUs are skipped in the same pass."""
+        rows = [
+            {"sku": "SKU001", "name": "One", "unit_cost": 1.0},
+            {"sku": "SKU002", "name": "Two", "unit_cost": -5.0},
+            {"sku": "SKU001", "name": "One again", "unit_cost": 2.0},
+            {"sku": "SKU003", "name": "", "unit_cost": 3.0},
+        ]
+        path = _make_product_csv(tmp_path, rows)
+        result = svc.import_products(path)
+        assert result["imported_count"] == 1
+        assert result["skipped_count"] == 3
+        assert result["errors"] == [
+            "Row 3: unit_cost must be ≥ 0 — skipped",
+            "Row 5: name must be 1–128 characters — skipped",
+        ]
+
+        with clean_database.get_session() as session:
+            assert session.get(Product, "SKU001").name == "One"
+
+    def test_import_products_defaults_price_to_cost(self, svc, tmp_path, clean_database):
+        path = _make_product_csv(tmp_path, [{"sku": "SKU001", "name": "One", "unit_cost": 4.5}])
+        svc.import_products(path)
+        with clean_database.get_session() as session:
+            product = session.get(Product, "SKU001")
+            assert float(product.unit_price) == 4.5
+            assert product.category == ""
+
+    def test_import_demand_requires_default_warehouse(self, svc, tmp_path, clean_database):
+        _seed_product(clean_database, "SKU001")
+        path = _make_demand_csv(tmp_path, [{"sku": "SKU001", "date": "2026-01-01", "quantity": 1}])
+        with pytest.raises(ImportValidationError):
+            svc.import_demand_history(path)
+
+    def test_validate_demand_checks_dates_and_quantities(self, svc, tmp_path, clean_database):
+        _seed_product(clean_database, "SKU001")
+        rows = [
+            {"sku": "SKU001", "date": "2026-01-01", "quantity": "3"},
+            {"sku": "SKU001", "date": "01/02/2026", "quantity": "x"},
+            {"sku": "SKU001", "date": "2026-01-03", "quantity": "-1"},
+        ]
+        result = svc.validate_demand_file(_make_demand_csv(tmp_path, rows))
+        assert result["row_count"] == 3
+        assert result["errors"] == [
+            "Row 3: invalid date '01/02/2026'",
+            "Row 3: quantity must be an integer",
+            "Row 4: quantity must be ≥ 0",
+        ]
+
+    def test_import_suppliers_skips_existing_and_repeated_names(self, svc, tmp_path, clean_database):
+        from src.database.models import Supplier
+
+        first = tmp_path / "suppliers.csv"
+        pd.DataFrame([
+            {"name": "Acme", "default_lead_time_days": 5},
+            {"name": "ACME", "default_lead_time_days": 6},
+            {"name": "Globex", "default_lead_time_days": None},
+        ]).to_csv(first, index=False)
+        result = svc.import_suppliers(str(first))
+        assert (result["imported_count"], result["skipped_count"]) == (2, 1)
+
+        result = svc.import_suppliers(str(first))
+        assert (result["imported_count"], result["skipped_count"]) == (0, 3)
+
+        with clean_database.get_session() as session:
+            lead_times = {s.name: s.lead_time_days for s in session.query(Supplier).all()}
+        assert lead_times == {"Acme": 5, "Globex": 7}
+
+    def test_validate_supplier_file_flags_duplicates(self, svc, tmp_path):
+        path = tmp_path / "suppliers.csv"
+        pd.DataFrame([
+            {"name": "Acme", "default_lead_time_days": 5},
+            {"name": "Acme", "default_lead_time_days": 0},
+        ]).to_csv(path, index=False)
+        result = svc.validate_supplier_file(str(path))
+        assert result["errors"] == [
+            "Row 3: duplicate supplier name 'Acme' within file",
+            "Row 3: default_lead_time_days must be ≥ 1",
+        ]
+
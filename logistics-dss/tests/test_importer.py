@@ -207,3 +207,283 @@ class TestImporterIntegration:
 
         # Some records should fail validation
         assert result.failed_records > 0
+
+
+class TestBulkWriter:
+    """Tests for vectorized conversion and batched upserts."""
+
+    def test_convert_dataframe_matches_record_conversion(self):
+        """Column-wise conversion gives the same values as per-record conversion."""
+        from src.importer.bulk_writer import convert_dataframe
+
+        df = pd.DataFrame({
+            "id": [" SKU1 ", "SKU2", "SKU3"],
+            "unit_cost": ["19.99", " 0.10 ", None],
+            "quantity": ["10", "7.9", "abc"],
+            "date": ["2024-01-15", "15/01/2024", "not a date"],
+            "last_updated": ["2024-01-15T10:00:00", "2024-01-15 11:30:00", None],
+        })
+        importer = CSVImporter(DataType.INVENTORY)
+        expected = [importer._convert_record_types(r) for r in df.to_dict("records")]
+        actual = convert_dataframe(df).to_dict("records")
+        assert actual == expected
+
+    def test_convert_dataframe_decimals_and_missing(self):
+        from src.importer.bulk_writer import convert_dataframe
+
+        from decimal import Decimal
+
+        df = pd.DataFrame({"unit_cost": ["10.50", None, "bad", "0.10", "inf"]})
+        values = convert_dataframe(df)["unit_cost"].tolist()
+        assert values == [Decimal("10.50"), None, None, Decimal("0.10"), None]
+        assert all(isinstance(v, Decimal) for v in values if v is not None)
+
+    def test_upsert_updates_existing_products(self, clean_database):
+        from decimal import Decimal
+        from src.database.models import Product
+        from src.importer.bulk_writer import BulkWriter, convert_dataframe
+
+        writer = BulkWriter(Product, batch_size=2)
+        first = pd.DataFrame({
+            "id": ["P1", "P2", "P3"], "name": ["A", "B", "C"],
+            "category": ["X", "X", "Y"],
+            "unit_cost": ["1", "2", "3"], "unit_price": ["2", "4", "6"],
+        })
+        second = first.assign(name=["A2", "B2", "C2"], unit_cost=["9", "9", "9"])
+
+        with clean_database.get_session() as session:
+            assert writer.write(session, convert_dataframe(first)) == (3, [])
+        with clean_database.get_session() as session:
+            assert writer.write(session, convert_dataframe(second)) == (3, [])
+
+        with clean_database.get_session() as session:
+            rows = session.query(Product).order_by(Product.id).all()
+            assert [p.name for p in rows] == ["A2", "B2", "C2"]
+            assert all(p.unit_cost == Decimal("9") for p in rows)
+
+    def test_inventory_upserts_on_product_and_warehouse(self, clean_database):
+        from decimal import Decimal
+        from src.database.models import Product, Warehouse, InventoryLevel
+        from src.importer.bulk_writer import BulkWriter, convert_dataframe
+
+        with clean_database.get_session() as session:
+            session.add(Product(id="P1", name="A", category="X",
+                                unit_cost=Decimal("1"), unit_price=Decimal("2")))
+            session.add(Warehouse(id="W1", name="Main", location="City", capacity=10))
+
+        writer = BulkWriter(InventoryLevel)
+        for qty in ("5", "8"):
+            df = pd.DataFrame({"product_id": ["P1"], "warehouse_id": ["W1"],
+                               "quantity": [qty], "last_updated": ["2024-01-15T10:00:00"]})
+            with clean_database.get_session() as session:
+                assert writer.write(session, convert_dataframe(df)) == (1, [])
+
+        with clean_database.get_session() as session:
+            rows = session.query(InventoryLevel).all()
+            assert [(r.product_id, r.quantity) for r in rows] == [("P1", 8)]
+
+    def test_failed_rows_reported_without_losing_batch(self, clean_database):
+        from src.database.models import Product
+        from src.importer.bulk_writer import BulkWriter, convert_dataframe
+
+        df = pd.DataFrame({
+            "id": ["P1", "P2", "P3"], "name": ["A", "B", "C"],
+            "category": ["X", "X", "X"],
+            "unit_cost": ["1", "-5", "3"],    # P2 violates check_unit_cost_positive
+            "unit_price": ["2", "4", "6"],
+        })
+        with clean_database.get_session() as session:
+            saved, errors = BulkWriter(Product, batch_size=10).write(
+                session, convert_dataframe(df)
+            )
+
+        assert saved == 2
+        assert len(errors) == 1
+        assert errors[0]["type"] == "record_save_error"
+        assert errors[0]["record"]["id"] == "P2"
+        with clean_database.get_session() as session:
+            assert {p.id for p in session.query(Product).all()} == {"P1", "P3"}
+
+
+class TestStreamingImport:
+    """Tests for chunked (streaming) imports."""
+
+    def test_streaming_import_matches_whole_file(self, sample_csv_file, clean_database):
+        """Chunked import commits every row and reports progress per chunk."""
+        from src.database.models import ImportLog, Product
+
+        progress = []
+        importer = CSVImporter(DataType.PRODUCTS)
+        result = importer.import_file(
+            sample_csv_file, progress_callback=progress.append, chunk_size=2
+        )
+
+        assert result.success is True
+        assert (result.total_records, result.imported_records, result.failed_records) == (3, 3, 0)
+        assert [p.rows_processed for p in progress] == [2, 3]
+        assert progress[-1].fraction == 1.0
+
+        with clean_database.get_session() as session:
+            assert session.query(Product).count() == 3
+            logs = session.query(ImportLog).all()
+            assert len(logs) == 1
+            assert logs[0].records_total == 3
+            assert logs[0].filename == "products.csv"
+
+    def test_streaming_import_counts_invalid_rows(self, csv_with_invalid_data, clean_database):
+        importer = CSVImporter(DataType.PRODUCTS)
+        whole = importer.import_file(csv_with_invalid_data)
+        streamed = CSVImporter(DataType.PRODUCTS).import_file(csv_with_invalid_data, chunk_size=1)
+        assert streamed.failed_records == whole.failed_records
+        assert len(streamed.errors) == len(whole.errors)
+
+    def test_streaming_error_budget_spans_chunks(self, temp_dir, clean_database):
+        """Once MAX_VALIDATION_ERRORS is reached, later chunks are failed unvalidated."""
+        csv_path = temp_dir / "bad.csv"
+        pd.DataFrame({
+            "id": [f"SKU{i}" for i in range(6)],
+            "name": ["N"] * 6,
+            "category": ["C"] * 6,
+            "unit_cost": ["bad"] * 6,
+            "unit_price": ["1"] * 6,
+        }).to_csv(csv_path, index=False)
+
+        with patch("src.importer.csv_importer.MAX_VALIDATION_ERRORS", 2):
+            result = CSVImporter(DataType.PRODUCTS).import_file(csv_path, chunk_size=2)
+
+        assert result.failed_records == 6
+        assert len(result.errors) == 2
+
+    def test_missing_columns_detected_on_first_chunk(self, invalid_csv_file):
+        importer = CSVImporter(DataType.PRODUCTS)
+        result = importer.import_file(invalid_csv_file, chunk_size=10)
+        assert result.success is False
+        assert result.errors[0]["type"] == "missing_columns"
+
+    def test_large_file_streams_automatically(self, sample_csv_file, clean_database):
+        importer = CSVImporter(DataType.PRODUCTS)
+        with patch("src.importer.base.should_stream", return_value=True):
+            with patch.object(importer, "read_file") as read_file:
+                result = importer.import_file(sample_csv_file)
+        read_file.assert_not_called()
+        assert result.imported_records == 3
+
+    def test_excel_chunks_match_read_file(self, sample_excel_file):
+        importer = ExcelImporter(DataType.PRODUCTS)
+        whole = importer.read_file(sample_excel_file)
+        chunks = [chunk for chunk, _ in importer.read_chunks(sample_excel_file, 2)]
+
+        assert [len(c) for c in chunks] == [2, 1]
+        streamed = pd.concat(chunks)
+        assert streamed.index.tolist() == whole.index.tolist()
+        assert streamed.astype(object).values.tolist() == whole.astype(object).values.tolist()
+
+
+class TestSniffer:
+    """Tests for CSV dialect detection."""
+
+    PRODUCT_COLUMNS = ["id", "name", "category", "unit_cost", "unit_price"]
+
+    def test_semicolon_latin1_file(self, temp_dir):
+        from src.importer.sniffer import sniff_dialect
+
+        csv_path = temp_dir / "semi.csv"
+        csv_path.write_bytes(
+            "id;name;category;unit_cost;unit_price\nSKU1;Caf\xe9;C;1;2\n".encode("latin-1")
+        )
+        dialect = sniff_dialect(csv_path, self.PRODUCT_COLUMNS)
+        assert (dialect.encoding, dialect.delimiter, dialect.has_header) == ("latin-1", ";", True)
+
+    def test_bom_and_headerless_file(self, temp_dir):
+        from src.importer.sniffer import sniff_dialect
+
+        csv_path = temp_dir / "nohdr.csv"
+        csv_path.write_bytes(b"\xef\xbb\xbfSKU1,Widget,Cat,1.5,2\nSKU2,Gadget,Cat,2,3\n")
+        dialect = sniff_dialect(csv_path, self.PRODUCT_COLUMNS)
+        assert dialect.encoding == "utf-8-sig"
+        assert dialect.has_header is False
+
+    def test_non_utf8_byte_past_sample_is_found(self, temp_dir):
+        from src.importer.sniffer import SAMPLE_BYTES, detect_encoding
+
+        csv_path = temp_dir / "late.csv"
+        csv_path.write_bytes(b"id,name\n" + b"SKU,A\n" * (SAMPLE_BYTES // 4) + b"SKU,\xe9\n")
+        assert detect_encoding(csv_path) == "latin-1"
+
+    def test_dialect_json_round_trip(self):
+        from src.importer.sniffer import CSVDialect
+
+        dialect = CSVDialect("cp1252", "\t", False)
+        assert CSVDialect.from_json(dialect.to_json()) == dialect
+        assert CSVDialect.from_json("not json") is None
+        assert CSVDialect.from_json(None) is None
+
+    def test_headerless_file_imports_by_position(self, temp_dir, clean_database):
+        csv_path = temp_dir / "nohdr.csv"
+        csv_path.write_text("SKU1,Widget,Cat,1.5,2\nSKU2,Gadget,Cat,2,3\nSKU3,Thing,Dog,4,5\n")
+        result = CSVImporter(DataType.PRODUCTS).import_file(csv_path)
+        assert result.imported_records == 3
+
+    def test_dialect_recorded_and_reused(self, temp_dir, clean_database):
+        from src.database.models import ImportLog
+
+        csv_path = temp_dir / "feed.csv"
+        csv_path.write_bytes(
+            "id;name;category;unit_cost;unit_price\nSKU1;Caf\xe9;C;1;2\n".encode("latin-1")
+        )
+        CSVImporter(DataType.PRODUCTS).import_file(csv_path)
+        with clean_database.get_session() as session:
+            stored = session.query(ImportLog.dialect).scalar()
+        assert '"delimiter": ";"' in stored
+
+        importer = CSVImporter(DataType.PRODUCTS)
+        with patch("src.importer.csv_importer.sniff_dialect") as sniff:
+            result = importer.import_file(csv_path)
+        sniff.assert_not_called()
+        assert importer.dialect.encoding == "latin-1"
+        assert result.imported_records == 1
+
+    def test_latin1_feed_switching_to_utf8(self, temp_dir, clean_database):
+        from src.database.models import Product
+
+        csv_path = temp_dir / "feed.csv"
+        csv_path.write_bytes(
+            "id;name;category;unit_cost;unit_price\nSKU1;Caf\xe9;C;1;2\n".encode("latin-1")
+        )
+        CSVImporter(DataType.PRODUCTS).import_file(csv_path)
+
+        csv_path.write_bytes(
+            "id;name;category;unit_cost;unit_price\nSKU1;Caf\xe9;C;1;2\n".encode("utf-8")
+        )
+        importer = CSVImporter(DataType.PRODUCTS)
+        result = importer.import_file(csv_path)
+        assert importer.dialect.encoding == "utf-8"
+        assert result.imported_records == 1
+        with clean_database.get_session() as session:
+            assert session.query(Product.name).scalar() == "Caf\xe9"
+
+    def test_utf8_text_past_sample_rejects_latin1(self, temp_dir, clean_database):
+        from src.importer.sniffer import SAMPLE_BYTES
+
+        csv_path = temp_dir / "feed.csv"
+        rows = b"".join(b"SKU%d;A;C;1;2\n" % i for i in range(SAMPLE_BYTES // 12))
+        header = b"id;name;category;unit_cost;unit_price\n"
+        csv_path.write_bytes(header + rows + "SKUX;Caf\xe9;C;1;2\n".encode("latin-1"))
+        CSVImporter(DataType.PRODUCTS).import_file(csv_path)
+
+        csv_path.write_bytes(header + rows + "SKUX;Caf\xe9;C;1;2\n".encode("utf-8"))
+        importer = CSVImporter(DataType.PRODUCTS)
+        importer.import_file(csv_path)
+        assert importer.dialect.encoding == "utf-8"
+
+    def test_stale_dialect_is_redetected(self, temp_dir, clean_database):
+        csv_path = temp_dir / "feed.csv"
+        csv_path.write_text("id,name,category,unit_cost,unit_price\nSKU1,A,C,1,2\n")
+        CSVImporter(DataType.PRODUCTS).import_file(csv_path)
+
+        csv_path.write_text("id;name;category;unit_cost;unit_price\nSKU1;A;C;1;2\n")
+        importer = CSVImporter(DataType.PRODUCTS)
+        result = importer.import_file(csv_path)
+        assert importer.dialect.delimiter == ";"
+        assert result.imported_records == 1
+
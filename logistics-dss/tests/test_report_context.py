@@ -0,0 +1,77 @@
+"""
+Unit tests for src/services/report_context.py
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.report_context import ReportContext, context_memoized
+
+
+class _Counter:
+    """Minimal service-like object with a memoized method."""
+
+    def __init__(self, context=None):
+        self.context = context
+        self.calls = 0
+
+    @context_memoized
+    def compute(self, days: int = 30, category=None):
+        self.calls += 1
+        return {"days": days, "category": category}
+
+
+class TestReportContext:
+
+    def test_get_or_compute_caches(self):
+        ctx = ReportContext()
+        values = iter([1, 2])
+        assert ctx.get_or_compute("k", lambda: next(values)) == 1
+        assert ctx.get_or_compute("k", lambda: next(values)) == 1
+        assert (ctx.misses, ctx.hits) == (1, 1)
+        assert len(ctx) == 1
+
+    def test_computed_keys_in_order(self):
+        ctx = ReportContext()
+        ctx.get_or_compute("a", lambda: 1)
+        ctx.get_or_compute("b", lambda: 2)
+        assert ctx.computed_keys() == ("a", "b")
+
+
+class TestContextMemoized:
+
+    def test_no_context_always_computes(self):
+        svc = _Counter()
+        svc.compute()
+        svc.compute()
+        assert svc.calls == 2
+
+    def test_context_computes_once(self):
+        svc = _Counter(ReportContext())
+        first = svc.compute(30)
+        assert svc.compute(30) is first
+        assert svc.calls == 1
+
+    def test_positional_and_keyword_calls_share_entry(self):
+        svc = _Counter(ReportContext())
+        svc.compute(30, None)
+        svc.compute(days=30)
+        svc.compute()
+        assert svc.calls == 1
+
+    def test_different_arguments_are_separate(self):
+        svc = _Counter(ReportContext())
+        svc.compute(30)
+        svc.compute(60)
+        svc.compute(30, category="A")
+        assert svc.calls == 3
+
+    def test_context_shared_between_instances(self):
+        ctx = ReportContext()
+        a, b = _Counter(ctx), _Counter(ctx)
+        a.compute()
+        b.compute()
+        assert a.calls + b.calls == 1
@@ -16,6 +16,9 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.services.report_service import ReportService
+from src.services.report_context import ReportContext
+from src.services.kpi_service import KPIService
+from src.services.optimization_service import OptimizationService
 from src.database.models import Product, Warehouse, InventoryLevel, SalesRecord
 
 
@@ -129,6 +132,34 @@ class TestGetExecutiveReport:
         result = svc.get_executive_report(days=30)
         assert "period_days" in result
 
+    def test_shared_context_reuses_intermediate_results(self, clean_database):
+        _seed(clean_database)
+        ctx = ReportContext()
+        ReportService(db_manager=clean_database).get_executive_report(days=30, context=ctx)
+        names = [key[0] for key in ctx.computed_keys()]
+        # Each expensive step is keyed exactly once per report
+        assert len(names) == len(set(names))
+        assert "InventoryService.get_stock_summary" in names
+        assert "OptimizationService.get_optimization_report" in names
+        assert ctx.hits > 0
+
+    def test_kpis_read_stock_summary_once(self, clean_database):
+        _seed(clean_database)
+        ctx = ReportContext()
+        KPIService(clean_database, context=ctx).get_all_kpis(days=30)
+        summary_keys = [k for k in ctx.computed_keys()
+                        if k[0] == "InventoryService.get_stock_summary"]
+        assert len(summary_keys) == 1
+        # stock health, service level and financial KPIs → 1 miss + 2 hits
+        assert ctx.hits >= 2
+
+    def test_report_matches_uncached_services(self, clean_database):
+        _seed(clean_database)
+        result = ReportService(db_manager=clean_database).get_executive_report(days=30)
+        assert result["optimization_summary"] == (
+            OptimizationService(clean_database).get_optimization_summary(days=30)
+        )
+
 
 # ---------------------------------------------------------------------------
 # export_to_excel
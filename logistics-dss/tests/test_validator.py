@@ -4,6 +4,8 @@ Tests for Data Validation Module
 
 import pytest
 import sys
+import numpy as np
+import pandas as pd
 from pathlib import Path
 
 # Add project root to path
@@ -13,7 +15,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from config.constants import DataType
 from src.validator.rules import (
     RequiredRule, StringLengthRule, NumericRangeRule,
-    DecimalRule, IntegerRule, DateRule, DateTimeRule
+    DecimalRule, IntegerRule, DateRule, DateTimeRule,
+    ValidationRule, PatternRule
 )
 from src.validator.data_validator import DataValidator
 
@@ -176,6 +179,54 @@ class TestDateTimeRule:
         assert is_valid is False
 
 
+class TestValidateSeries:
+    """Column-wise validation must agree with scalar validate()."""
+
+    MIXED = pd.Series(
+        ["10", " 7 ", "-3", "2.5", "abc", "", "  ", np.nan, None, "1e3", "2024-01-15"],
+        dtype=object,
+    )
+
+    @pytest.mark.parametrize("rule", [
+        RequiredRule("f"),
+        StringLengthRule("f", max_length=3),
+        NumericRangeRule("f", min_val=0, max_val=100),
+        DecimalRule("f"),
+        IntegerRule("f"),
+        DateRule("f"),
+        DateTimeRule("f"),
+        PatternRule("f", r"\d+"),
+    ])
+    def test_matches_scalar_validate(self, rule):
+        valid, messages = rule.validate_series(self.MIXED)
+        for pos, value in enumerate(self.MIXED.to_numpy(dtype=object)):
+            expected_valid, expected_msg = rule.validate(value)
+            assert valid.iloc[pos] == expected_valid, value
+            assert messages.iloc[pos] == expected_msg, value
+
+    def test_numeric_dtype_column(self):
+        values = pd.Series([1.0, 2.5, -1.0])
+        valid, _ = IntegerRule("qty").validate_series(values)
+        assert valid.tolist() == [True, False, True]
+
+    def test_custom_rule_falls_back_to_validate(self):
+        class EvenRule(ValidationRule):
+            def validate(self, value):
+                if int(value) % 2:
+                    return False, f"{self.field_name} must be even"
+                return True, None
+
+        valid, messages = EvenRule("n").validate_series(pd.Series(["2", "3", "4"]))
+        assert valid.tolist() == [True, False, True]
+        assert messages.tolist() == [None, "n must be even", None]
+
+    def test_keeps_index(self):
+        values = pd.Series(["1", "x"], index=[10, 20])
+        valid, messages = DecimalRule("v").validate_series(values)
+        assert valid.index.tolist() == [10, 20]
+        assert messages.loc[20] == "v must be a valid decimal number"
+
+
 class TestDataValidator:
     """Tests for DataValidator class."""
 
@@ -209,3 +260,48 @@ class TestDataValidator:
         assert summary["total_errors"] == 3
         assert summary["errors_by_field"]["name"] == 2
         assert summary["errors_by_field"]["unit_cost"] == 1
+
+    def test_validate_dataframe_matches_validate_row(self):
+        df = pd.DataFrame({
+            "id": ["SKU1", "", "SKU3", "X" * 60, "SKU5"],
+            "name": ["A", "B", np.nan, "D", "E"],
+            "category": ["C", "C", "C", "C", "C"],
+            "unit_cost": ["1.5", "abc", "-1", "2", "1e9"],
+            "unit_price": ["2", "3", "x", "4", "5"],
+        }, index=[5, 6, 7, 8, 9])
+        validator = DataValidator(DataType.PRODUCTS)
+
+        is_valid, errors, valid_df = validator.validate_dataframe(df)
+
+        expected = []
+        for idx, row in df.iterrows():
+            expected.extend(validator.validate_row(row.to_dict(), idx)[1])
+        assert is_valid is False
+        assert [(e["row"], e["field"], e["message"]) for e in errors] == [
+            (e["row"], e["field"], e["message"]) for e in expected
+        ]
+        assert valid_df.index.tolist() == [5]
+
+    def test_validate_dataframe_missing_column(self, sample_products_df):
+        validator = DataValidator(DataType.PRODUCTS)
+        df = sample_products_df.drop(columns=["category"])
+        is_valid, errors, valid_df = validator.validate_dataframe(df)
+        assert is_valid is False
+        assert len(errors) == len(df)
+        assert all(e["field"] == "category" for e in errors)
+        assert valid_df.empty
+
+    def test_validate_dataframe_stops_after_max_errors(self):
+        df = pd.DataFrame({
+            "id": ["P1", "", "P3", "", "P5"],
+            "name": ["A", "", "C", "D", "E"],
+            "category": ["C"] * 5,
+            "unit_cost": ["1"] * 5,
+            "unit_price": ["2"] * 5,
+        })
+        validator = DataValidator(DataType.PRODUCTS)
+
+        # Row 1 contributes two errors and reaches the limit; rows after it are skipped
+        _, errors, valid_df = validator.validate_dataframe(df, max_errors=2)
+        assert [e["row"] for e in errors] == [1, 1]
+        assert valid_df.index.tolist() == [0]
@@ -1,21 +1,40 @@
 """
 AI GURU Agent Module
 The main agent that combines RAG retrieval with Claude for responses.
+
+``chat_stream_async`` is the low-latency streaming path: context retrieval
+runs in a worker thread while the connection to the API is opened, and a
+new message cancels the turn still streaming.
 """
 
+import asyncio
 import random
-from typing import List, Dict, Any, Optional, Generator
+import threading
+import time
+from typing import List, Dict, Any, Optional, Generator, AsyncGenerator
 
 import anthropic
 
-from config.settings import ANTHROPIC_API_KEY, CLAUDE_MODEL, MAX_TOKENS, TEMPERATURE
+from config.settings import (
+    ANTHROPIC_API_KEY,
+    ANTHROPIC_BASE_URL,
+    CLAUDE_MODEL,
+    MAX_TOKENS,
+    TEMPERATURE,
+    HISTORY_TOKEN_BUDGET,
+    HISTORY_MAX_MESSAGES
+)
 from config.prompts import SYSTEM_PROMPT, GREETING_TEMPLATES, USER_NAME, AGENT_NAME
-from src.rag_pipeline import RAGPipeline
+from src.context_packer import count_tokens, pack_history
+from src.rag_pipeline import RAGPipeline, ProgressCallback
 from src.logger import get_logger
 from src.utils.retry import retry, RetryError, retry_with_fallback
 
 logger = get_logger(__name__)
 
+CONNECTION_WARMUP_TIMEOUT = 5.0  # seconds
+CONNECTION_IDLE_REUSE = 4.0  # seconds; a little under httpx's 5 s keep-alive expiry
+
 
 class AIGuruAgent:
     """AI GURU - Personalized RAG Research Assistant."""
@@ -41,6 +60,15 @@ class AIGuruAgent:
         self.rag_pipeline = RAGPipeline()
         self.conversation_history: List[Dict[str, str]] = []
 
+        # Async client state, bound to the event loop it was created on
+        self._async_client: Optional[anthropic.AsyncAnthropic] = None
+        self._async_http = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_idle_since: Optional[float] = None  # when a pooled connection was last freed
+        self._turn: Optional[threading.Event] = None
+        self._turn_lock = threading.Lock()
+        self.last_timings: Dict[str, float] = {}
+
         logger.info(f"{AGENT_NAME} Agent initialized successfully")
 
     def get_greeting(self) -> str:
@@ -244,6 +272,192 @@ class AIGuruAgent:
             "model": CLAUDE_MODEL
         }
 
+    async def chat_stream_async(
+        self,
+        user_message: str,
+        use_rag: bool = True
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Process a user message and stream the response, asynchronously.
+
+        Query embedding and vector search run in a worker thread while a
+        connection to the API is opened, so retrieval and connection setup
+        overlap instead of adding up.  The warm-up is skipped when a pooled
+        connection is still open or no retrieval runs, and the request never
+        waits for it once retrieval is done.  Starting another
+        turn, or calling ``cancel()``, stops this one at its next chunk; a
+        cancelled turn ends with a ``cancelled`` event and is not added to
+        the history.
+
+        Args:
+            user_message: The user's message
+            use_rag: Whether to retrieve context from knowledge base
+
+        Yields:
+            The same events as chat_stream; the ``done`` event also carries
+            ``timings``, seconds spent per stage (``retrieval``,
+            ``connect`` when a warm-up finished, ``first_token`` after the
+            request, ``total``)
+        """
+        logger.info(f"Processing async streaming chat: {user_message[:50]}...")
+
+        turn = self._begin_turn()
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        client = self._get_async_client()
+        warm_up = None
+        if use_rag and not self._connection_is_warm():
+            warm_up = asyncio.create_task(self._warm_up_connection(client, timings))
+
+        try:
+            # Retrieve context if RAG is enabled
+            context = ""
+            sources = []
+
+            if use_rag:
+                logger.debug("RAG enabled, retrieving context")
+                retrieval_started = time.perf_counter()
+                try:
+                    context, sources = await asyncio.to_thread(
+                        self.rag_pipeline.retrieve_context, user_message
+                    )
+                    logger.debug(f"Retrieved {len(sources)} sources for context")
+                except Exception as e:
+                    logger.warning(f"Failed to retrieve RAG context: {e}. Proceeding without context.")
+                    context = ""
+                    sources = []
+                timings["retrieval"] = time.perf_counter() - retrieval_started
+                yield {"type": "sources", "sources": sources}
+
+            # Build the messages
+            messages = self._build_messages(user_message, context)
+
+            full_response = ""
+            cancelled = turn.is_set()
+
+            if not cancelled:
+                try:
+                    logger.debug(f"Starting async Claude API stream (model: {CLAUDE_MODEL})")
+                    request_started = time.perf_counter()
+                    self._async_idle_since = None
+                    async with client.messages.stream(
+                        model=CLAUDE_MODEL,
+                        max_tokens=MAX_TOKENS,
+                        system=SYSTEM_PROMPT,
+                        messages=messages,
+                        # Raw body field: not every SDK release takes it as a parameter
+                        extra_body={"temperature": TEMPERATURE}
+                    ) as stream:
+                        async for text in stream.text_stream:
+                            timings.setdefault("first_token", time.perf_counter() - request_started)
+                            if turn.is_set():
+                                cancelled = True
+                                break
+                            full_response += text
+                            yield {"type": "text", "content": text}
+
+                    if not cancelled:
+                        self._async_idle_since = time.perf_counter()
+                    logger.debug(f"Stream completed, total response length: {len(full_response)}")
+
+                except (anthropic.APIError, anthropic.APIConnectionError, anthropic.RateLimitError) as e:
+                    logger.error(f"Claude API stream error: {e}")
+                    error_message = (
+                        f"\n\n[I apologize, {USER_NAME}, but I encountered a connection issue. "
+                        "Please try again.]"
+                    )
+                    yield {"type": "text", "content": error_message}
+                    full_response += error_message
+        finally:
+            if warm_up is not None:
+                warm_up.cancel()
+
+        timings["total"] = time.perf_counter() - started
+        self.last_timings = timings
+
+        if cancelled:
+            logger.info("Streaming chat cancelled by a newer message")
+            yield {"type": "cancelled", "timings": timings}
+            return
+
+        # Update conversation history
+        self.conversation_history.append({
+            "role": "user",
+            "content": user_message
+        })
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": full_response
+        })
+
+        logger.info(
+            "Async streaming chat completed: "
+            + ", ".join(f"{stage}={seconds:.3f}s" for stage, seconds in timings.items())
+        )
+
+        # Yield final metadata
+        yield {
+            "type": "done",
+            "model": CLAUDE_MODEL,
+            "timings": timings
+        }
+
+    def cancel(self) -> None:
+        """Stop the async turn in progress, if any."""
+        with self._turn_lock:
+            if self._turn is not None:
+                self._turn.set()
+
+    def _begin_turn(self) -> threading.Event:
+        """Cancel the previous async turn and return the new turn's flag."""
+        with self._turn_lock:
+            if self._turn is not None:
+                self._turn.set()
+            self._turn = threading.Event()
+            return self._turn
+
+    def _get_async_client(self) -> anthropic.AsyncAnthropic:
+        """The async client for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            # Connections are bound to a loop; a new loop needs a new client
+            self._async_http = anthropic.DefaultAsyncHttpxClient()
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=ANTHROPIC_API_KEY,
+                base_url=ANTHROPIC_BASE_URL,
+                http_client=self._async_http
+            )
+            self._async_loop = loop
+            self._async_idle_since = None
+            logger.debug("Async Anthropic client initialized")
+        return self._async_client
+
+    def _connection_is_warm(self) -> bool:
+        """True if the last request left a pooled connection that is still open."""
+        return (
+            self._async_idle_since is not None
+            and time.perf_counter() - self._async_idle_since < CONNECTION_IDLE_REUSE
+        )
+
+    async def _warm_up_connection(
+        self,
+        client: anthropic.AsyncAnthropic,
+        timings: Dict[str, float]
+    ) -> None:
+        """
+        Open a pooled connection to the API.
+
+        A bare HEAD request completes the TCP and TLS handshakes; a
+        streaming request sent after it finishes reuses the kept-alive
+        connection.  Its response is irrelevant and failures are ignored.
+        """
+        started = time.perf_counter()
+        try:
+            await self._async_http.head(str(client.base_url), timeout=CONNECTION_WARMUP_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+        timings["connect"] = time.perf_counter() - started
+
     def _build_messages(
         self,
         user_message: str,
@@ -252,6 +466,9 @@ class AIGuruAgent:
         """
         Build the message list for the API call.
 
+        Recent history is included up to HISTORY_TOKEN_BUDGET tokens (and
+        at most HISTORY_MAX_MESSAGES messages), newest exchanges first.
+
         Args:
             user_message: Current user message
             context: Retrieved context (or empty string)
@@ -259,16 +476,14 @@ class AIGuruAgent:
         Returns:
             List of message dicts for the API
         """
-        messages = []
-
-        # Add conversation history (keep last 10 exchanges)
-        history_limit = 20  # 10 user + 10 assistant messages
-        recent_history = self.conversation_history[-history_limit:]
-
-        for msg in recent_history:
-            messages.append(msg)
+        messages = pack_history(
+            self.conversation_history, HISTORY_TOKEN_BUDGET, HISTORY_MAX_MESSAGES
+        )
 
-        logger.debug(f"Including {len(recent_history)} messages from history")
+        logger.debug(
+            f"Including {len(messages)} of {len(self.conversation_history)} messages "
+            f"from history (~{sum(count_tokens(m['content']) for m in messages)} tokens)"
+        )
 
         # Add current user message with context
         if context:
@@ -294,21 +509,49 @@ class AIGuruAgent:
 
     # Knowledge base management methods (delegated to RAG pipeline)
 
-    def ingest_pdf(self, file_path: str) -> Dict[str, Any]:
+    def ingest_pdf(
+        self,
+        file_path: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """Ingest a PDF document."""
         logger.info(f"Agent ingesting PDF: {file_path}")
-        return self.rag_pipeline.ingest_pdf(file_path)
+        return self.rag_pipeline.ingest_pdf(file_path, progress_callback=progress_callback)
 
-    def ingest_pdf_upload(self, uploaded_file, filename: str) -> Dict[str, Any]:
+    def ingest_pdf_upload(
+        self,
+        uploaded_file,
+        filename: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """Ingest an uploaded PDF file."""
         logger.info(f"Agent ingesting uploaded PDF: {filename}")
-        return self.rag_pipeline.ingest_pdf_upload(uploaded_file, filename)
+        return self.rag_pipeline.ingest_pdf_upload(
+            uploaded_file, filename, progress_callback=progress_callback
+        )
 
     def ingest_url(self, url: str) -> Dict[str, Any]:
         """Ingest content from a URL."""
         logger.info(f"Agent ingesting URL: {url}")
         return self.rag_pipeline.ingest_url(url)
 
+    def ingest_urls(
+        self,
+        urls: List[str],
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """Ingest content from many URLs concurrently."""
+        logger.info(f"Agent ingesting {len(urls)} URLs")
+        return self.rag_pipeline.ingest_urls(urls, progress_callback=progress_callback)
+
+    def refresh_url_sources(
+        self,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """Re-fetch every URL source, skipping unchanged pages."""
+        logger.info("Agent refreshing URL sources")
+        return self.rag_pipeline.refresh_url_sources(progress_callback=progress_callback)
+
     def delete_source(self, source: str) -> Dict[str, Any]:
         """Delete a source from the knowledge base."""
         logger.info(f"Agent deleting source: {source}")
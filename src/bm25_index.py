@@ -0,0 +1,317 @@
+"""
+BM25 Index Module
+In-process BM25 keyword index over chunk text.
+
+Dense retrieval misses exact-term queries such as part numbers, error codes
+and acronyms; a lexical index catches them.  The index is an inverted index
+whose postings are typed arrays (``array('I')`` document numbers and
+``array('H')`` term frequencies, 6 bytes per posting) rather than Python
+objects, so it stays small for millions of chunks, and scoring runs
+vectorized in NumPy over those arrays without copying them.
+
+Chunks are added and removed incrementally.  Removal marks the document
+dead; dead postings are skipped when scoring and dropped when the index is
+compacted on save.  On disk the index is a single ``.npz`` file holding
+the postings in CSR layout (one concatenated array plus per-term offsets).
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = 1
+MAX_TERM_FREQUENCY = 0xFFFF  # term frequencies are stored as uint16
+COMPACT_DEAD_RATIO = 0.2  # compact on save once this share of documents is dead
+
+# Words, plus compounds such as "x-200", "v2.1" or "a/b" kept whole
+TOKEN_PATTERN = re.compile(r"\w+(?:[-./]\w+)*")
+COMPOUND_SEPARATORS = re.compile(r"[-./]")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased index terms of a text.
+
+    Compound tokens are indexed whole and by their parts, so "X-200"
+    matches queries for "x-200" as well as for "200".
+    """
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(token)
+        parts = COMPOUND_SEPARATORS.split(token)
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+class BM25Index:
+    """Incremental BM25 inverted index with array-backed postings."""
+
+    def __init__(self, path: Optional[Path] = None, k1: float = 1.5, b: float = 0.75):
+        """
+        Open the index stored at ``path``, or start an empty one.
+
+        Args:
+            path: ``.npz`` file the index is loaded from and saved to
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+        """
+        self.path = Path(path) if path else None
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.RLock()
+        self._reset()
+
+        if self.path and self.path.exists():
+            try:
+                self._load()
+                logger.info(f"BM25 index loaded from {self.path} ({len(self)} chunks)")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Discarding unreadable BM25 index {self.path}: {e}")
+                self._reset()
+
+    def _reset(self) -> None:
+        self._terms: Dict[str, int] = {}
+        self._postings: List[array] = []  # per term: document numbers
+        self._frequencies: List[array] = []  # per term: term frequencies
+        self._doc_ids: List[Optional[str]] = []  # per document: chunk ID, None once removed
+        self._doc_numbers: Dict[str, int] = {}
+        self._lengths = array("I")
+        self._live = bytearray()
+        self._live_count = 0
+        self._total_length = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def __contains__(self, chunk_id: str) -> bool:
+        return chunk_id in self._doc_numbers
+
+    # ------------------------------------------------------------------
+    # Updates
+
+    def add(self, ids: Iterable[str], texts: Iterable[str]) -> None:
+        """
+        Index chunks, replacing any already indexed under the same ID.
+
+        Args:
+            ids: Chunk IDs
+            texts: Chunk texts
+        """
+        with self._lock:
+            for chunk_id, text in zip(ids, texts):
+                if chunk_id in self._doc_numbers:
+                    self._remove_one(chunk_id)
+
+                doc = len(self._doc_ids)
+                tokens = tokenize(text)
+                for term, frequency in Counter(tokens).items():
+                    term_number = self._terms.get(term)
+                    if term_number is None:
+                        term_number = self._terms[term] = len(self._postings)
+                        self._postings.append(array("I"))
+                        self._frequencies.append(array("H"))
+                    self._postings[term_number].append(doc)
+                    self._frequencies[term_number].append(min(frequency, MAX_TERM_FREQUENCY))
+
+                self._doc_ids.append(chunk_id)
+                self._doc_numbers[chunk_id] = doc
+                self._lengths.append(len(tokens))
+                self._live.append(1)
+                self._live_count += 1
+                self._total_length += len(tokens)
+            self._dirty = True
+
+    def remove(self, ids: Iterable[str]) -> None:
+        """Remove chunks from the index; unknown IDs are ignored."""
+        with self._lock:
+            for chunk_id in ids:
+                if chunk_id in self._doc_numbers:
+                    self._remove_one(chunk_id)
+                    self._dirty = True
+
+    def _remove_one(self, chunk_id: str) -> None:
+        doc = self._doc_numbers.pop(chunk_id)
+        self._doc_ids[doc] = None
+        self._live[doc] = 0
+        self._live_count -= 1
+        self._total_length -= self._lengths[doc]
+
+    def clear(self) -> None:
+        """Remove every chunk."""
+        with self._lock:
+            self._reset()
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Search
+
+    def search(self, query: str, top_k: int) -> List[Tuple[str, float]]:
+        """
+        Chunks ranked by BM25 score for a query.
+
+        Args:
+            query: Query text
+            top_k: Maximum number of results
+
+        Returns:
+            (chunk ID, score) pairs, best first; only chunks sharing a term
+            with the query
+        """
+        with self._lock:
+            term_numbers = [
+                self._terms[term] for term in set(tokenize(query)) if term in self._terms
+            ]
+            if not term_numbers or not self._live_count:
+                return []
+
+            live = np.frombuffer(self._live, dtype=np.uint8).astype(bool)
+            lengths = np.frombuffer(self._lengths, dtype=np.uintc)
+            average_length = self._total_length / self._live_count
+            scores = np.zeros(len(self._doc_ids), dtype=np.float32)
+
+            for term_number in term_numbers:
+                docs = np.frombuffer(self._postings[term_number], dtype=np.uintc)
+                frequencies = np.frombuffer(self._frequencies[term_number], dtype=np.ushort)
+                alive = live[docs]
+                docs = docs[alive]
+                if not len(docs):
+                    continue
+                frequencies = frequencies[alive].astype(np.float32)
+
+                idf = math.log(1 + (self._live_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                norm = self.k1 * (1 - self.b + self.b * lengths[docs] / average_length)
+                scores[docs] += idf * frequencies * (self.k1 + 1) / (frequencies + norm)
+
+            matched = np.flatnonzero(scores)
+            if len(matched) > top_k:
+                matched = matched[np.argpartition(-scores[matched], top_k - 1)[:top_k]]
+            ranked = matched[np.argsort(-scores[matched], kind="stable")]
+            return [(self._doc_ids[doc], float(scores[doc])) for doc in ranked]
+
+    # ------------------------------------------------------------------
+    # Persistence
+
+    def flush(self) -> None:
+        """Save the index if it changed since it was loaded or saved."""
+        if self._dirty and self.path:
+            self.save()
+
+    def save(self) -> None:
+        """Write the index to its file atomically."""
+        with self._lock:
+            dead = len(self._doc_ids) - self._live_count
+            if dead and dead >= COMPACT_DEAD_RATIO * len(self._doc_ids):
+                self._compact()
+
+            offsets = np.zeros(len(self._postings) + 1, dtype=np.int64)
+            np.cumsum([len(p) for p in self._postings], out=offsets[1:])
+            postings = np.frombuffer(b"".join(p.tobytes() for p in self._postings), dtype=np.uintc)
+            frequencies = np.frombuffer(
+                b"".join(f.tobytes() for f in self._frequencies), dtype=np.ushort
+            )
+            terms = sorted(self._terms, key=self._terms.get)
+            meta = {"format": FORMAT_VERSION, "k1": self.k1, "b": self.b}
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    np.savez(
+                        f,
+                        terms=_encode_lines(terms),
+                        offsets=offsets,
+                        postings=postings,
+                        frequencies=frequencies,
+                        doc_ids=_encode_lines(chunk_id or "" for chunk_id in self._doc_ids),
+                        lengths=np.frombuffer(self._lengths, dtype=np.uintc).copy(),
+                        live=np.frombuffer(self._live, dtype=np.uint8).copy(),
+                        meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+                    )
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+                logger.debug(f"BM25 index saved: {len(self)} chunks, {len(terms)} terms")
+            except OSError as e:
+                logger.error(f"Failed to write BM25 index {self.path}: {e}")
+
+    def _load(self) -> None:
+        with np.load(self.path) as data:
+            meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            if meta.get("format") != FORMAT_VERSION:
+                raise ValueError(f"unsupported format {meta.get('format')}")
+
+            terms = _decode_lines(data["terms"])
+            offsets = data["offsets"]
+            postings = data["postings"].astype(np.uintc, copy=False)
+            frequencies = data["frequencies"].astype(np.ushort, copy=False)
+
+            self._terms = {term: i for i, term in enumerate(terms)}
+            self._postings = [
+                array("I", postings[start:stop].tobytes())
+                for start, stop in zip(offsets[:-1], offsets[1:])
+            ]
+            self._frequencies = [
+                array("H", frequencies[start:stop].tobytes())
+                for start, stop in zip(offsets[:-1], offsets[1:])
+            ]
+
+            self._doc_ids = [chunk_id or None for chunk_id in _decode_lines(data["doc_ids"])]
+            self._lengths = array("I", data["lengths"].astype(np.uintc, copy=False).tobytes())
+            self._live = bytearray(data["live"].tobytes())
+
+        self._doc_numbers = {
+            chunk_id: doc for doc, chunk_id in enumerate(self._doc_ids) if chunk_id is not None
+        }
+        self._live_count = len(self._doc_numbers)
+        lengths = np.frombuffer(self._lengths, dtype=np.uintc)
+        live = np.frombuffer(self._live, dtype=np.uint8).astype(bool)
+        self._total_length = int(lengths[live].sum())
+        self._dirty = False
+
+    def _compact(self) -> None:
+        """Drop dead documents and renumber the rest."""
+        live = np.frombuffer(self._live, dtype=np.uint8).astype(bool)
+        renumber = np.cumsum(live, dtype=np.int64) - 1
+
+        terms, postings, frequencies = {}, [], []
+        for term, term_number in self._terms.items():
+            docs = np.frombuffer(self._postings[term_number], dtype=np.uintc)
+            alive = live[docs]
+            if not alive.any():
+                continue
+            terms[term] = len(postings)
+            postings.append(array("I", renumber[docs[alive]].astype(np.uintc).tobytes()))
+            term_frequencies = np.frombuffer(self._frequencies[term_number], dtype=np.ushort)
+            frequencies.append(array("H", term_frequencies[alive].tobytes()))
+
+        lengths = np.frombuffer(self._lengths, dtype=np.uintc)[live]
+        self._terms, self._postings, self._frequencies = terms, postings, frequencies
+        self._doc_ids = [chunk_id for chunk_id in self._doc_ids if chunk_id is not None]
+        self._doc_numbers = {chunk_id: doc for doc, chunk_id in enumerate(self._doc_ids)}
+        self._lengths = array("I", lengths.tobytes())
+        self._live = bytearray(b"\x01" * len(self._doc_ids))
+        logger.debug(f"BM25 index compacted to {len(self._doc_ids)} chunks")
+
+
+def _encode_lines(lines: Iterable[str]) -> np.ndarray:
+    """Newline-joined UTF-8 bytes of strings that contain no newlines."""
+    return np.frombuffer("\n".join(lines).encode("utf-8"), dtype=np.uint8)
+
+
+def _decode_lines(data: np.ndarray) -> List[str]:
+    text = data.tobytes().decode("utf-8")
+    return text.split("\n") if text else []
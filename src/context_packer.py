@@ -0,0 +1,237 @@
+"""
+Context Packer Module
+Fits retrieved excerpts and conversation history into token budgets.
+
+Prompt size drives time-to-first-token and cost, so the context and the
+history sent with each question are bounded in tokens rather than in
+items.  Tokens are counted with tiktoken; Claude's tokenizer differs
+somewhat, so budgets are close estimates rather than exact limits.  If the
+tiktoken encoding cannot be loaded (it is downloaded on first use), a
+characters-per-token estimate is used instead.
+
+Neighbouring chunks of the same source are merged into one excerpt, with
+their overlap removed.  Excerpts are then kept in rank order until the
+budget runs out: the one that crosses the limit is trimmed and the
+lower-ranked rest are dropped.  History is kept newest exchange first,
+trimming the exchange that crosses the limit and dropping older ones.
+"""
+
+import functools
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import tiktoken
+
+from config.settings import CHUNK_OVERLAP, TOKEN_ENCODING
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHARS_PER_TOKEN = 4  # estimate used when tiktoken is unavailable
+TRUNCATION_MARKER = " […]"
+MIN_TRIMMED_TOKENS = 50  # a part that would be trimmed below this is dropped
+MIN_OVERLAP_CHARS = 10  # shorter shared text between chunks is not treated as overlap
+EXCERPT_OVERHEAD_TOKENS = 20  # excerpt heading, relevance line and separator
+MESSAGE_OVERHEAD_TOKENS = 4  # role and message framing
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding() -> Optional[tiktoken.Encoding]:
+    """The tiktoken encoding, or None if it cannot be loaded."""
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding {TOKEN_ENCODING} unavailable, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in a text."""
+    encoding = _encoding()
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    Beginning of a text that fits in ``max_tokens``.
+
+    The cut is moved back to a word boundary and marked with
+    TRUNCATION_MARKER.  Texts that already fit are returned unchanged.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    keep = max(max_tokens - count_tokens(TRUNCATION_MARKER), 0)
+    encoding = _encoding()
+    if encoding is None:
+        head = text[:keep * CHARS_PER_TOKEN]
+    else:
+        head = encoding.decode(encoding.encode(text, disallowed_special=())[:keep])
+
+    boundary = head.rfind(" ")
+    if boundary > len(head) // 2:
+        head = head[:boundary]
+    return head.rstrip() + TRUNCATION_MARKER
+
+
+def _join_overlapping(first: str, second: str) -> str:
+    """Concatenate consecutive chunks, dropping the text they share."""
+    for size in range(min(len(first), len(second), CHUNK_OVERLAP), MIN_OVERLAP_CHARS - 1, -1):
+        if first.endswith(second[:size]):
+            return first + second[size:]
+    return f"{first}\n{second}"
+
+
+def _excerpt(rank: int, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    text = results[0]["text"]
+    for result in results[1:]:
+        text = _join_overlapping(text, result["text"])
+    return {
+        "text": text,
+        "metadata": results[0].get("metadata") or {},
+        "similarity": max(r["similarity"] for r in results),
+        "ids": [r.get("id") for r in results],
+        "rank": rank,
+        "truncated": False
+    }
+
+
+def merge_adjacent(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge search results that are consecutive chunks of one source.
+
+    Args:
+        results: Search results, best first
+
+    Returns:
+        Excerpts ordered by their best-ranked chunk, each with the merged
+        ``text``, the first chunk's ``metadata``, the best ``similarity``
+        and the chunk ``ids`` in document order
+    """
+    excerpts = []
+    by_source: Dict[Any, List] = defaultdict(list)
+
+    for rank, result in enumerate(results):
+        metadata = result.get("metadata") or {}
+        index = metadata.get("chunk_index")
+        if index is None:
+            excerpts.append(_excerpt(rank, [result]))
+        else:
+            by_source[metadata.get("source")].append((index, rank, result))
+
+    for chunks in by_source.values():
+        chunks.sort(key=lambda chunk: chunk[0])
+        run = [chunks[0]]
+        for chunk in chunks[1:]:
+            if chunk[0] == run[-1][0]:
+                continue  # the same chunk returned twice
+            if chunk[0] != run[-1][0] + 1:
+                excerpts.append(_excerpt(min(r for _, r, _ in run), [c for _, _, c in run]))
+                run = []
+            run.append(chunk)
+        excerpts.append(_excerpt(min(r for _, r, _ in run), [c for _, _, c in run]))
+
+    excerpts.sort(key=lambda excerpt: excerpt["rank"])
+    return excerpts
+
+
+def pack_excerpts(results: List[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+    """
+    Merge search results into excerpts and keep what fits in a budget.
+
+    Args:
+        results: Search results, best first
+        budget: Maximum tokens for all excerpts, including their headings
+
+    Returns:
+        Excerpts as returned by merge_adjacent, best first; an excerpt cut
+        to fit has ``truncated`` set
+    """
+    packed = []
+    remaining = budget
+
+    for excerpt in merge_adjacent(results):
+        overhead = EXCERPT_OVERHEAD_TOKENS + count_tokens(str(excerpt["metadata"].get("source", "")))
+        cost = overhead + count_tokens(excerpt["text"])
+        if cost <= remaining:
+            packed.append(excerpt)
+            remaining -= cost
+            continue
+
+        if remaining - overhead >= MIN_TRIMMED_TOKENS:
+            packed.append({
+                **excerpt,
+                "text": truncate_tokens(excerpt["text"], remaining - overhead),
+                "truncated": True
+            })
+        break
+
+    return packed
+
+
+def _trim_exchange(exchange: List[Dict[str, str]], budget: int) -> Optional[List[Dict[str, str]]]:
+    """
+    An exchange cut down to ``budget`` tokens, or None if too little fits.
+
+    The question keeps up to half of the budget; the replies share the rest.
+    """
+    available = budget - MESSAGE_OVERHEAD_TOKENS * len(exchange)
+    if available < MIN_TRIMMED_TOKENS * len(exchange):
+        return None
+
+    question, replies = exchange[0], exchange[1:]
+    if not replies:
+        return [{**question, "content": truncate_tokens(question["content"], available)}]
+
+    question_budget = min(count_tokens(question["content"]), available // 2)
+    reply_budget = (available - question_budget) // len(replies)
+    return [{**question, "content": truncate_tokens(question["content"], question_budget)}] + [
+        {**reply, "content": truncate_tokens(reply["content"], reply_budget)} for reply in replies
+    ]
+
+
+def pack_history(
+    messages: List[Dict[str, str]],
+    budget: int,
+    max_messages: int
+) -> List[Dict[str, str]]:
+    """
+    The most recent conversation messages that fit in a budget.
+
+    Messages are kept as whole exchanges (a user message and the replies
+    to it), newest first, so the result always starts with a user message.
+
+    Args:
+        messages: Conversation history, oldest first
+        budget: Maximum tokens for the kept messages
+        max_messages: Maximum number of messages considered
+
+    Returns:
+        Kept messages, oldest first
+    """
+    exchanges: List[List[Dict[str, str]]] = []
+    for message in messages[-max_messages:]:
+        if message["role"] == "user" or not exchanges:
+            exchanges.append([message])
+        else:
+            exchanges[-1].append(message)
+    if exchanges and exchanges[0][0]["role"] != "user":
+        exchanges.pop(0)  # replies whose question fell outside max_messages
+
+    kept = []
+    remaining = budget
+    for exchange in reversed(exchanges):
+        cost = sum(MESSAGE_OVERHEAD_TOKENS + count_tokens(m["content"]) for m in exchange)
+        if cost <= remaining:
+            kept.append(exchange)
+            remaining -= cost
+            continue
+
+        trimmed = _trim_exchange(exchange, remaining)
+        if trimmed:
+            kept.append(trimmed)
+        break
+
+    return [message for exchange in reversed(kept) for message in exchange]
@@ -6,11 +6,11 @@ Handles PDF and URL content extraction and text chunking.
 import re
 import requests
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
+from urllib.parse import urlparse
 
-import pdfplumber
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from config.settings import (
@@ -18,13 +18,37 @@ from config.settings import (
     CHUNK_OVERLAP,
     DOCUMENTS_DIR,
     REQUEST_TIMEOUT,
-    MAX_CONTENT_LENGTH
+    MAX_CONTENT_LENGTH,
+    PDF_EXTRACTOR,
+    URL_FETCH_WORKERS,
+    URL_FETCH_PER_HOST,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_DIR
 )
+from src.html_extractor import charset_from_content_type, extract_text
+from src.http_cache import HTTPCache, content_hash
 from src.logger import get_logger
+from src.pdf_extractor import count_pages, iter_pages
+from src.utils.pipeline import bounded_map
 from src.utils.retry import retry, RetryError
 
 logger = get_logger(__name__)
 
+# Pages are buffered until they hold this many chunks' worth of text
+SPLIT_WINDOW_CHUNKS = 8
+
+# Splitter boundaries, strongest first: paragraphs, pages, sentences, words
+SPLIT_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+PAGE_SEPARATOR = "\n"
+
+# A blank line (two newlines, possibly with other whitespace between)
+PARAGRAPH_BREAK = re.compile(r"\n[^\S\n]*\n")
+
+USER_AGENT = "Mozilla/5.0 (compatible; AI-GURU-Bot/1.0)"
+
+# (url, (chunks, metadata) or None, error or None)
+URLResult = Tuple[str, Optional[Tuple[List[str], Dict[str, Any]]], Optional[Exception]]
+
 
 class DocumentProcessor:
     """Processes documents (PDFs and URLs) for RAG ingestion."""
@@ -36,19 +60,45 @@ class DocumentProcessor:
             chunk_size=CHUNK_SIZE,
             chunk_overlap=CHUNK_OVERLAP,
             length_function=len,
-            separators=["\n\n", "\n", ". ", " ", ""]
+            separators=SPLIT_SEPARATORS,
+            keep_separator="end"
         )
         logger.debug(
             f"Text splitter configured with chunk_size={CHUNK_SIZE}, "
             f"chunk_overlap={CHUNK_OVERLAP}"
         )
+        self.session = self._create_session()
+        self.http_cache = HTTPCache(HTTP_CACHE_DIR) if HTTP_CACHE_ENABLED else None
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create the HTTP session used for all URL fetches.
 
-    def process_pdf(self, file_path: str) -> Tuple[List[str], Dict[str, Any]]:
+        The session keeps connections alive, and its pools hold one
+        connection per concurrent download allowed on a host.
+        """
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=URL_FETCH_WORKERS,
+            pool_maxsize=URL_FETCH_PER_HOST
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def process_pdf(
+        self,
+        file_path: str,
+        extractor: Optional[str] = None
+    ) -> Tuple[List[str], Dict[str, Any]]:
         """
         Extract text from PDF and split into chunks.
 
         Args:
             file_path: Path to the PDF file
+            extractor: ``pdfplumber`` or ``pypdf`` (defaults to PDF_EXTRACTOR)
 
         Returns:
             Tuple of (list of text chunks, metadata dict)
@@ -63,33 +113,12 @@ class DocumentProcessor:
         text_content = []
         page_count = 0
 
-        try:
-            with pdfplumber.open(path) as pdf:
-                page_count = len(pdf.pages)
-                logger.debug(f"PDF has {page_count} pages")
-
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_content.append(page_text)
-                            logger.debug(
-                                f"Extracted {len(page_text)} chars from page {page_num}"
-                            )
-                        else:
-                            logger.warning(
-                                f"No text extracted from page {page_num}"
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to extract text from page {page_num}: {e}. "
-                            "Skipping page."
-                        )
-                        continue
-
-        except Exception as e:
-            logger.error(f"Failed to open PDF: {e}")
-            raise
+        for page_num, page_text in self._iter_page_texts(path, extractor):
+            page_count = page_num
+            page_text = self._clean_text(page_text)
+            if page_text:
+                text_content.append(page_text)
+        logger.debug(f"PDF has {page_count} pages")
 
         if not text_content:
             logger.warning(f"No text content extracted from PDF: {file_path}")
@@ -101,9 +130,7 @@ class DocumentProcessor:
                 "error": "No text content extracted"
             }
 
-        full_text = "\n\n".join(text_content)
-        full_text = self._clean_text(full_text)
-
+        full_text = PAGE_SEPARATOR.join(text_content)
         chunks = self.text_splitter.split_text(full_text)
         logger.info(
             f"PDF processed: {path.name}, pages={page_count}, chunks={len(chunks)}"
@@ -119,6 +146,115 @@ class DocumentProcessor:
 
         return chunks, metadata
 
+    def _iter_page_texts(
+        self,
+        path: Path,
+        extractor: Optional[str] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page number, text) for every page, in page order.
+
+        Pages that fail to extract or contain no text are logged and
+        yielded with empty text.
+        """
+        try:
+            for page_num, page_text, error in iter_pages(path, extractor=extractor):
+                if error is not None:
+                    logger.warning(
+                        f"Failed to extract text from page {page_num}: {error}. "
+                        "Skipping page."
+                    )
+                elif page_text:
+                    logger.debug(
+                        f"Extracted {len(page_text)} chars from page {page_num}"
+                    )
+                else:
+                    logger.warning(
+                        f"No text extracted from page {page_num}"
+                    )
+                yield page_num, page_text or ""
+        except Exception as e:
+            logger.error(f"Failed to open PDF: {e}")
+            raise
+
+    def stream_pdf(
+        self,
+        file_path: str,
+        extractor: Optional[str] = None
+    ) -> Tuple[Iterator[Tuple[str, int]], Dict[str, Any]]:
+        """
+        Lazily extract, clean and split a PDF one page at a time.
+
+        Only a few pages of text are held at once, so memory stays flat no
+        matter how long the document is.
+
+        Args:
+            file_path: Path to the PDF file
+            extractor: ``pdfplumber`` or ``pypdf`` (defaults to PDF_EXTRACTOR)
+
+        Returns:
+            Tuple of (iterator of (chunk, page number) pairs, metadata dict
+            with the document's page count)
+        """
+        logger.info(f"Streaming PDF: {file_path}")
+        path = Path(file_path)
+
+        if not path.exists():
+            logger.error(f"PDF file not found: {file_path}")
+            raise FileNotFoundError(f"PDF file not found: {file_path}")
+
+        metadata = {
+            "source": path.name,
+            "type": "pdf",
+            "path": str(path),
+            "page_count": count_pages(path, extractor or PDF_EXTRACTOR),
+            "ingested_at": datetime.now().isoformat()
+        }
+
+        pages = (
+            (page_num, self._clean_text(text))
+            for page_num, text in self._iter_page_texts(path, extractor)
+        )
+        return self.split_pages(pages), metadata
+
+    def split_pages(
+        self,
+        pages: Iterable[Tuple[int, str]],
+        separator: str = PAGE_SEPARATOR
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Split a stream of cleaned page texts into chunks.
+
+        Pages are appended to a buffer that is split once it holds several
+        chunks' worth of text.  The last, possibly incomplete chunk is kept
+        as the start of the next buffer, so chunks still span page breaks.
+
+        Args:
+            pages: (page number, cleaned text) pairs in page order
+            separator: Text placed between consecutive pages
+
+        Yields:
+            (chunk, number of the last page read) pairs
+        """
+        window = CHUNK_SIZE * SPLIT_WINDOW_CHUNKS
+        buffer = ""
+        page_num = 0
+
+        for page_num, text in pages:
+            if not text:
+                continue
+            buffer = f"{buffer}{separator}{text}" if buffer else text
+            if len(buffer) < window:
+                continue
+            chunks = self.text_splitter.split_text(buffer)
+            for chunk in chunks[:-1]:
+                yield chunk, page_num
+            buffer = chunks[-1]
+
+        if buffer:
+            for chunk in self.text_splitter.split_text(buffer):
+                yield chunk, page_num
+
     def process_pdf_upload(
         self,
         uploaded_file,
@@ -135,8 +271,20 @@ class DocumentProcessor:
             Tuple of (list of text chunks, metadata dict)
         """
         logger.info(f"Processing uploaded PDF: {filename}")
+        save_path = self.save_upload(uploaded_file, filename)
+        return self.process_pdf(str(save_path))
 
-        # Save to documents directory
+    def save_upload(self, uploaded_file, filename: str) -> Path:
+        """
+        Save an uploaded file (from Streamlit) to the documents directory.
+
+        Args:
+            uploaded_file: Streamlit UploadedFile object
+            filename: Name of the file
+
+        Returns:
+            Path of the saved file
+        """
         save_path = DOCUMENTS_DIR / filename
 
         try:
@@ -147,70 +295,185 @@ class DocumentProcessor:
             logger.error(f"Failed to save uploaded file: {e}")
             raise
 
-        return self.process_pdf(str(save_path))
+        return save_path
 
     @retry(
         max_attempts=3,
         base_delay=1.0,
         exceptions=(requests.RequestException, requests.Timeout)
     )
-    def _fetch_url_content(self, url: str) -> requests.Response:
+    def _fetch_url_content(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
         """
         Fetch content from URL with retry logic.
 
         Args:
             url: Web URL to fetch
+            headers: Extra request headers (e.g. conditional ones)
 
         Returns:
             Response object
         """
         logger.debug(f"Fetching URL: {url}")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; AI-GURU-Bot/1.0)"
-        }
-
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         logger.debug(f"URL fetched successfully: status={response.status_code}")
 
         return response
 
-    def process_url(self, url: str) -> Tuple[List[str], Dict[str, Any]]:
+    def process_url(
+        self,
+        url: str,
+        revalidate: bool = True
+    ) -> Tuple[List[str], Dict[str, Any]]:
         """
         Extract text content from a URL and split into chunks.
 
+        When the URL is in the HTTP cache the request is conditional.  If
+        the server answers ``304 Not Modified``, or the body hash matches
+        the cached one, the page is not parsed and no chunks are returned;
+        the metadata then has ``not_modified`` set.
+
         Args:
             url: Web URL to process
+            revalidate: Use the HTTP cache; False always processes the page
 
         Returns:
             Tuple of (list of text chunks, metadata dict)
         """
         logger.info(f"Processing URL: {url}")
+        cached = self.http_cache.get(url) if revalidate and self.http_cache else None
+        headers = self.http_cache.conditional_headers(url) if cached else None
 
         try:
-            response = self._fetch_url_content(url)
+            response = self._fetch_url_content(url, headers=headers)
         except RetryError as e:
             logger.error(f"Failed to fetch URL after retries: {url}")
             raise RuntimeError(f"Failed to fetch URL: {e}") from e
 
-        try:
-            soup = BeautifulSoup(response.content, "html.parser")
+        if cached and response.status_code == 304:
+            logger.info(f"URL not modified (304): {url}")
+            return [], self._not_modified_metadata(url)
+
+        body_hash = content_hash(response.content)
+        if cached and cached["content_hash"] == body_hash:
+            logger.info(f"URL content unchanged: {url}")
+            return [], self._not_modified_metadata(url)
+
+        chunks, metadata = self._parse_url_content(url, response)
+        metadata["content_hash"] = body_hash
+        for header, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+            value = response.headers.get(header)
+            if value:
+                metadata[key] = value
+        return chunks, metadata
+
+    @staticmethod
+    def _not_modified_metadata(url: str) -> Dict[str, Any]:
+        """Metadata returned for a URL whose stored content is current."""
+        return {
+            "source": url,
+            "type": "url",
+            "not_modified": True,
+            "ingested_at": datetime.now().isoformat()
+        }
+
+    def remember_url(self, metadata: Dict[str, Any]) -> None:
+        """
+        Record the version of a URL whose chunks have been stored.
+
+        Args:
+            metadata: Metadata returned by process_url
+        """
+        if self.http_cache is not None and "content_hash" in metadata:
+            self.http_cache.put(
+                metadata["source"],
+                metadata["content_hash"],
+                etag=metadata.get("etag"),
+                last_modified=metadata.get("last_modified")
+            )
+
+    def forget_url(self, url: Optional[str] = None) -> None:
+        """
+        Drop a URL (or every URL, if None) from the HTTP cache.
+
+        Args:
+            url: URL removed from the knowledge base
+        """
+        if self.http_cache is None:
+            return
+        if url is None:
+            self.http_cache.clear()
+        else:
+            self.http_cache.discard(url)
+
+    def process_urls(
+        self,
+        urls: Iterable[str],
+        workers: Optional[int] = None,
+        per_host: Optional[int] = None
+    ) -> Iterator[URLResult]:
+        """
+        Fetch and process many URLs concurrently.
+
+        Downloads share the processor's keep-alive session.  At most
+        ``workers`` run at once and at most ``per_host`` against any one
+        host.  A URL that fails is reported with its error; the others
+        carry on.
 
-            # Remove script and style elements
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
+        Args:
+            urls: Web URLs to process (duplicates are processed once)
+            workers: Concurrent downloads (defaults to URL_FETCH_WORKERS)
+            per_host: Concurrent downloads per host (defaults to URL_FETCH_PER_HOST)
+
+        Yields:
+            (url, (chunks, metadata), None) or (url, None, error), in
+            completion order
+        """
+        urls = list(dict.fromkeys(urls))
+        workers = workers or URL_FETCH_WORKERS
+        logger.info(f"Processing {len(urls)} URLs with {workers} workers")
+
+        return bounded_map(
+            self.process_url,
+            urls,
+            workers=workers,
+            key=lambda url: urlparse(url).netloc.lower(),
+            per_key=per_host or URL_FETCH_PER_HOST
+        )
 
-            # Extract text
-            text = soup.get_text(separator="\n")
-            text = self._clean_text(text)
-            original_length = len(text)
+    def _parse_url_content(
+        self,
+        url: str,
+        response: requests.Response
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Extract and chunk the text of a fetched web page.
+
+        Args:
+            url: URL the page was fetched from
+            response: Response object
+
+        Returns:
+            Tuple of (list of text chunks, metadata dict)
+        """
+        try:
+            # Boilerplate is dropped and parsing stops at the content limit
+            extracted = extract_text(
+                response.content,
+                max_chars=MAX_CONTENT_LENGTH,
+                encoding=charset_from_content_type(response.headers.get("Content-Type"))
+            )
+            text = self._clean_text(extracted.text)
 
             # Truncate if too long
-            if len(text) > MAX_CONTENT_LENGTH:
+            if extracted.truncated or len(text) > MAX_CONTENT_LENGTH:
                 text = text[:MAX_CONTENT_LENGTH]
                 logger.warning(
-                    f"URL content truncated from {original_length} to "
-                    f"{MAX_CONTENT_LENGTH} characters"
+                    f"URL content truncated to {MAX_CONTENT_LENGTH} characters"
                 )
 
             if not text.strip():
@@ -224,10 +487,7 @@ class DocumentProcessor:
                 }
 
             chunks = self.text_splitter.split_text(text)
-
-            # Extract title
-            title = soup.find("title")
-            title_text = title.get_text().strip() if title else url
+            title_text = extracted.title or url
 
             logger.info(
                 f"URL processed: {title_text[:50]}..., "
@@ -256,16 +516,9 @@ class DocumentProcessor:
             text: Raw text to clean
 
         Returns:
-            Cleaned text
+            Cleaned text, with paragraphs separated by blank lines
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove excessive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        # Strip leading/trailing whitespace
-        text = text.strip()
-
-        return text
+        return normalize_whitespace(text)
 
     def chunk_text(self, text: str) -> List[str]:
         """
@@ -283,6 +536,25 @@ class DocumentProcessor:
         return chunks
 
 
+def normalize_whitespace(text: str) -> str:
+    """
+    Collapse whitespace while keeping paragraph breaks.
+
+    Whitespace runs within a paragraph become one space, and any run of
+    blank lines between paragraphs becomes a single blank line, the
+    splitter's strongest boundary.  A single pass over the text; it works
+    on any piece of a document, so pages are normalized one at a time.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text without leading or trailing whitespace
+    """
+    paragraphs = (" ".join(p.split()) for p in PARAGRAPH_BREAK.split(text))
+    return "\n\n".join(p for p in paragraphs if p)
+
+
 def process_document(source: str) -> Tuple[List[str], Dict[str, Any]]:
     """
     Process a document from a file path or URL.
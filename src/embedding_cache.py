@@ -0,0 +1,232 @@
+"""
+Embedding Cache Module
+Persistent, content-addressed cache of embedding vectors.
+
+Each entry is keyed by a hash of (model name, normalized text), so the
+same chunk or question is only ever encoded once per model.  Vectors live
+in a fixed-capacity, memory-mapped ``.npy`` file (float32, or float16 to
+halve its size); a small index
+maps keys to slots in least-recently-used order and evicts the oldest
+entry once the cache is full.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+VECTORS_FILE = "vectors.npy"
+INDEX_FILE = "index.npz"
+KEY_SIZE = 16  # bytes of blake2b digest
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for hashing: NFC form with collapsed whitespace."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """Size-bounded LRU cache of embeddings backed by a memory-mapped file."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        model_name: str,
+        dimension: int,
+        max_entries: int,
+        dtype: str = "float32"
+    ):
+        """
+        Open (or create) the cache stored in ``cache_dir``.
+
+        Args:
+            cache_dir: Directory holding the vector and index files
+            model_name: Embedding model name, part of every key
+            dimension: Embedding dimension of the model
+            max_entries: Maximum number of cached vectors
+            dtype: Storage dtype of the vectors, ``float32`` or ``float16``
+        """
+        self.cache_dir = Path(cache_dir)
+        self.model_name = model_name
+        self.dimension = dimension
+        self.max_entries = max_entries
+        self.dtype = np.dtype(dtype)
+
+        self._lock = threading.Lock()
+        self._slots: "OrderedDict[bytes, int]" = OrderedDict()
+        self._dirty = False
+
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._vectors = self._open()
+
+        logger.info(
+            f"Embedding cache ready at {self.cache_dir} "
+            f"({len(self._slots)}/{self.max_entries} entries)"
+        )
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _open(self) -> np.memmap:
+        """Map the vector file, discarding it if it no longer fits the settings."""
+        vectors_path = self.cache_dir / VECTORS_FILE
+        index_path = self.cache_dir / INDEX_FILE
+        shape = (self.max_entries, self.dimension)
+
+        if vectors_path.exists() and index_path.exists():
+            try:
+                vectors = np.lib.format.open_memmap(vectors_path, mode="r+")
+                with np.load(index_path) as index:
+                    meta = json.loads(str(index["meta"]))
+                    keys, slots = index["keys"], index["slots"]
+                if (
+                    vectors.shape == shape
+                    and vectors.dtype == self.dtype
+                    and meta.get("model") == self.model_name
+                ):
+                    self._slots = OrderedDict(
+                        (k.tobytes(), int(s)) for k, s in zip(keys, slots)
+                    )
+                    return vectors
+                logger.info("Embedding cache settings changed; rebuilding cache")
+                del vectors
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Embedding cache unreadable, rebuilding: {e}")
+
+        self._slots = OrderedDict()
+        self._dirty = True
+        # The file is sparse until slots are written
+        return np.lib.format.open_memmap(
+            vectors_path, mode="w+", dtype=self.dtype, shape=shape
+        )
+
+    def flush(self) -> None:
+        """
+        Write pending vectors and the LRU index to disk.
+
+        Called after every insertion; recency updates from lookups alone
+        are persisted with the next insertion or explicit flush.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            keys = np.frombuffer(b"".join(self._slots), dtype=np.uint8).reshape(-1, KEY_SIZE)
+            slots = np.fromiter(self._slots.values(), dtype=np.int32, count=len(self._slots))
+            meta = json.dumps({"model": self.model_name, "dimension": self.dimension})
+
+            index_path = self.cache_dir / INDEX_FILE
+            tmp_path = index_path.with_suffix(".tmp")
+            try:
+                self._vectors.flush()
+                with open(tmp_path, "wb") as fh:
+                    np.savez(fh, keys=keys, slots=slots, meta=np.array(meta))
+                os.replace(tmp_path, index_path)
+            except OSError as e:
+                logger.warning(f"Failed to write embedding cache index: {e}")
+                return
+            self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Lookup and insertion
+    # ------------------------------------------------------------------
+
+    def key(self, text: str) -> bytes:
+        """Content address of ``text`` under this cache's model."""
+        digest = hashlib.blake2b(digest_size=KEY_SIZE)
+        digest.update(self.model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalize_text(text).encode("utf-8"))
+        return digest.digest()
+
+    def get_many(self, texts: Sequence[str]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Look up embeddings for ``texts``.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Tuple of (float32 array with one row per text, positions of
+            texts that were not cached; their rows are zero).  Vectors
+            stored as float16 are widened on the way out.
+        """
+        result = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        missing: List[int] = []
+
+        with self._lock:
+            for i, text in enumerate(texts):
+                key = self.key(text)
+                slot = self._slots.get(key)
+                if slot is None:
+                    missing.append(i)
+                    continue
+                result[i] = self._vectors[slot]
+                self._slots.move_to_end(key)
+            self._dirty = self._dirty or len(missing) < len(texts)
+
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        return result, missing
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Cached embedding for a single text, or None."""
+        vectors, missing = self.get_many([text])
+        return None if missing else vectors[0]
+
+    def put_many(self, texts: Sequence[str], embeddings: np.ndarray) -> None:
+        """
+        Store embeddings, evicting least-recently-used entries when full.
+
+        Args:
+            texts: Texts that were embedded
+            embeddings: Array with one row per text
+        """
+        embeddings = np.asarray(embeddings, dtype=self.dtype)
+
+        with self._lock:
+            for text, vector in zip(texts, embeddings):
+                key = self.key(text)
+                slot = self._slots.get(key)
+                if slot is None:
+                    slot = self._free_slot()
+                self._vectors[slot] = vector
+                self._slots[key] = slot
+                self._slots.move_to_end(key)
+            self._dirty = True
+
+        self.flush()
+
+    def _free_slot(self) -> int:
+        """Next unused slot, evicting the least recently used entry if full."""
+        if len(self._slots) < self.max_entries:
+            return len(self._slots)
+        _, slot = self._slots.popitem(last=False)
+        return slot
+
+    def clear(self) -> None:
+        """Drop every cached embedding."""
+        with self._lock:
+            self._slots.clear()
+            self._dirty = True
+        self.flush()
+        logger.info("Embedding cache cleared")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, text: str) -> bool:
+        return self.key(text) in self._slots
@@ -1,13 +1,34 @@
 """
 Embeddings Module
 Handles text embedding generation using sentence-transformers.
+Previously seen texts are served from a persistent embedding cache.
+
+Texts are encoded longest-first in fixed-size batches, so each batch pads
+to similar lengths and memory is bounded by the batch size.  Large
+requests can be spread over a multi-process pool (EMBEDDING_WORKERS).
+Embeddings stay NumPy arrays all the way to the vector store.
 """
 
+import atexit
+import inspect
 from sentence_transformers import SentenceTransformer
-from typing import List, Union
+from typing import List, Optional, Union
 import numpy as np
 
-from config.settings import EMBEDDING_MODEL
+from config.settings import (
+    EMBEDDING_MODEL,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_WORKERS,
+    EMBEDDING_POOL_MIN_TEXTS,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_DIR,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    EMBEDDING_STORAGE_DTYPE
+)
+from src.embedding_cache import EmbeddingCache
+from src.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class EmbeddingGenerator:
@@ -15,6 +36,8 @@ class EmbeddingGenerator:
 
     _instance = None
     _model = None
+    _cache = None
+    _pool = None
 
     def __new__(cls):
         """Singleton pattern to avoid loading model multiple times."""
@@ -26,29 +49,132 @@ class EmbeddingGenerator:
         """Initialize the embedding model."""
         if self._model is None:
             self._model = SentenceTransformer(EMBEDDING_MODEL)
+            if EMBEDDING_CACHE_ENABLED:
+                EmbeddingGenerator._cache = EmbeddingCache(
+                    EMBEDDING_CACHE_DIR,
+                    EMBEDDING_MODEL,
+                    self.dimension,
+                    EMBEDDING_CACHE_MAX_ENTRIES,
+                    EMBEDDING_STORAGE_DTYPE
+                )
+
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension of the loaded model."""
+        return self._model.get_sentence_embedding_dimension()
+
+    def start_pool(self, workers: Optional[int] = None) -> None:
+        """
+        Start a multi-process encoding pool on CPU.
+
+        Args:
+            workers: Number of worker processes (defaults to EMBEDDING_WORKERS)
+        """
+        if EmbeddingGenerator._pool is not None:
+            return
+        workers = workers or EMBEDDING_WORKERS
+        logger.info(f"Starting embedding pool with {workers} workers")
+        EmbeddingGenerator._pool = self._model.start_multi_process_pool(
+            target_devices=["cpu"] * workers
+        )
+        atexit.register(self.stop_pool)
+
+    def stop_pool(self) -> None:
+        """Stop the multi-process encoding pool, if running."""
+        if EmbeddingGenerator._pool is None:
+            return
+        self._model.stop_multi_process_pool(EmbeddingGenerator._pool)
+        EmbeddingGenerator._pool = None
+        logger.info("Embedding pool stopped")
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Run the model on one batch of texts."""
+        return self._model.encode(
+            texts,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+
+    def _encode_pooled(self, texts: List[str]) -> np.ndarray:
+        """Spread ``texts`` over the multi-process pool."""
+        chunk_size = max(EMBEDDING_BATCH_SIZE, -(-len(texts) // (4 * EMBEDDING_WORKERS)))
+        # sentence-transformers >= 5 accepts the pool in encode() directly
+        if "pool" in inspect.signature(self._model.encode).parameters:
+            return self._model.encode(
+                texts,
+                pool=EmbeddingGenerator._pool,
+                batch_size=EMBEDDING_BATCH_SIZE,
+                chunk_size=chunk_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+        return self._model.encode_multi_process(
+            texts,
+            EmbeddingGenerator._pool,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            chunk_size=chunk_size
+        )
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts longest-first in bounded batches.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            float32 array with one row per text, in input order
+        """
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        if not texts:
+            return embeddings
+
+        # Longest first: batches pad to similar lengths, and memory peaks early
+        order = np.argsort([-len(t) for t in texts], kind="stable")
+
+        if EMBEDDING_WORKERS > 1 and len(texts) >= EMBEDDING_POOL_MIN_TEXTS:
+            self.start_pool()
+            embeddings[order] = self._encode_pooled([texts[i] for i in order])
+            return embeddings
+
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            batch = order[start:start + EMBEDDING_BATCH_SIZE]
+            embeddings[batch] = self._encode_batch([texts[i] for i in batch])
+
+        return embeddings
 
     def generate(self, text: Union[str, List[str]]) -> np.ndarray:
         """
         Generate embeddings for text or list of texts.
 
+        Cached texts are not re-encoded; the model only sees the distinct
+        texts missing from the cache, and their embeddings are stored.
+
         Args:
             text: Single string or list of strings to embed
 
         Returns:
-            numpy array of embeddings
+            float32 numpy array of embeddings
         """
         if isinstance(text, str):
             text = [text]
 
-        embeddings = self._model.encode(
-            text,
-            convert_to_numpy=True,
-            show_progress_bar=False
-        )
+        if self._cache is None:
+            return self._encode(text)
+
+        embeddings, missing = self._cache.get_many(text)
+        if missing:
+            pending = list(dict.fromkeys(text[i] for i in missing))
+            encoded = self._encode(pending)
+            self._cache.put_many(pending, encoded)
+            rows = {t: row for t, row in zip(pending, encoded)}
+            for i in missing:
+                embeddings[i] = rows[text[i]]
 
         return embeddings
 
-    def generate_single(self, text: str) -> List[float]:
+    def generate_single(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
 
@@ -56,12 +182,11 @@ class EmbeddingGenerator:
             text: String to embed
 
         Returns:
-            List of floats representing the embedding
+            1-D float32 array (a view into the batch result, not a copy)
         """
-        embedding = self.generate(text)
-        return embedding[0].tolist()
+        return self.generate(text)[0]
 
-    def generate_batch(self, texts: List[str]) -> List[List[float]]:
+    def generate_batch(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for a batch of texts.
 
@@ -69,20 +194,19 @@ class EmbeddingGenerator:
             texts: List of strings to embed
 
         Returns:
-            List of embeddings (each embedding is a list of floats)
+            float32 array of shape (len(texts), dimension)
         """
-        embeddings = self.generate(texts)
-        return embeddings.tolist()
+        return self.generate(texts)
 
 
 # Convenience function for quick embedding generation
-def get_embedding(text: str) -> List[float]:
+def get_embedding(text: str) -> np.ndarray:
     """Generate embedding for a single text."""
     generator = EmbeddingGenerator()
     return generator.generate_single(text)
 
 
-def get_embeddings(texts: List[str]) -> List[List[float]]:
+def get_embeddings(texts: List[str]) -> np.ndarray:
     """Generate embeddings for multiple texts."""
     generator = EmbeddingGenerator()
     return generator.generate_batch(texts)
@@ -0,0 +1,246 @@
+"""
+HTML Extractor Module
+Streaming HTML-to-text extraction for web pages.
+
+The page is tokenized incrementally and its text collected as it streams
+past, without building a document tree.  Boilerplate elements (scripts,
+styles, navigation, page headers and footers) are skipped while
+tokenizing, block-level elements become line breaks, and feeding stops as
+soon as ``max_chars`` of text have been collected, so the rest of a huge
+page is never parsed.
+
+Two tokenizers are available: the standard library's ``html.parser`` and,
+when installed, lxml's libxml2-based parser, which is several times faster.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+from config.settings import HTML_PARSER
+from src.logger import get_logger
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional
+    etree = None
+
+logger = get_logger(__name__)
+
+PARSERS = ("auto", "lxml", "html.parser")
+
+# Elements whose content is never part of the page text
+SKIP_TAGS = frozenset({
+    "script", "style", "noscript", "template", "nav", "header", "footer"
+})
+
+# Elements that start a new line of text
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl",
+    "dt", "figcaption", "figure", "h1", "h2", "h3", "h4", "h5", "h6", "hr",
+    "li", "main", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul"
+})
+
+# Embedded SVG and MathML, whose <title> elements label graphics, not the page
+FOREIGN_TAGS = frozenset({"svg", "math"})
+
+FEED_SIZE = 64 * 1024  # characters handed to the tokenizer at a time
+
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+_HEADER_CHARSET = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+
+
+class ExtractedText(NamedTuple):
+    """Text of a web page."""
+    title: str
+    text: str
+    truncated: bool
+
+
+class _TextCollector:
+    """Tokenizer callbacks that collect a page's title and visible text."""
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.parts: List[str] = []
+        self.title_parts: List[str] = []
+        self.length = 0  # whitespace-collapsed length of the collected text
+        self.done = False
+        self._skipping: List[str] = []
+        self._in_title = False
+        self._title_seen = False
+        self._in_body = False
+        self._foreign_depth = 0
+
+    def start(self, tag: str, attrs=None) -> None:
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skipping.append(tag)
+        elif tag == "title" and not (self._title_seen or self._in_body or self._foreign_depth):
+            # Only the document title, as opposed to later or embedded ones
+            self._in_title = True
+        elif tag in FOREIGN_TAGS:
+            self._foreign_depth += 1
+        elif tag == "body":
+            self._in_body = True
+        elif tag in BLOCK_TAGS and not self.done:
+            self.parts.append("\n")
+
+    def end(self, tag: str) -> None:
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            if tag in self._skipping:
+                # Close the element and anything left open inside it
+                while self._skipping.pop() != tag:
+                    pass
+        elif tag == "title" and self._in_title:
+            self._in_title = False
+            self._title_seen = True
+        elif tag in FOREIGN_TAGS:
+            self._foreign_depth = max(self._foreign_depth - 1, 0)
+        elif tag in BLOCK_TAGS and not self.done:
+            self.parts.append("\n")
+
+    def data(self, text: str) -> None:
+        if self.done or self._skipping:
+            return
+        if self._in_title:
+            self.title_parts.append(text)
+            return
+        self.parts.append(text)
+        words = text.split()
+        if words:
+            separators = len(words) if self.length else len(words) - 1
+            self.length += sum(len(w) for w in words) + separators
+            self.done = self.length > self.max_chars
+
+    def comment(self, text: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def result(self) -> ExtractedText:
+        return ExtractedText(
+            title=" ".join("".join(self.title_parts).split()),
+            text="".join(self.parts),
+            truncated=self.done
+        )
+
+
+class _StdlibTokenizer(HTMLParser):
+    """``html.parser`` tokenizer forwarding events to a collector."""
+
+    def __init__(self, collector: _TextCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag not in SKIP_TAGS:
+            self.collector.start(tag)
+        if tag in FOREIGN_TAGS:
+            self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
+def lxml_available() -> bool:
+    """Whether the lxml tokenizer can be used."""
+    return etree is not None
+
+
+def resolve_parser(parser: Optional[str] = None) -> str:
+    """
+    Pick the tokenizer for a parser setting.
+
+    Args:
+        parser: ``auto``, ``lxml`` or ``html.parser`` (defaults to HTML_PARSER)
+
+    Returns:
+        ``lxml`` or ``html.parser``
+    """
+    parser = parser or HTML_PARSER
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown HTML parser '{parser}', expected one of {PARSERS}")
+    if parser == "html.parser":
+        return parser
+    if lxml_available():
+        return "lxml"
+    if parser == "lxml":
+        logger.warning("lxml is not installed, falling back to html.parser")
+    return "html.parser"
+
+
+def _tokenizer(parser: str, collector: _TextCollector) -> Tuple[Callable, Callable]:
+    """(feed, close) functions of a tokenizer driving ``collector``."""
+    if parser == "lxml":
+        tokenizer = etree.HTMLParser(target=collector, recover=True)
+    else:
+        tokenizer = _StdlibTokenizer(collector)
+    return tokenizer.feed, tokenizer.close
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """Charset declared in a ``Content-Type`` header, if any."""
+    match = _HEADER_CHARSET.search(content_type or "")
+    return match.group(1) if match else None
+
+
+def decode_html(body: bytes, encoding: Optional[str] = None) -> str:
+    """
+    Decode an HTML body.
+
+    Uses ``encoding`` (e.g. from the Content-Type header), else a
+    ``<meta charset>`` near the start of the document, else UTF-8.
+    Undecodable bytes are replaced rather than raising.
+    """
+    if not encoding:
+        match = _META_CHARSET.search(body[:4096])
+        encoding = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        logger.debug(f"Unknown charset '{encoding}', decoding as UTF-8")
+        return body.decode("utf-8", errors="replace")
+
+
+def extract_text(
+    html: Union[bytes, str],
+    max_chars: int,
+    parser: Optional[str] = None,
+    encoding: Optional[str] = None
+) -> ExtractedText:
+    """
+    Extract the title and visible text of an HTML page.
+
+    Args:
+        html: Page source, as bytes or text
+        max_chars: Stop once this much text (whitespace collapsed) is collected
+        parser: ``auto``, ``lxml`` or ``html.parser`` (defaults to HTML_PARSER)
+        encoding: Charset of ``html`` if it is bytes and the charset is known
+
+    Returns:
+        ExtractedText with the title, the raw text (block elements on
+        separate lines) and whether the text was cut short
+    """
+    if isinstance(html, bytes):
+        html = decode_html(html, encoding)
+
+    collector = _TextCollector(max_chars)
+    feed, close = _tokenizer(resolve_parser(parser), collector)
+
+    for start in range(0, len(html), FEED_SIZE):
+        feed(html[start:start + FEED_SIZE])
+        if collector.done:
+            logger.debug(f"Stopped parsing at {start + FEED_SIZE} of {len(html)} characters")
+            break
+    close()
+
+    return collector.result()
@@ -0,0 +1,129 @@
+"""
+HTTP Cache Module
+On-disk store of HTTP validators for ingested URL sources.
+
+For every URL whose content is in the knowledge base the cache keeps the
+``ETag`` and ``Last-Modified`` response headers and a hash of the body.
+Refreshing a URL sends them back as ``If-None-Match`` and
+``If-Modified-Since``; a ``304 Not Modified`` response, or a body with the
+same hash, means the stored chunks are still current and the page need not
+be parsed or embedded again.  Entries are only recorded once a page's
+chunks have been stored, so the cache never claims content the knowledge
+base does not have.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILE = "validators.json"
+
+
+def content_hash(body: bytes) -> str:
+    """Hash of a response body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class HTTPCache:
+    """Validators of ingested URLs, persisted as one JSON file."""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Open (or create) the cache stored in ``cache_dir``.
+
+        Args:
+            cache_dir: Directory holding the cache file
+        """
+        self.path = Path(cache_dir) / CACHE_FILE
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        logger.debug(f"HTTP cache ready at {self.path} ({len(self._entries)} URLs)")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file, starting empty if it is missing or corrupt."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable HTTP cache {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        """Write the cache file atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Failed to write HTTP cache {self.path}: {e}")
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for a URL, or None."""
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """``If-None-Match``/``If-Modified-Since`` headers for a URL."""
+        entry = self.get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(
+        self,
+        url: str,
+        body_hash: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Record the version of a URL whose content has been stored.
+
+        Args:
+            url: Source URL
+            body_hash: content_hash() of the response body
+            etag: ``ETag`` response header, if any
+            last_modified: ``Last-Modified`` response header, if any
+        """
+        with self._lock:
+            self._entries[url] = {
+                "content_hash": body_hash,
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": datetime.now().isoformat()
+            }
+            self._save()
+
+    def discard(self, url: str) -> None:
+        """Forget a URL."""
+        with self._lock:
+            if self._entries.pop(url, None) is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """Forget every URL."""
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
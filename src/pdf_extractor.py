@@ -0,0 +1,187 @@
+"""
+PDF Extractor Module
+Per-page PDF text extraction, sequential or across a process pool.
+
+Two engines are available: ``pdfplumber`` (layout-aware, the default) and
+``pypdf``, a much faster text-only path for PDFs without complex layout.
+For large documents the page range is split into contiguous blocks that
+worker processes extract independently, with at most
+BLOCKS_IN_FLIGHT_PER_WORKER blocks per worker submitted or waiting to be
+consumed; results are yielded strictly in page order.  In-process
+extraction yields each page as soon as it is extracted.  A page that fails to extract is reported and skipped without
+affecting the rest of the document.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import pdfplumber
+
+from config.settings import (
+    PDF_EXTRACTOR,
+    PDF_EXTRACTION_WORKERS,
+    PDF_PARALLEL_MIN_PAGES
+)
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXTRACTORS = ("pdfplumber", "pypdf")
+BLOCKS_IN_FLIGHT_PER_WORKER = 2
+
+# (page number starting at 1, extracted text or None, error message or None)
+PageResult = Tuple[int, Optional[str], Optional[str]]
+
+
+def _pdf_reader(path: Path):
+    """Open a PDF with pypdf, falling back to its predecessor PyPDF2."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        from PyPDF2 import PdfReader
+    return PdfReader(str(path))
+
+
+def count_pages(path: Path, extractor: str = PDF_EXTRACTOR) -> int:
+    """Number of pages in a PDF."""
+    if extractor == "pypdf":
+        return len(_pdf_reader(path).pages)
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_page(page_num: int, page, extractor: str) -> PageResult:
+    """Extract one page, capturing failures instead of raising."""
+    try:
+        return page_num, page.extract_text() or None, None
+    except Exception as e:
+        return page_num, None, str(e)
+    finally:
+        if extractor == "pdfplumber":
+            page.close()  # release pdfplumber's per-page object cache
+
+
+def iter_page_range(
+    path: Path,
+    start: int = 0,
+    stop: Optional[int] = None,
+    extractor: str = PDF_EXTRACTOR
+) -> Iterator[PageResult]:
+    """
+    Yield pages ``start`` to ``stop`` (0-based, exclusive) of a PDF as
+    each is extracted.
+
+    Args:
+        path: Path to the PDF file
+        start: First page index
+        stop: Page index to stop before (None for the last page)
+        extractor: ``pdfplumber`` or ``pypdf``
+
+    Yields:
+        One PageResult per page, in page order
+    """
+    if extractor == "pypdf":
+        pages = _pdf_reader(path).pages
+        stop = len(pages) if stop is None else stop
+        for i in range(start, stop):
+            yield _extract_page(i + 1, pages[i], extractor)
+        return
+
+    with pdfplumber.open(path) as pdf:
+        stop = len(pdf.pages) if stop is None else stop
+        for i in range(start, stop):
+            yield _extract_page(i + 1, pdf.pages[i], extractor)
+
+
+def extract_page_range(
+    path: Path,
+    start: int = 0,
+    stop: Optional[int] = None,
+    extractor: str = PDF_EXTRACTOR
+) -> List[PageResult]:
+    """
+    Extract a block of pages as a list; the task run by worker processes.
+
+    Runs in worker processes, so it opens the file itself.  Arguments are
+    those of iter_page_range.
+
+    Returns:
+        One PageResult per page, in page order
+    """
+    return list(iter_page_range(path, start, stop, extractor))
+
+
+def _page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split pages into contiguous blocks, a few per worker to balance load."""
+    size = max(1, -(-page_count // (workers * 4)))
+    return [(s, min(s + size, page_count)) for s in range(0, page_count, size)]
+
+
+def iter_pages(
+    path: Path,
+    extractor: Optional[str] = None,
+    workers: Optional[int] = None
+) -> Iterator[PageResult]:
+    """
+    Yield extracted pages of a PDF in page order.
+
+    Documents with at least PDF_PARALLEL_MIN_PAGES pages are spread over
+    ``workers`` processes; smaller ones are extracted in-process.
+
+    Args:
+        path: Path to the PDF file
+        extractor: ``pdfplumber`` or ``pypdf`` (defaults to PDF_EXTRACTOR)
+        workers: Worker processes (defaults to PDF_EXTRACTION_WORKERS)
+
+    Yields:
+        PageResult tuples
+    """
+    extractor = extractor or PDF_EXTRACTOR
+    workers = workers or PDF_EXTRACTION_WORKERS
+    if extractor not in EXTRACTORS:
+        raise ValueError(f"Unknown PDF extractor '{extractor}', expected one of {EXTRACTORS}")
+
+    if workers <= 1:
+        yield from iter_page_range(path, extractor=extractor)
+        return
+
+    page_count = count_pages(path, extractor)
+    if page_count < PDF_PARALLEL_MIN_PAGES:
+        yield from iter_page_range(path, extractor=extractor)
+        return
+
+    ranges = _page_ranges(page_count, workers)
+    logger.debug(
+        f"Extracting {page_count} pages with {workers} workers "
+        f"in {len(ranges)} blocks ({extractor})"
+    )
+
+    # Spawned, not forked: the pool is created while other threads (such as
+    # the embedding stage) are running, and forking those can deadlock
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        blocks = iter(ranges)
+        in_flight = deque()
+
+        def submit_next() -> None:
+            block = next(blocks, None)
+            if block is not None:
+                future = executor.submit(extract_page_range, path, *block, extractor)
+                in_flight.append((block, future))
+
+        for _ in range(workers * BLOCKS_IN_FLIGHT_PER_WORKER):
+            submit_next()
+
+        while in_flight:
+            (start, stop), future = in_flight.popleft()
+            submit_next()  # keep the workers busy while this block is consumed
+            try:
+                results = future.result()
+            except Exception as e:
+                # A crashed worker loses only its own block
+                results = [(page_num, None, str(e)) for page_num in range(start + 1, stop + 1)]
+            yield from results
@@ -0,0 +1,166 @@
+"""
+Query Cache Module
+In-process cache of recent retrieval results.
+
+A research session often repeats or rephrases a question.  Results are
+cached together with the query's embedding: an identical query (after
+whitespace normalization) is answered without embedding it, and a query
+whose embedding is at least ``threshold`` cosine-similar to a cached one
+is answered without searching the vector store.
+
+Entries expire after ``ttl`` seconds and are tagged with the vector
+store's version; once the store changes, every entry is dropped.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.embedding_cache import normalize_text
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+Results = List[Dict[str, Any]]
+
+
+class _Entry(NamedTuple):
+    embedding: np.ndarray  # unit length
+    results: Results
+    created: float
+
+
+class QueryCache:
+    """Size-bounded LRU cache of retrieval results keyed by query."""
+
+    def __init__(self, max_entries: int, ttl: float, threshold: float):
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached queries
+            ttl: Seconds a result may be reused
+            threshold: Minimum cosine similarity for reusing another
+                query's results
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, int], _Entry]" = OrderedDict()
+        self._version = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def _sync(self, version: Any) -> None:
+        """Drop every entry if the store changed, and expired entries."""
+        if version != self._version:
+            if self._entries:
+                logger.debug(f"Vector store changed, dropping {len(self._entries)} cached queries")
+            self._entries.clear()
+            self._version = version
+            return
+
+        cutoff = time.monotonic() - self.ttl
+        expired = [key for key, entry in self._entries.items() if entry.created < cutoff]
+        for key in expired:
+            del self._entries[key]
+
+    def get(self, query: str, top_k: int, version: Any) -> Optional[Results]:
+        """
+        Results cached for this exact query.
+
+        Args:
+            query: Search query text
+            top_k: Number of results requested
+            version: Current vector store version
+
+        Returns:
+            Cached results, or None
+        """
+        key = (normalize_text(query), top_k)
+        with self._lock:
+            self._sync(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry.results)
+
+    def get_similar(self, embedding: np.ndarray, top_k: int, version: Any) -> Optional[Results]:
+        """
+        Results cached for the most similar query above the threshold.
+
+        Args:
+            embedding: Embedding of the search query
+            top_k: Number of results requested
+            version: Current vector store version
+
+        Returns:
+            Cached results, or None
+        """
+        query = _unit(embedding)
+        with self._lock:
+            self._sync(version)
+            keys = [key for key in self._entries if key[1] == top_k]
+            if not keys:
+                self.misses += 1
+                return None
+
+            similarities = np.stack([self._entries[key].embedding for key in keys]) @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            logger.debug(f"Reusing results of a similar query (cosine {similarities[best]:.3f})")
+            self._entries.move_to_end(keys[best])
+            self.hits += 1
+            return list(self._entries[keys[best]].results)
+
+    def put(
+        self,
+        query: str,
+        embedding: np.ndarray,
+        top_k: int,
+        version: Any,
+        results: Results
+    ) -> None:
+        """
+        Cache the results of a search.
+
+        Args:
+            query: Search query text
+            embedding: Embedding of the query
+            top_k: Number of results requested
+            version: Vector store version the search ran against
+            results: Search results
+        """
+        with self._lock:
+            self._sync(version)
+            key = (normalize_text(query), top_k)
+            self._entries[key] = _Entry(_unit(embedding), list(results), time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _unit(embedding: np.ndarray) -> np.ndarray:
+    """Embedding scaled to unit length, as float32."""
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
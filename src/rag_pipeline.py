@@ -1,18 +1,74 @@
 """
 RAG Pipeline Module
 Orchestrates the retrieval-augmented generation process.
-"""
 
-from typing import List, Dict, Any, Optional, Tuple
+PDFs are ingested as a stream: pages are extracted, cleaned and split in
+one worker thread, chunk batches are embedded in another, and the calling
+thread stores each embedded batch as soon as it is ready.  Bounded queues
+between the stages keep memory flat for documents of any length, and
+chunks become searchable batch by batch.  Batches of URLs are fetched
+concurrently in the background while pages that already arrived are
+embedded and stored.  URLs already in the knowledge base are revalidated
+with conditional requests and skipped when unchanged.
+
+Chunk IDs are content hashes, so re-ingesting a source only embeds the
+chunks that changed; the rest keep their stored vectors.
+
+Retrieval goes through a query cache, so repeated or rephrased questions
+skip the embedding call and/or the vector search until the store changes.
+With reranking enabled, more candidates are retrieved and a cross-encoder
+keeps the few most relevant ones.  The retrieved chunks are packed into a
+token budget before they are sent to Claude.
+"""
 
-from src.vector_store import VectorStore
+from dataclasses import dataclass
+from functools import partial
+from typing import List, Dict, Any, Callable, Iterable, Optional, Set, Tuple
+
+from config.settings import (
+    CONTEXT_TOKEN_BUDGET,
+    INGEST_BATCH_SIZE,
+    INGEST_QUEUE_SIZE,
+    QUERY_CACHE_ENABLED,
+    QUERY_CACHE_MAX_ENTRIES,
+    QUERY_CACHE_SIMILARITY,
+    QUERY_CACHE_TTL,
+    RERANK_ENABLED,
+    RERANK_CANDIDATES,
+    RERANK_TOP_K,
+    TOP_K_RESULTS
+)
+from src.vector_store import ChunkIdGenerator, VectorStore
+from src.context_packer import pack_excerpts
 from src.document_processor import DocumentProcessor
 from src.logger import get_logger
+from src.query_cache import QueryCache
+from src.reranker import Reranker
+from src.utils.pipeline import background, batched
 from config.prompts import CONTEXT_TEMPLATE, NO_CONTEXT_TEMPLATE, SOURCE_CITATION_FORMAT
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class IngestProgress:
+    """Progress of a streaming ingestion, reported after each stored batch."""
+    source: str
+    chunks_stored: int
+    pages_read: int
+    page_count: int
+
+    @property
+    def fraction(self) -> float:
+        """Share of the document's pages processed so far."""
+        if not self.page_count:
+            return 0.0
+        return min(self.pages_read / self.page_count, 1.0)
+
+
+ProgressCallback = Callable[[IngestProgress], None]
+
+
 class RAGPipeline:
     """RAG pipeline for document ingestion and retrieval."""
 
@@ -21,22 +77,32 @@ class RAGPipeline:
         logger.info("Initializing RAG Pipeline")
         self.vector_store = VectorStore()
         self.document_processor = DocumentProcessor()
+        self.query_cache = QueryCache(
+            QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_TTL, QUERY_CACHE_SIMILARITY
+        ) if QUERY_CACHE_ENABLED else None
+        self.reranker = Reranker() if RERANK_ENABLED else None
         logger.debug("RAG Pipeline components initialized")
 
-    def ingest_pdf(self, file_path: str) -> Dict[str, Any]:
+    def ingest_pdf(
+        self,
+        file_path: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """
         Ingest a PDF document into the knowledge base.
 
         Args:
             file_path: Path to the PDF file
+            progress_callback: Optional callable receiving IngestProgress
+                after each stored batch
 
         Returns:
             Ingestion result with statistics
         """
         logger.info(f"Ingesting PDF: {file_path}")
         try:
-            chunks, metadata = self.document_processor.process_pdf(file_path)
-            result = self._ingest_chunks(chunks, metadata)
+            chunks, metadata = self.document_processor.stream_pdf(file_path)
+            result = self._ingest_stream(chunks, metadata, progress_callback)
             logger.info(
                 f"PDF ingestion complete: {result['source']}, "
                 f"chunks={result['chunks_created']}"
@@ -45,24 +111,32 @@ class RAGPipeline:
         except Exception as e:
             logger.error(f"Failed to ingest PDF {file_path}: {e}")
             raise
+        finally:
+            self.vector_store.flush()
 
-    def ingest_pdf_upload(self, uploaded_file, filename: str) -> Dict[str, Any]:
+    def ingest_pdf_upload(
+        self,
+        uploaded_file,
+        filename: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """
         Ingest an uploaded PDF file.
 
         Args:
             uploaded_file: Streamlit UploadedFile object
             filename: Name of the file
+            progress_callback: Optional callable receiving IngestProgress
+                after each stored batch
 
         Returns:
             Ingestion result with statistics
         """
         logger.info(f"Ingesting uploaded PDF: {filename}")
         try:
-            chunks, metadata = self.document_processor.process_pdf_upload(
-                uploaded_file, filename
-            )
-            result = self._ingest_chunks(chunks, metadata)
+            save_path = self.document_processor.save_upload(uploaded_file, filename)
+            chunks, metadata = self.document_processor.stream_pdf(str(save_path))
+            result = self._ingest_stream(chunks, metadata, progress_callback)
             logger.info(
                 f"Uploaded PDF ingestion complete: {result['source']}, "
                 f"chunks={result['chunks_created']}"
@@ -71,6 +145,8 @@ class RAGPipeline:
         except Exception as e:
             logger.error(f"Failed to ingest uploaded PDF {filename}: {e}")
             raise
+        finally:
+            self.vector_store.flush()
 
     def ingest_url(self, url: str) -> Dict[str, Any]:
         """
@@ -85,18 +161,10 @@ class RAGPipeline:
         logger.info(f"Ingesting URL: {url}")
         try:
             chunks, metadata = self.document_processor.process_url(url)
+            result = self._ingest_url_content(url, chunks, metadata)
+            if not result["success"]:
+                return result
 
-            if not chunks:
-                logger.warning(f"No content extracted from URL: {url}")
-                return {
-                    "success": False,
-                    "source": url,
-                    "type": "url",
-                    "chunks_created": 0,
-                    "error": "No content extracted"
-                }
-
-            result = self._ingest_chunks(chunks, metadata)
             logger.info(
                 f"URL ingestion complete: {url[:50]}..., "
                 f"chunks={result['chunks_created']}"
@@ -105,6 +173,134 @@ class RAGPipeline:
         except Exception as e:
             logger.error(f"Failed to ingest URL {url}: {e}")
             raise
+        finally:
+            self.vector_store.flush()
+
+    def ingest_urls(
+        self,
+        urls: List[str],
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Ingest many URLs, fetching them concurrently.
+
+        Pages are downloaded and parsed in a background pool (bounded per
+        host) and each parsed page is embedded and stored as soon as it
+        arrives.  A URL that fails does not stop the others.
+
+        Args:
+            urls: Web URLs to ingest
+            progress_callback: Optional callable receiving IngestProgress
+                after each URL, with ``pages_read``/``page_count`` counting
+                URLs
+
+        Returns:
+            Batch result with per-URL results in input order
+        """
+        urls = list(dict.fromkeys(urls))
+        logger.info(f"Ingesting {len(urls)} URLs")
+
+        parsed = background(
+            self.document_processor.process_urls(urls),
+            maxsize=INGEST_QUEUE_SIZE,
+            name="ingest-fetch"
+        )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        chunks_stored = 0
+        try:
+            for url, parsed_page, error in parsed:
+                if error is None:
+                    try:
+                        results[url] = self._ingest_url_content(url, *parsed_page)
+                    except Exception as e:
+                        error = e
+                if error is not None:
+                    logger.error(f"Failed to ingest URL {url}: {error}")
+                    results[url] = {
+                        "success": False,
+                        "source": url,
+                        "type": "url",
+                        "chunks_created": 0,
+                        "error": str(error)
+                    }
+
+                chunks_stored += results[url]["chunks_created"]
+                if progress_callback:
+                    progress_callback(IngestProgress(url, chunks_stored, len(results), len(urls)))
+        finally:
+            self.vector_store.flush()
+
+        succeeded = sum(1 for r in results.values() if r["success"])
+        not_modified = sum(1 for r in results.values() if r.get("not_modified"))
+        logger.info(
+            f"URL batch ingestion complete: {succeeded}/{len(urls)} succeeded "
+            f"({not_modified} not modified), chunks={chunks_stored}"
+        )
+        return {
+            "success": succeeded > 0,
+            "type": "url",
+            "urls": len(urls),
+            "succeeded": succeeded,
+            "failed": len(urls) - succeeded,
+            "not_modified": not_modified,
+            "chunks_created": chunks_stored,
+            "results": [results[url] for url in urls]
+        }
+
+    def refresh_url_sources(
+        self,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Revalidate every URL source in the knowledge base.
+
+        Unchanged pages cost a conditional request and nothing else; only
+        changed pages are parsed, and only their changed chunks embedded.
+
+        Args:
+            progress_callback: Optional callable receiving IngestProgress
+                after each URL
+
+        Returns:
+            Batch result as returned by ingest_urls
+        """
+        urls = [s["source"] for s in self.get_sources() if s["type"] == "url"]
+        logger.info(f"Refreshing {len(urls)} URL sources")
+        return self.ingest_urls(urls, progress_callback=progress_callback)
+
+    def _ingest_url_content(
+        self,
+        url: str,
+        chunks: List[str],
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Store the chunks of one processed URL and record its version."""
+        if metadata.get("not_modified"):
+            if self.vector_store.get_source_ids(url):
+                return {
+                    "success": True,
+                    "source": url,
+                    "type": "url",
+                    "chunks_created": 0,
+                    "not_modified": True
+                }
+            # Cached, but its chunks are gone from the store
+            logger.info(f"No stored chunks for cached URL, fetching in full: {url}")
+            chunks, metadata = self.document_processor.process_url(url, revalidate=False)
+
+        if not chunks:
+            logger.warning(f"No content extracted from URL: {url}")
+            return {
+                "success": False,
+                "source": url,
+                "type": "url",
+                "chunks_created": 0,
+                "error": "No content extracted"
+            }
+        result = self._ingest_chunks(chunks, metadata)
+        self.document_processor.remember_url(metadata)
+        return result
 
     def _ingest_chunks(
         self,
@@ -114,6 +310,9 @@ class RAGPipeline:
         """
         Ingest text chunks into the vector store.
 
+        Only chunks that are not already stored for the source are
+        embedded; chunks that disappeared from the source are deleted.
+
         Args:
             chunks: List of text chunks
             base_metadata: Base metadata for all chunks
@@ -132,6 +331,9 @@ class RAGPipeline:
             }
 
         logger.debug(f"Ingesting {len(chunks)} chunks")
+        source = base_metadata.get("source")
+        chunk_id = ChunkIdGenerator(source)
+        ids = [chunk_id(chunk) for chunk in chunks]
 
         # Create metadata for each chunk
         metadatas = []
@@ -143,40 +345,215 @@ class RAGPipeline:
 
         # Add to vector store
         try:
-            ids = self.vector_store.add_documents(chunks, metadatas)
-            logger.debug(f"Added {len(ids)} documents to vector store")
+            existing = self.vector_store.get_source_ids(source)
+            added = self._store_batch(ids, chunks, metadatas, existing)
+            stale = self._delete_stale(existing, ids)
+            logger.debug(f"Added {len(added)} documents to vector store")
         except Exception as e:
             logger.error(f"Failed to add documents to vector store: {e}")
             raise
 
         return {
             "success": True,
-            "source": base_metadata.get("source"),
+            "source": source,
             "type": base_metadata.get("type"),
             "chunks_created": len(chunks),
+            "chunks_added": len(added),
+            "chunks_unchanged": len(ids) - len(added),
+            "chunks_deleted": stale,
+            "ids": ids
+        }
+
+    def _store_batch(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        existing: Set[str],
+        embeddings: Optional[Any] = None
+    ) -> List[str]:
+        """
+        Add new chunks and refresh the metadata of already stored ones.
+
+        Args:
+            ids: Content-hash IDs of the chunks
+            texts: Chunk texts
+            metadatas: Full metadata for each chunk
+            existing: IDs already stored for the source
+            embeddings: Precomputed embeddings of the new chunks only
+
+        Returns:
+            IDs of the chunks that were added
+        """
+        new = [i for i, id_ in enumerate(ids) if id_ not in existing]
+        kept = [i for i, id_ in enumerate(ids) if id_ in existing]
+
+        # Update first: if it fails, nothing was added that the caller
+        # would not know to roll back
+        if kept:
+            self.vector_store.update_metadatas(
+                [ids[i] for i in kept], [metadatas[i] for i in kept]
+            )
+        added = []
+        if new:
+            added = [ids[i] for i in new]
+            self.vector_store.add_documents(
+                [texts[i] for i in new],
+                [metadatas[i] for i in new],
+                ids=added,
+                embeddings=embeddings
+            )
+        return added
+
+    def _delete_stale(self, existing: Set[str], ids: List[str]) -> int:
+        """Delete stored chunks that are no longer part of the source."""
+        stale = list(existing.difference(ids))
+        if stale:
+            logger.info(f"Deleting {len(stale)} chunks no longer in the source")
+            self.vector_store.delete_by_ids(stale)
+        return len(stale)
+
+    def _embed_batch(
+        self,
+        existing: Set[str],
+        batch: List[Tuple[str, str, int]]
+    ) -> Tuple[List[Tuple[str, str, int]], Any]:
+        """Embed the chunks of one (id, chunk, page) batch that are not yet stored."""
+        texts = [chunk for id_, chunk, _ in batch if id_ not in existing]
+        return batch, self.vector_store.embed_documents(texts) if texts else None
+
+    def _ingest_stream(
+        self,
+        chunks: Iterable[Tuple[str, int]],
+        base_metadata: Dict[str, Any],
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Embed and store a stream of chunks batch by batch.
+
+        Splitting and embedding run in background threads connected by
+        bounded queues, so extraction, embedding and storage overlap.
+        Chunks already stored for the source (same content-hash ID) are
+        not re-embedded, and chunks that vanished from it are deleted at
+        the end, once the new content is complete.  If any earlier stage
+        fails, the chunks added so far are removed again and the old
+        content is left in place.
+
+        Args:
+            chunks: (chunk, page number) pairs in document order
+            base_metadata: Base metadata for all chunks
+            progress_callback: Optional callable receiving IngestProgress
+
+        Returns:
+            Ingestion result with statistics
+        """
+        source = base_metadata.get("source")
+        page_count = base_metadata.get("page_count", 0)
+        existing = self.vector_store.get_source_ids(source)
+        chunk_id = ChunkIdGenerator(source)
+
+        batches = background(
+            batched(((chunk_id(c), c, page) for c, page in chunks), INGEST_BATCH_SIZE),
+            maxsize=INGEST_QUEUE_SIZE,
+            name="ingest-split"
+        )
+        embedded = background(
+            batches,
+            partial(self._embed_batch, existing),
+            maxsize=INGEST_QUEUE_SIZE,
+            name="ingest-embed"
+        )
+
+        ids: List[str] = []
+        added: List[str] = []
+        try:
+            for batch, embeddings in embedded:
+                metadatas = []
+                for i in range(len(batch)):
+                    chunk_metadata = base_metadata.copy()
+                    chunk_metadata["chunk_index"] = len(ids) + i
+                    metadatas.append(chunk_metadata)
+
+                batch_ids = [id_ for id_, _, _ in batch]
+                added.extend(self._store_batch(
+                    batch_ids, [c for _, c, _ in batch], metadatas, existing, embeddings
+                ))
+                ids.extend(batch_ids)
+                page_num = batch[-1][2]
+                logger.debug(f"Stored {len(ids)} chunks (page {page_num}/{page_count})")
+
+                if progress_callback:
+                    progress_callback(IngestProgress(source, len(ids), page_num, page_count))
+
+            # The total is only known once the stream is exhausted
+            for id_batch in batched(ids, INGEST_BATCH_SIZE * 16):
+                self.vector_store.update_metadatas(
+                    id_batch, [{"chunk_total": len(ids)}] * len(id_batch)
+                )
+        except Exception as e:
+            embedded.close()
+            logger.error(f"Streaming ingestion of {source} failed: {e}")
+            if added:
+                logger.info(f"Removing {len(added)} partially ingested chunks")
+                self.vector_store.delete_by_ids(added)
+            raise
+
+        # Last, outside the rollback: deleted chunks cannot be restored
+        stale = self._delete_stale(existing, ids)
+
+        if not ids:
+            logger.warning(f"No chunks to ingest from {source}")
+            return {
+                "success": False,
+                "source": source,
+                "type": base_metadata.get("type"),
+                "chunks_created": 0,
+                "ids": [],
+                "error": "No text content extracted"
+            }
+
+        logger.info(
+            f"{source}: {len(added)} chunks added, {len(ids) - len(added)} unchanged, "
+            f"{stale} deleted"
+        )
+        return {
+            "success": True,
+            "source": source,
+            "type": base_metadata.get("type"),
+            "chunks_created": len(ids),
+            "chunks_added": len(added),
+            "chunks_unchanged": len(ids) - len(added),
+            "chunks_deleted": stale,
             "ids": ids
         }
 
     def retrieve_context(
         self,
         query: str,
-        top_k: int = 5
+        top_k: Optional[int] = None
     ) -> Tuple[str, List[Dict[str, Any]]]:
         """
         Retrieve relevant context for a query.
 
         Args:
             query: User query
-            top_k: Number of results to retrieve
+            top_k: Number of results to retrieve (defaults to RERANK_TOP_K
+                with reranking enabled, else TOP_K_RESULTS)
 
         Returns:
             Tuple of (formatted context string, list of source documents)
         """
+        if top_k is None:
+            top_k = RERANK_TOP_K if self.reranker is not None else TOP_K_RESULTS
+
         logger.info(f"Retrieving context for query: {query[:50]}...")
         logger.debug(f"Retrieving top {top_k} results")
 
         try:
-            results = self.vector_store.search(query, top_k=top_k)
+            if self.reranker is None:
+                results = self._search(query, top_k)
+            else:
+                results = self._search_reranked(query, top_k)
         except Exception as e:
             logger.error(f"Vector store search failed: {e}")
             return NO_CONTEXT_TEMPLATE, []
@@ -187,11 +564,18 @@ class RAGPipeline:
 
         logger.info(f"Found {len(results)} relevant chunks")
 
-        # Format context from results
+        # Merge neighbouring chunks and fit them into the context budget
+        excerpts = pack_excerpts(results, CONTEXT_TOKEN_BUDGET)
+        logger.debug(
+            f"Packed {len(results)} chunks into {len(excerpts)} excerpts "
+            f"(budget: {CONTEXT_TOKEN_BUDGET} tokens)"
+        )
+
+        # Format context from excerpts
         context_parts = []
         sources = []
 
-        for i, result in enumerate(results, 1):
+        for i, result in enumerate(excerpts, 1):
             source_name = result["metadata"].get("source", "Unknown")
             source_type = result["metadata"].get("type", "unknown")
             similarity = result["similarity"]
@@ -223,6 +607,46 @@ class RAGPipeline:
 
         return formatted_context, sources
 
+    def _search(self, query: str, top_k: int) -> List[Dict[str, Any]]:
+        """
+        Search the vector store through the query cache.
+
+        An identical cached query skips the embedding call; a similar
+        enough one skips the vector search as well.
+        """
+        if self.query_cache is None:
+            return self.vector_store.search(query, top_k=top_k)
+
+        version = self.vector_store.version
+        results = self.query_cache.get(query, top_k, version)
+        if results is not None:
+            logger.debug("Query cache hit")
+            return results
+
+        embedding = self.vector_store.embed_query(query)
+        results = self.query_cache.get_similar(embedding, top_k, version)
+        if results is not None:
+            logger.debug("Query cache hit for a similar query")
+            return results
+
+        results = self.vector_store.search(query, top_k=top_k, query_embedding=embedding)
+        self.query_cache.put(query, embedding, top_k, version, results)
+        return results
+
+    def _search_reranked(self, query: str, top_k: int) -> List[Dict[str, Any]]:
+        """
+        Retrieve RERANK_CANDIDATES chunks and keep the ``top_k`` the
+        cross-encoder ranks highest.
+
+        If the reranker fails, the vector ranking is used instead.
+        """
+        candidates = self._search(query, max(RERANK_CANDIDATES, top_k))
+        try:
+            return self.reranker.rerank(query, candidates, top_k)
+        except Exception as e:
+            logger.warning(f"Reranking failed, keeping vector ranking: {e}")
+            return candidates[:top_k]
+
     def delete_source(self, source: str) -> Dict[str, Any]:
         """
         Delete a source from the knowledge base.
@@ -237,6 +661,8 @@ class RAGPipeline:
 
         try:
             deleted_count = self.vector_store.delete_by_source(source)
+            self.vector_store.flush()
+            self.document_processor.forget_url(source)
             logger.info(f"Deleted {deleted_count} chunks for source: {source}")
 
             return {
@@ -269,4 +695,5 @@ class RAGPipeline:
         """Clear all documents from the knowledge base."""
         logger.warning("Clearing entire knowledge base")
         self.vector_store.clear_collection()
+        self.document_processor.forget_url()
         logger.info("Knowledge base cleared")
@@ -0,0 +1,142 @@
+"""
+Reranker Module
+Second-stage reranking of retrieved chunks with a cross-encoder.
+
+The vector search ranks chunks by embedding similarity, which compares the
+query and each chunk separately.  A cross-encoder reads the query and a
+chunk together and scores their relevance directly, which ranks far
+better but is too slow to run over the whole collection.  Retrieval
+therefore over-fetches candidates and the cross-encoder reorders them.
+
+The model is small enough to run on CPU.  Pairs are scored in batches,
+and scores are cached per (query, chunk ID): chunk IDs are content hashes,
+so a cached score stays valid for as long as the chunk exists.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from sentence_transformers import CrossEncoder
+
+from config.settings import RERANK_MODEL, RERANK_BATCH_SIZE, RERANK_CACHE_MAX_ENTRIES
+from src.embedding_cache import normalize_text
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Reranker:
+    """Cross-encoder reranker with a per-(query, chunk) score cache."""
+
+    def __init__(
+        self,
+        model_name: str = RERANK_MODEL,
+        batch_size: int = RERANK_BATCH_SIZE,
+        max_entries: int = RERANK_CACHE_MAX_ENTRIES
+    ):
+        """
+        Create a reranker; the model is loaded on first use.
+
+        Args:
+            model_name: sentence-transformers cross-encoder model
+            batch_size: (query, chunk) pairs per model call
+            max_entries: Maximum number of cached scores
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_entries = max_entries
+
+        self._model = None
+        self._lock = threading.Lock()
+        self._scores: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model(self) -> CrossEncoder:
+        """The cross-encoder, loaded on first access."""
+        with self._lock:
+            if self._model is None:
+                logger.info(f"Loading reranker model: {self.model_name}")
+                self._model = CrossEncoder(self.model_name, device="cpu")
+            return self._model
+
+    def score(self, query: str, results: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Relevance scores of search results for a query.
+
+        Args:
+            query: Search query
+            results: Search results with ``text`` and ``id``
+
+        Returns:
+            float32 array with one score per result, higher is more relevant
+        """
+        scores = np.empty(len(results), dtype=np.float32)
+        normalized = normalize_text(query)
+        missing = []
+
+        with self._lock:
+            for i, result in enumerate(results):
+                key = (normalized, result.get("id"))
+                if key[1] is not None and key in self._scores:
+                    self._scores.move_to_end(key)
+                    scores[i] = self._scores[key]
+                else:
+                    missing.append(i)
+            self.hits += len(results) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            pairs = [(query, results[i]["text"]) for i in missing]
+            predicted = self.model.predict(
+                pairs,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+            scores[missing] = predicted
+
+            with self._lock:
+                for i, value in zip(missing, predicted):
+                    chunk_id = results[i].get("id")
+                    if chunk_id is not None:
+                        self._scores[(normalized, chunk_id)] = float(value)
+                while len(self._scores) > self.max_entries:
+                    self._scores.popitem(last=False)
+
+        logger.debug(f"Reranker scored {len(missing)} pairs, {len(results) - len(missing)} cached")
+        return scores
+
+    def rerank(
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Reorder search results by cross-encoder relevance.
+
+        Args:
+            query: Search query
+            results: Candidate search results
+            top_k: Number of results to keep
+
+        Returns:
+            The ``top_k`` most relevant results, best first, each with a
+            ``rerank_score``
+        """
+        if not results:
+            return []
+
+        scores = self.score(query, results)
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return [{**results[i], "rerank_score": float(scores[i])} for i in order]
+
+    def clear(self) -> None:
+        """Drop all cached scores."""
+        with self._lock:
+            self._scores.clear()
@@ -0,0 +1,242 @@
+"""
+Pipeline Utility Module
+Bounded-queue stages for overlapping producer and consumer work.
+
+``background`` runs an iterator in a worker thread and hands its items
+over through a bounded queue, so the producer can run at most ``maxsize``
+items ahead of the consumer.  Chaining calls builds a multi-stage
+pipeline (e.g. extract -> embed -> store) whose memory use is bounded by
+the queue sizes rather than the input size.  Exceptions raised in a stage
+are re-raised in the consumer, and closing the consumer stops every
+upstream stage.
+
+``bounded_map`` fans blocking calls (e.g. HTTP requests) out over a thread
+pool while capping how many run at once per key (e.g. per host).
+
+``BackgroundLoop`` runs an asyncio event loop in a worker thread, so
+synchronous code (e.g. a Streamlit script) can drive async generators and
+keep connections pooled across calls.
+"""
+
+import asyncio
+import queue
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    AsyncIterator, Awaitable, Callable, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+_POLL_INTERVAL = 0.1  # seconds between checks for a cancelled pipeline
+
+
+class _StageError:
+    """Carries an exception from a worker thread to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group items into lists of at most ``size``."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def background(
+    items: Iterable[T],
+    func: Callable[[T], R] = None,
+    maxsize: int = 2,
+    name: str = "pipeline-stage"
+) -> Iterator[R]:
+    """
+    Iterate ``items`` (applying ``func``) in a worker thread.
+
+    Args:
+        items: Source iterable; consumed only by the worker thread
+        func: Optional function applied to each item in the worker
+        maxsize: Maximum number of results buffered ahead of the consumer
+        name: Thread name, for logs and debugging
+
+    Yields:
+        Results in source order
+    """
+    results: "queue.Queue" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def work():
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put(func(item) if func is not None else item):
+                    break
+            else:
+                put(_DONE)
+        except BaseException as e:
+            put(_StageError(e))
+        finally:
+            # Propagate cancellation to upstream stages
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    worker = threading.Thread(target=work, name=name, daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _StageError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: int,
+    key: Callable[[T], Hashable] = None,
+    per_key: Optional[int] = None
+) -> Iterator[Tuple[T, Optional[R], Optional[Exception]]]:
+    """
+    Apply ``func`` to items in a thread pool, yielding results as they finish.
+
+    Items sharing a key are limited to ``per_key`` concurrent calls; the
+    remaining worker slots go to items with other keys, round-robin, so one
+    slow key cannot occupy the whole pool.  A failing call is reported
+    alongside its item instead of stopping the others.
+
+    Args:
+        func: Function applied to each item
+        items: Items to process
+        workers: Maximum number of concurrent calls
+        key: Groups items for ``per_key`` (e.g. URL -> host)
+        per_key: Maximum concurrent calls per key (None for no limit)
+
+    Yields:
+        (item, result, None) or (item, None, exception) in completion order
+    """
+    key = key or (lambda item: None)
+    per_key = per_key or workers
+    pending: "OrderedDict[Hashable, deque]" = OrderedDict()
+    for item in items:
+        pending.setdefault(key(item), deque()).append(item)
+
+    running = {}
+    active: Counter = Counter()
+
+    def submit(executor):
+        for k in list(pending):
+            queued = pending[k]
+            while queued and active[k] < per_key and len(running) < workers:
+                item = queued.popleft()
+                running[executor.submit(func, item)] = (k, item)
+                active[k] += 1
+            if queued:
+                pending.move_to_end(k)  # round-robin across keys
+            else:
+                del pending[k]
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bounded-map")
+    try:
+        submit(executor)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                k, item = running.pop(future)
+                active[k] -= 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield item, None, e
+                else:
+                    yield item, result, None
+            submit(executor)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class BackgroundLoop:
+    """An asyncio event loop running in a daemon thread."""
+
+    def __init__(self, name: str = "event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Awaitable[R], timeout: Optional[float] = None) -> R:
+        """Run a coroutine on the loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def iterate(self, items: AsyncIterator[T]) -> Iterator[T]:
+        """
+        Iterate an async iterator from synchronous code.
+
+        The iterator is consumed by a task on the loop.  Exceptions it
+        raises are re-raised in the consumer, and closing the consumer
+        cancels the task, which cancels the iterator at its current await.
+
+        Args:
+            items: Async iterator or generator, consumed only on the loop
+
+        Yields:
+            Items in order
+        """
+        results: "queue.Queue" = queue.Queue()
+
+        async def pump():
+            outcome = _DONE
+            try:
+                async for item in items:
+                    results.put(item)
+            except BaseException as e:
+                outcome = _StageError(e)
+                raise
+            finally:
+                # Always wake the consumer, even on cancellation
+                results.put(outcome)
+
+        task = asyncio.run_coroutine_threadsafe(pump(), self.loop)
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _StageError):
+                    raise item.error
+                yield item
+        finally:
+            task.cancel()
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
@@ -2,13 +2,21 @@
 Vector Store Module
 Handles ChromaDB operations for storing and retrieving document embeddings.
 Supports both local persistent storage and ChromaDB Cloud.
+
+In hybrid search mode a BM25 keyword index is kept alongside the
+collection and its ranking fused with the vector ranking.
 """
 
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Optional, Set
+import functools
+import hashlib
 import uuid
 
+import numpy as np
+
 from config.settings import (
     CHROMA_PERSIST_PATH,
     CHROMA_COLLECTION_NAME,
@@ -17,14 +25,33 @@ from config.settings import (
     CHROMA_TENANT,
     CHROMA_DATABASE,
     TOP_K_RESULTS,
-    SIMILARITY_THRESHOLD
+    SIMILARITY_THRESHOLD,
+    SEARCH_MODE,
+    HYBRID_CANDIDATES,
+    RRF_K,
+    BM25_INDEX_PATH
 )
+from src.bm25_index import BM25Index
+from src.embedding_cache import normalize_text
 from src.embeddings import get_embedding, get_embeddings
 from src.logger import get_logger
 from src.utils.retry import retry, RetryError
 
 logger = get_logger(__name__)
 
+INDEX_REBUILD_PAGE_SIZE = 5000  # chunks read from the collection at a time
+
+
+def _mutation(method):
+    """Bump the store's version after a call that may change its documents."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.version += 1
+    return wrapper
+
 
 def create_chroma_client():
     """
@@ -62,12 +89,47 @@ def create_chroma_client():
         return client
 
 
+class ChunkIdGenerator:
+    """
+    Deterministic, content-addressed IDs for the chunks of one source.
+
+    An ID is a hash of the source and the chunk's normalized text, so an
+    unchanged chunk keeps its ID across re-ingestions.  Repeated chunks
+    within a source (e.g. running headers) get an occurrence suffix.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self._occurrences: Counter = Counter()
+
+    def __call__(self, text: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.source.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalize_text(text).encode("utf-8"))
+        chunk_id = digest.hexdigest()
+
+        occurrence = self._occurrences[chunk_id]
+        self._occurrences[chunk_id] += 1
+        return chunk_id if occurrence == 0 else f"{chunk_id}-{occurrence}"
+
+
 class VectorStore:
-    """ChromaDB vector store for document embeddings."""
+    """
+    ChromaDB vector store for document embeddings.
+
+    ``version`` increases whenever documents are added, changed or
+    deleted, so callers can tell whether results they kept are stale.
+
+    With ``SEARCH_MODE = "hybrid"`` a BM25 index over the chunk text
+    (``lexical_index``) is updated with every add and delete and saved by
+    ``flush()``.
+    """
 
     def __init__(self):
         """Initialize ChromaDB client and collection."""
         logger.info("Initializing VectorStore")
+        self.version = 0
 
         try:
             self.client = create_chroma_client()
@@ -84,12 +146,49 @@ class VectorStore:
             logger.error(f"Failed to initialize ChromaDB: {e}")
             raise
 
+        self.lexical_index: Optional[BM25Index] = None
+        if SEARCH_MODE == "hybrid":
+            self.lexical_index = BM25Index(BM25_INDEX_PATH)
+            self._sync_lexical_index()
+        elif SEARCH_MODE != "vector":
+            raise ValueError(f"Unknown SEARCH_MODE '{SEARCH_MODE}', expected 'vector' or 'hybrid'")
+
+    def _sync_lexical_index(self) -> None:
+        """Rebuild the BM25 index from the collection if they disagree."""
+        count = self.collection.count()
+        if len(self.lexical_index) == count:
+            return
+
+        logger.info(f"Rebuilding BM25 index from {count} stored chunks")
+        self.lexical_index.clear()
+        for offset in range(0, count, INDEX_REBUILD_PAGE_SIZE):
+            page = self.collection.get(
+                include=["documents"], limit=INDEX_REBUILD_PAGE_SIZE, offset=offset
+            )
+            self.lexical_index.add(page["ids"], page["documents"])
+        self.lexical_index.save()
+
+    def flush(self) -> None:
+        """Persist the BM25 index, if there is one and it changed."""
+        if self.lexical_index is not None:
+            self.lexical_index.flush()
+
+    def embed_documents(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for texts, one float32 row per text."""
+        return get_embeddings(texts)
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Generate the embedding of a search query."""
+        return get_embedding(query)
+
     @retry(max_attempts=3, base_delay=0.5, exceptions=(Exception,))
+    @_mutation
     def add_documents(
         self,
         texts: List[str],
         metadatas: List[Dict[str, Any]],
-        ids: Optional[List[str]] = None
+        ids: Optional[List[str]] = None,
+        embeddings: Optional[np.ndarray] = None
     ) -> List[str]:
         """
         Add documents to the vector store.
@@ -98,6 +197,7 @@ class VectorStore:
             texts: List of text chunks to store
             metadatas: List of metadata dicts for each chunk
             ids: Optional list of IDs (generated if not provided)
+            embeddings: Optional precomputed embeddings, one row per text
 
         Returns:
             List of document IDs
@@ -111,21 +211,25 @@ class VectorStore:
         if ids is None:
             ids = [str(uuid.uuid4()) for _ in texts]
 
-        logger.debug("Generating embeddings for documents")
-        try:
-            embeddings = get_embeddings(texts)
-            logger.debug(f"Generated {len(embeddings)} embeddings")
-        except Exception as e:
-            logger.error(f"Failed to generate embeddings: {e}")
-            raise
+        if embeddings is None:
+            logger.debug("Generating embeddings for documents")
+            try:
+                embeddings = get_embeddings(texts)
+                logger.debug(f"Generated {len(embeddings)} embeddings")
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings: {e}")
+                raise
 
         try:
+            # Arrays go to Chroma as-is; no per-float Python objects are created
             self.collection.add(
                 documents=texts,
-                embeddings=embeddings,
+                embeddings=np.asarray(embeddings, dtype=np.float32),
                 metadatas=metadatas,
                 ids=ids
             )
+            if self.lexical_index is not None:
+                self.lexical_index.add(ids, texts)
             logger.info(f"Successfully added {len(ids)} documents")
         except Exception as e:
             logger.error(f"Failed to add documents to collection: {e}")
@@ -138,7 +242,8 @@ class VectorStore:
         self,
         query: str,
         top_k: int = TOP_K_RESULTS,
-        filter_metadata: Optional[Dict[str, Any]] = None
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents.
@@ -147,23 +252,48 @@ class VectorStore:
             query: Search query text
             top_k: Number of results to return
             filter_metadata: Optional metadata filter
+            query_embedding: Precomputed embedding of ``query``
 
         Returns:
-            List of results with text, metadata, and distance
+            List of results with text, metadata, and similarity (plus the
+            fused ``score`` in hybrid mode)
         """
         logger.debug(f"Searching for: {query[:50]}..., top_k={top_k}")
 
-        try:
-            query_embedding = get_embedding(query)
-            logger.debug("Query embedding generated")
-        except Exception as e:
-            logger.error(f"Failed to generate query embedding: {e}")
-            raise
+        if query_embedding is None:
+            try:
+                query_embedding = get_embedding(query)
+                logger.debug("Query embedding generated")
+            except Exception as e:
+                logger.error(f"Failed to generate query embedding: {e}")
+                raise
+
+        if self.lexical_index is not None:
+            return self._hybrid_search(query, query_embedding, top_k, filter_metadata)
+
+        formatted_results = [
+            result for result in self._query_vectors(query_embedding, top_k, filter_metadata)
+            if result["similarity"] >= SIMILARITY_THRESHOLD
+        ]
 
+        logger.info(
+            f"Search returned {len(formatted_results)} results "
+            f"(threshold: {SIMILARITY_THRESHOLD})"
+        )
+
+        return formatted_results
+
+    def _query_vectors(
+        self,
+        query_embedding: np.ndarray,
+        n_results: int,
+        filter_metadata: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Nearest chunks to an embedding, closest first, unthresholded."""
         try:
             results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=top_k,
+                query_embeddings=np.asarray(query_embedding, dtype=np.float32).reshape(1, -1),
+                n_results=n_results,
                 where=filter_metadata,
                 include=["documents", "metadatas", "distances"]
             )
@@ -176,23 +306,121 @@ class VectorStore:
         if results["documents"] and results["documents"][0]:
             for i, doc in enumerate(results["documents"][0]):
                 distance = results["distances"][0][i] if results["distances"] else 0
-                similarity = 1 - distance  # Convert distance to similarity
+                formatted_results.append({
+                    "text": doc,
+                    "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
+                    "similarity": 1 - distance,  # Convert distance to similarity
+                    "id": results["ids"][0][i] if results["ids"] else None
+                })
+        return formatted_results
+
+    def _hybrid_search(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        top_k: int,
+        filter_metadata: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuse the vector and BM25 rankings with reciprocal-rank fusion.
 
-                if similarity >= SIMILARITY_THRESHOLD:
-                    formatted_results.append({
-                        "text": doc,
-                        "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                        "similarity": similarity,
-                        "id": results["ids"][0][i] if results["ids"] else None
-                    })
+        Each retriever contributes ``top_k * HYBRID_CANDIDATES`` candidates
+        and a chunk scores ``sum(1 / (RRF_K + rank))`` over the rankings it
+        appears in.  Keyword matches are kept even when their similarity is
+        below SIMILARITY_THRESHOLD; that is how exact-term queries (part
+        numbers, acronyms) are recovered.
+        """
+        n_candidates = top_k * HYBRID_CANDIDATES
+        dense = self._query_vectors(query_embedding, n_candidates, filter_metadata)
+        lexical = self.lexical_index.search(query, n_candidates)
+
+        scores: Dict[str, float] = defaultdict(float)
+        for rank, result in enumerate(dense, start=1):
+            scores[result["id"]] += 1 / (RRF_K + rank)
+        for rank, (chunk_id, _) in enumerate(lexical, start=1):
+            scores[chunk_id] += 1 / (RRF_K + rank)
+
+        candidates = {result["id"]: result for result in dense}
+        keyword_matches = {chunk_id for chunk_id, _ in lexical}
+        missing = [chunk_id for chunk_id in keyword_matches if chunk_id not in candidates]
+        if missing:
+            candidates.update(self._get_with_similarity(missing, query_embedding, filter_metadata))
+
+        fused_results = []
+        for chunk_id in sorted(scores, key=scores.get, reverse=True):
+            result = candidates.get(chunk_id)
+            if result is None:  # excluded by the metadata filter
+                continue
+            if result["similarity"] < SIMILARITY_THRESHOLD and chunk_id not in keyword_matches:
+                continue
+            fused_results.append({**result, "score": scores[chunk_id]})
+            if len(fused_results) == top_k:
+                break
 
         logger.info(
-            f"Search returned {len(formatted_results)} results "
-            f"(threshold: {SIMILARITY_THRESHOLD})"
+            f"Hybrid search returned {len(fused_results)} results "
+            f"({len(dense)} vector, {len(lexical)} keyword candidates)"
         )
 
-        return formatted_results
+        return fused_results
+
+    def _get_with_similarity(
+        self,
+        ids: List[str],
+        query_embedding: np.ndarray,
+        filter_metadata: Optional[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Search results, keyed by ID, for chunks the vector query did not return."""
+        try:
+            results = self.collection.get(
+                ids=ids,
+                where=filter_metadata,
+                include=["documents", "metadatas", "embeddings"]
+            )
+        except Exception as e:
+            logger.error(f"Failed to fetch keyword matches: {e}")
+            raise
+
+        if not results["ids"]:
+            return {}
+
+        query_vector = np.asarray(query_embedding, dtype=np.float32).ravel()
+        embeddings = np.asarray(results["embeddings"], dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query_vector)
+        similarities = embeddings @ query_vector / np.where(norms == 0, 1, norms)
+
+        return {
+            chunk_id: {
+                "text": results["documents"][i],
+                "metadata": results["metadatas"][i] if results["metadatas"] else {},
+                "similarity": float(similarities[i]),
+                "id": chunk_id
+            }
+            for i, chunk_id in enumerate(results["ids"])
+        }
+
+    def get_source_ids(self, source: str) -> Set[str]:
+        """
+        IDs of all chunks currently stored for a source.
 
+        This is the source's manifest: re-ingestion compares it with the
+        new chunk IDs to decide what to embed, keep and delete.  It is read
+        from the collection itself, so it cannot drift from what is stored.
+
+        Args:
+            source: Source identifier (filename or URL)
+
+        Returns:
+            Set of chunk IDs
+        """
+        try:
+            results = self.collection.get(where={"source": source}, include=[])
+            return set(results["ids"])
+        except Exception as e:
+            logger.error(f"Failed to read chunk IDs for source {source}: {e}")
+            raise
+
+    @_mutation
     def delete_by_source(self, source: str) -> int:
         """
         Delete all documents from a specific source.
@@ -214,6 +442,8 @@ class VectorStore:
 
             if results["ids"]:
                 self.collection.delete(ids=results["ids"])
+                if self.lexical_index is not None:
+                    self.lexical_index.remove(results["ids"])
                 deleted_count = len(results["ids"])
                 logger.info(f"Deleted {deleted_count} documents for source: {source}")
                 return deleted_count
@@ -225,6 +455,7 @@ class VectorStore:
             logger.error(f"Failed to delete documents for source {source}: {e}")
             raise
 
+    @_mutation
     def delete_by_ids(self, ids: List[str]) -> None:
         """Delete documents by their IDs."""
         if not ids:
@@ -235,11 +466,33 @@ class VectorStore:
 
         try:
             self.collection.delete(ids=ids)
+            if self.lexical_index is not None:
+                self.lexical_index.remove(ids)
             logger.debug(f"Deleted {len(ids)} documents")
         except Exception as e:
             logger.error(f"Failed to delete documents by ID: {e}")
             raise
 
+    @_mutation
+    def update_metadatas(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """
+        Merge metadata fields into existing documents.
+
+        Args:
+            ids: Document IDs to update
+            metadatas: Fields to set on each document (other fields are kept)
+        """
+        if not ids:
+            return
+
+        logger.debug(f"Updating metadata of {len(ids)} documents")
+
+        try:
+            self.collection.update(ids=ids, metadatas=metadatas)
+        except Exception as e:
+            logger.error(f"Failed to update document metadata: {e}")
+            raise
+
     def get_all_sources(self) -> List[Dict[str, Any]]:
         """
         Get list of all unique sources in the collection.
@@ -299,6 +552,7 @@ class VectorStore:
             logger.error(f"Failed to get collection stats: {e}")
             raise
 
+    @_mutation
     def clear_collection(self) -> None:
         """Clear all documents from the collection."""
         logger.warning("Clearing entire collection")
@@ -311,6 +565,9 @@ class VectorStore:
                 name=CHROMA_COLLECTION_NAME,
                 metadata={"hnsw:space": "cosine"}
             )
+            if self.lexical_index is not None:
+                self.lexical_index.clear()
+                self.lexical_index.save()
             logger.info("Collection cleared and recreated")
 
         except Exception as e:
@@ -2,10 +2,14 @@
 Pytest Configuration and Shared Fixtures
 """
 
+import json
 import os
 import sys
 import tempfile
 import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from io import BytesIO
@@ -41,6 +45,13 @@ def temp_dir():
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
+@pytest.fixture(autouse=True)
+def isolated_http_cache(temp_dir):
+    """Keep the HTTP cache of every test in its own temporary directory."""
+    with patch("src.document_processor.HTTP_CACHE_DIR", temp_dir / "http_cache"):
+        yield
+
+
 @pytest.fixture
 def temp_chroma_dir(temp_dir):
     """Create a temporary directory for ChromaDB."""
@@ -147,6 +158,47 @@ def mock_pdf_file(temp_dir, sample_pdf_content):
     return str(pdf_path)
 
 
+def build_pdf(pages):
+    """Build a PDF with one line of Helvetica text per page."""
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page ids are known
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{obj}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return bytes(out)
+
+
+@pytest.fixture
+def multi_page_pdf(temp_dir):
+    """A real 12-page PDF whose page N reads 'Page N content'."""
+    pdf_path = temp_dir / "manual.pdf"
+    pdf_path.write_bytes(build_pdf([f"Page {i} content" for i in range(1, 13)]))
+    return pdf_path
+
+
 @pytest.fixture
 def mock_uploaded_file():
     """Create a mock Streamlit UploadedFile object."""
@@ -250,11 +302,12 @@ def mock_anthropic_client(mock_anthropic_response):
 
 @pytest.fixture
 def mock_requests_get(sample_html_content):
-    """Mock requests.get for URL testing."""
-    with patch("requests.get") as mock_get:
+    """Mock HTTP GET requests for URL testing."""
+    with patch("requests.Session.get") as mock_get:
         mock_response = MagicMock()
         mock_response.content = sample_html_content.encode()
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         yield mock_get
@@ -262,13 +315,219 @@ def mock_requests_get(sample_html_content):
 
 @pytest.fixture
 def mock_requests_get_failure():
-    """Mock requests.get to simulate failure."""
-    with patch("requests.get") as mock_get:
+    """Mock HTTP GET requests to simulate failure."""
+    with patch("requests.Session.get") as mock_get:
         import requests
         mock_get.side_effect = requests.RequestException("Connection failed")
         yield mock_get
 
 
+# ============================================================================
+# Local HTTP Server
+# ============================================================================
+
+class LocalHTTPServer:
+    """
+    Threaded HTTP/1.1 server serving canned pages on 127.0.0.1.
+
+    Records every request and connection and the peak number of requests
+    handled at once, so tests can check concurrency limits and keep-alive.
+    Pages served with ``ETag``/``Last-Modified`` headers answer matching
+    conditional requests with ``304 Not Modified``.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.pages = {}  # path -> (status, body bytes, headers dict)
+        self.delay = delay
+        self.requests = []  # (path, request headers)
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append((self.path, dict(self.headers)))
+                    server.connections.add(self.client_address)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay)
+                    status, body, headers = server.pages.get(
+                        self.path, (404, b"Not found", {})
+                    )
+                    if server.is_not_modified(self.headers, headers):
+                        status, body = 304, b""
+                    self.send_response(status)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def is_not_modified(request_headers, page_headers) -> bool:
+        """Whether a conditional request matches the page's validators."""
+        etag = page_headers.get("ETag")
+        if etag and request_headers.get("If-None-Match") == etag:
+            return True
+        last_modified = page_headers.get("Last-Modified")
+        return bool(last_modified) and request_headers.get("If-Modified-Since") == last_modified
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def add_page(self, path: str, html: str, status: int = 200, headers: dict = None) -> str:
+        """Serve ``html`` at ``path`` and return its full URL."""
+        self.pages[path] = (status, html.encode("utf-8"), headers or {})
+        return self.url(path)
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def http_server_factory():
+    """Start local HTTP servers; each one is a separate host."""
+    servers = []
+
+    def start(delay: float = 0.0) -> LocalHTTPServer:
+        server = LocalHTTPServer(delay)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def http_server(http_server_factory):
+    """A local HTTP server for URL ingestion tests."""
+    return http_server_factory()
+
+
+class StubMessagesServer:
+    """
+    Local stand-in for the Anthropic Messages API.
+
+    ``POST /v1/messages`` streams ``reply`` as server-sent events, one
+    text delta per word, ``delay`` seconds apart; other requests get an
+    empty 404, HEAD requests after ``head_delay`` seconds.  Records request
+    bodies, HEAD requests and connections.
+    """
+
+    def __init__(self, reply: str = "Hello from the stub", delay: float = 0.0):
+        self.reply = reply
+        self.delay = delay
+        self.head_delay = 0.0
+        self.bodies = []  # JSON bodies of message requests
+        self.heads = 0
+        self.connections = set()
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_HEAD(self):
+                time.sleep(server.head_delay)
+                with server._lock:
+                    server.heads += 1
+                    server.connections.add(self.client_address)
+                try:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # the client gave up waiting
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with server._lock:
+                    server.bodies.append(json.loads(body))
+                    server.connections.add(self.client_address)
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for event in server.events():
+                        time.sleep(server.delay if event["type"] == "content_block_delta" else 0)
+                        data = f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode("utf-8")
+                        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                        self.wfile.flush()
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # the client stopped reading
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def events(self):
+        """Streaming events of one reply."""
+        usage = {"input_tokens": 10, "output_tokens": 1}
+        yield {"type": "message_start", "message": {
+            "id": "msg_stub", "type": "message", "role": "assistant", "model": "stub",
+            "content": [], "stop_reason": None, "stop_sequence": None, "usage": usage
+        }}
+        yield {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}
+        for i, word in enumerate(self.reply.split(" ")):
+            yield {"type": "content_block_delta", "index": 0,
+                   "delta": {"type": "text_delta", "text": word if i == 0 else f" {word}"}}
+        yield {"type": "content_block_stop", "index": 0}
+        yield {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+               "usage": {"output_tokens": len(self.reply.split(" "))}}
+        yield {"type": "message_stop"}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def messages_server():
+    """A stub Messages API server; set ``reply``/``delay``/``head_delay`` as needed."""
+    server = StubMessagesServer()
+    yield server
+    server.close()
+
+
 # ============================================================================
 # ChromaDB Fixtures
 # ============================================================================
@@ -2,6 +2,9 @@
 Tests for AI GURU Agent Module
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
 import anthropic
@@ -245,6 +248,142 @@ class TestChatStream:
         assert agent.conversation_history[1]["content"] == "Hello world"
 
 
+class TestChatStreamAsync:
+    """Tests for the async streaming path, against a stub Messages API."""
+
+    @pytest.fixture
+    def agent(self, messages_server):
+        """Agent with a mock RAG pipeline, talking to the stub server."""
+        from src.agent import AIGuruAgent
+
+        with patch("src.agent.RAGPipeline") as mock_rag_pipeline, \
+             patch("anthropic.Anthropic"), \
+             patch("src.agent.ANTHROPIC_BASE_URL", messages_server.base_url):
+            mock_rag_pipeline.return_value.retrieve_context.return_value = (
+                "Retrieved context", [{"source": "test.pdf", "type": "pdf", "similarity": 0.9}]
+            )
+            yield AIGuruAgent()
+
+    @staticmethod
+    async def _collect(stream):
+        return [chunk async for chunk in stream]
+
+    def test_streams_reply(self, agent, messages_server):
+        """Sources come first, then the streamed text, then done with timings."""
+        chunks = asyncio.run(self._collect(agent.chat_stream_async("Question?")))
+
+        assert chunks[0]["type"] == "sources"
+        assert chunks[0]["sources"][0]["source"] == "test.pdf"
+        assert "".join(c["content"] for c in chunks if c["type"] == "text") == "Hello from the stub"
+        assert chunks[-1]["type"] == "done"
+        assert {"retrieval", "first_token", "total"} <= set(chunks[-1]["timings"])
+        assert agent.last_timings == chunks[-1]["timings"]
+
+    def test_request_includes_context_and_history(self, agent, messages_server):
+        """The request carries the retrieved context; the turn is recorded."""
+        asyncio.run(self._collect(agent.chat_stream_async("Question?")))
+
+        request = messages_server.bodies[0]
+        assert request["stream"] is True
+        assert "Retrieved context" in request["messages"][-1]["content"]
+        assert agent.conversation_history == [
+            {"role": "user", "content": "Question?"},
+            {"role": "assistant", "content": "Hello from the stub"},
+        ]
+
+    def test_retrieval_overlaps_connection_setup(self, agent, messages_server):
+        """The connection is opened while retrieval runs, then reused."""
+        heads_during_retrieval = []
+
+        def slow_retrieval(query):
+            time.sleep(0.3)
+            heads_during_retrieval.append(messages_server.heads)
+            return "", []
+
+        agent.rag_pipeline.retrieve_context.side_effect = slow_retrieval
+
+        chunks = asyncio.run(self._collect(agent.chat_stream_async("Question?")))
+
+        assert heads_during_retrieval == [1]
+        assert len(messages_server.connections) == 1
+        assert chunks[-1]["timings"]["retrieval"] >= 0.3
+
+    def test_open_connection_skips_warm_up(self, agent, messages_server):
+        """A turn right after another reuses its connection without a HEAD."""
+        def slow_retrieval(query):
+            time.sleep(0.1)  # long enough for the warm-up to finish
+            return "", []
+
+        agent.rag_pipeline.retrieve_context.side_effect = slow_retrieval
+
+        async def two_turns():
+            await self._collect(agent.chat_stream_async("First?"))
+            return await self._collect(agent.chat_stream_async("Second?"))
+
+        chunks = asyncio.run(two_turns())
+
+        assert messages_server.heads == 1
+        assert len(messages_server.bodies) == 2
+        assert "connect" not in chunks[-1]["timings"]
+
+    def test_slow_warm_up_does_not_delay_request(self, agent, messages_server):
+        """Once retrieval is done the request is sent without waiting for the warm-up."""
+        messages_server.head_delay = 1.0
+
+        chunks = asyncio.run(self._collect(agent.chat_stream_async("Question?")))
+
+        assert chunks[-1]["type"] == "done"
+        assert chunks[-1]["timings"]["total"] < 1.0
+        assert "connect" not in chunks[-1]["timings"]
+
+    def test_new_message_cancels_previous(self, agent, messages_server):
+        """A newer turn stops the one still streaming, which is not recorded."""
+        messages_server.delay = 0.05
+        messages_server.reply = "one two three four five six seven eight nine ten"
+
+        async def two_turns():
+            first = agent.chat_stream_async("First?")
+            first_chunks = []
+            async for chunk in first:
+                first_chunks.append(chunk)
+                if chunk["type"] == "text":
+                    break  # the user sends another message mid-stream
+            second = agent.chat_stream_async("Second?")
+            second_chunks = await self._collect(second)
+            first_chunks.extend(await self._collect(first))
+            return first_chunks, second_chunks
+
+        first_chunks, second_chunks = asyncio.run(two_turns())
+
+        assert first_chunks[-1]["type"] == "cancelled"
+        assert second_chunks[-1]["type"] == "done"
+        assert [m["content"] for m in agent.conversation_history] == [
+            "Second?", "one two three four five six seven eight nine ten"
+        ]
+
+    def test_task_cancellation(self, agent, messages_server):
+        """Cancelling the consuming task abandons the turn."""
+        messages_server.delay = 0.2
+        messages_server.reply = "slow " * 20
+
+        async def cancelled_turn():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(self._collect(agent.chat_stream_async("Question?")), 0.5)
+
+        asyncio.run(cancelled_turn())
+
+        assert agent.conversation_history == []
+
+    def test_without_rag(self, agent, messages_server):
+        """Without RAG no retrieval runs and no sources are sent."""
+        chunks = asyncio.run(self._collect(agent.chat_stream_async("Hi", use_rag=False)))
+
+        agent.rag_pipeline.retrieve_context.assert_not_called()
+        assert messages_server.heads == 0
+        assert chunks[0]["type"] == "text"
+        assert "retrieval" not in chunks[-1]["timings"]
+
+
 class TestBuildMessages:
     """Tests for message building."""
 
@@ -297,6 +436,27 @@ class TestBuildMessages:
         # Should have 20 history messages + 1 new = 21
         assert len(messages) == 21
 
+    @patch("src.agent.RAGPipeline")
+    @patch("anthropic.Anthropic")
+    def test_build_messages_bounds_history_tokens(self, mock_anthropic, mock_rag_pipeline):
+        """Test that long history is cut to the token budget, newest first."""
+        from src.agent import AIGuruAgent
+        from src.context_packer import count_tokens
+
+        agent = AIGuruAgent()
+        for i in range(10):
+            agent.conversation_history.append({"role": "user", "content": f"Question {i}"})
+            agent.conversation_history.append({"role": "assistant", "content": "answer " * 400})
+
+        with patch("src.agent.HISTORY_TOKEN_BUDGET", 1000):
+            messages = agent._build_messages("New message", "")
+
+        history = messages[:-1]
+        assert sum(count_tokens(m["content"]) for m in history) <= 1000
+        assert history[0]["role"] == "user"
+        assert history[-1] == agent.conversation_history[-1]
+        assert messages[-1]["content"] == "New message"
+
 
 class TestConversationHistory:
     """Tests for conversation history management."""
@@ -344,7 +504,9 @@ class TestKnowledgeBaseManagement:
         agent = AIGuruAgent()
         result = agent.ingest_pdf("/path/to/file.pdf")
 
-        mock_rag_pipeline.return_value.ingest_pdf.assert_called_once_with("/path/to/file.pdf")
+        mock_rag_pipeline.return_value.ingest_pdf.assert_called_once_with(
+            "/path/to/file.pdf", progress_callback=None
+        )
         assert result["success"] is True
 
     @patch("src.agent.RAGPipeline")
@@ -360,6 +522,39 @@ class TestKnowledgeBaseManagement:
 
         mock_rag_pipeline.return_value.ingest_url.assert_called_once_with("https://example.com")
 
+    @patch("src.agent.RAGPipeline")
+    @patch("anthropic.Anthropic")
+    def test_ingest_urls(self, mock_anthropic, mock_rag_pipeline):
+        """Test batch URL ingestion delegation."""
+        from src.agent import AIGuruAgent
+
+        mock_rag_pipeline.return_value.ingest_urls.return_value = {"success": True}
+        urls = ["https://example.com/a", "https://example.com/b"]
+
+        agent = AIGuruAgent()
+        result = agent.ingest_urls(urls)
+
+        mock_rag_pipeline.return_value.ingest_urls.assert_called_once_with(
+            urls, progress_callback=None
+        )
+        assert result["success"] is True
+
+    @patch("src.agent.RAGPipeline")
+    @patch("anthropic.Anthropic")
+    def test_refresh_url_sources(self, mock_anthropic, mock_rag_pipeline):
+        """Test URL refresh delegation."""
+        from src.agent import AIGuruAgent
+
+        mock_rag_pipeline.return_value.refresh_url_sources.return_value = {"success": True}
+
+        agent = AIGuruAgent()
+        result = agent.refresh_url_sources()
+
+        mock_rag_pipeline.return_value.refresh_url_sources.assert_called_once_with(
+            progress_callback=None
+        )
+        assert result["success"] is True
+
     @patch("src.agent.RAGPipeline")
     @patch("anthropic.Anthropic")
     def test_delete_source(self, mock_anthropic, mock_rag_pipeline):
@@ -0,0 +1,138 @@
+"""
+Tests for BM25 Index Module
+"""
+
+import pytest
+
+from src.bm25_index import BM25Index, tokenize
+
+
+CHUNKS = {
+    "a": "The X-200 pump replaces the X-100 model.",
+    "b": "Retrieval-augmented generation (RAG) combines search with an LLM.",
+    "c": "Pumps move fluids; a pump is rated by flow and head.",
+    "d": "Error E1045 means the pump X-200 lost prime.",
+}
+
+
+@pytest.fixture
+def index(temp_dir):
+    """Index over CHUNKS, saved to a temporary file."""
+    index = BM25Index(temp_dir / "bm25_index.npz")
+    index.add(list(CHUNKS), list(CHUNKS.values()))
+    return index
+
+
+def _ids(results):
+    return [chunk_id for chunk_id, _ in results]
+
+
+class TestTokenize:
+    """Tests for index term extraction."""
+
+    def test_lowercases_words(self):
+        """Terms are lowercased words."""
+        assert tokenize("Hello, World!") == ["hello", "world"]
+
+    def test_compounds_keep_whole_and_parts(self):
+        """Part numbers are indexed whole and by their parts."""
+        assert tokenize("X-200 v2.1") == ["x-200", "x", "200", "v2.1", "v2", "1"]
+
+
+class TestSearch:
+    """Tests for BM25 ranking."""
+
+    def test_exact_term_match(self, index):
+        """A rare exact term finds the only chunk containing it."""
+        assert _ids(index.search("E1045", top_k=5)) == ["d"]
+
+    def test_part_number_ranking(self, index):
+        """Chunks with the part number rank above the rest."""
+        assert set(_ids(index.search("X-200", top_k=2))) == {"a", "d"}
+
+    def test_case_insensitive(self, index):
+        """Queries match regardless of case."""
+        assert _ids(index.search("rag", top_k=5)) == ["b"]
+
+    def test_scores_descending(self, index):
+        """Results are ordered best first."""
+        scores = [score for _, score in index.search("pump", top_k=5)]
+
+        assert scores == sorted(scores, reverse=True)
+        assert len(scores) == 3
+
+    def test_respects_top_k(self, index):
+        """No more than top_k results are returned."""
+        assert len(index.search("pump x-200", top_k=1)) == 1
+
+    def test_no_match(self, index):
+        """Queries sharing no term with any chunk return nothing."""
+        assert index.search("zebra", top_k=5) == []
+
+
+class TestUpdates:
+    """Tests for incremental updates."""
+
+    def test_remove(self, index):
+        """Removed chunks are no longer returned."""
+        index.remove(["d"])
+
+        assert index.search("E1045", top_k=5) == []
+        assert len(index) == 3
+        assert "d" not in index
+
+    def test_re_add_replaces(self, index):
+        """Adding an existing ID replaces its text."""
+        index.add(["a"], ["Completely different text about valves"])
+
+        assert _ids(index.search("valves", top_k=5)) == ["a"]
+        assert "a" not in _ids(index.search("X-100", top_k=5))
+        assert len(index) == 4
+
+    def test_clear(self, index):
+        """Clearing empties the index."""
+        index.clear()
+
+        assert len(index) == 0
+        assert index.search("pump", top_k=5) == []
+
+
+class TestPersistence:
+    """Tests for saving and loading."""
+
+    def test_round_trip(self, index):
+        """A saved index loads with the same results."""
+        expected = index.search("pump X-200", top_k=5)
+        index.save()
+
+        loaded = BM25Index(index.path)
+
+        assert len(loaded) == 4
+        assert loaded.search("pump X-200", top_k=5) == expected
+
+    def test_flush_only_when_changed(self, index):
+        """flush writes a changed index and skips an unchanged one."""
+        index.flush()
+        mtime = index.path.stat().st_mtime_ns
+
+        index.flush()
+
+        assert index.path.stat().st_mtime_ns == mtime
+
+    def test_compacts_removed_chunks(self, index):
+        """Saving drops removed chunks once enough are dead."""
+        index.remove(["a", "d"])
+        index.save()
+
+        loaded = BM25Index(index.path)
+
+        assert len(loaded._doc_ids) == 2
+        assert "x-200" not in loaded._terms
+        assert _ids(loaded.search("pump", top_k=5)) == ["c"]
+
+    def test_unreadable_file_is_discarded(self, temp_dir):
+        """A corrupt index file starts an empty index instead of failing."""
+        path = temp_dir / "bm25_index.npz"
+        path.write_bytes(b"not an index")
+
+        assert len(BM25Index(path)) == 0
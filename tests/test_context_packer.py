@@ -0,0 +1,224 @@
+"""
+Tests for Context Packer Module
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.context_packer import (
+    EXCERPT_OVERHEAD_TOKENS,
+    MESSAGE_OVERHEAD_TOKENS,
+    TRUNCATION_MARKER,
+    count_tokens,
+    merge_adjacent,
+    pack_excerpts,
+    pack_history,
+    truncate_tokens
+)
+
+
+def _result(text, source="doc.pdf", index=None, similarity=0.8, id_=None):
+    metadata = {"source": source, "type": "pdf"}
+    if index is not None:
+        metadata["chunk_index"] = index
+    return {"text": text, "metadata": metadata, "similarity": similarity, "id": id_ or f"{source}-{index}"}
+
+
+def _words(n, word="word"):
+    return " ".join(f"{word}{i}" for i in range(n))
+
+
+def _excerpt_cost(result):
+    return EXCERPT_OVERHEAD_TOKENS + count_tokens(result["metadata"]["source"]) + count_tokens(result["text"])
+
+
+class TestCountTokens:
+    """Tests for token counting."""
+
+    def test_longer_text_has_more_tokens(self):
+        """Counts grow with the text."""
+        assert 0 < count_tokens("one two") < count_tokens(_words(100))
+
+    def test_estimates_without_tiktoken(self):
+        """Without an encoding, tokens are estimated from the length."""
+        with patch("src.context_packer._encoding", return_value=None):
+            assert count_tokens("a" * 40) == 10
+            assert count_tokens("a" * 41) == 11
+
+
+class TestTruncateTokens:
+    """Tests for trimming text to a token limit."""
+
+    def test_short_text_unchanged(self):
+        """Text within the limit is returned as is."""
+        assert truncate_tokens("short text", 100) == "short text"
+
+    def test_long_text_fits_and_is_marked(self):
+        """Trimmed text fits the limit, keeps the start and is marked."""
+        text = _words(500)
+
+        trimmed = truncate_tokens(text, 60)
+
+        assert count_tokens(trimmed) <= 60
+        assert trimmed.startswith("word0 word1")
+        assert trimmed.endswith(TRUNCATION_MARKER)
+
+    def test_cuts_at_word_boundary(self):
+        """The cut does not split a word."""
+        trimmed = truncate_tokens(_words(500), 60)
+
+        assert trimmed[:-len(TRUNCATION_MARKER)].split()[-1] in _words(500).split()
+
+
+class TestMergeAdjacent:
+    """Tests for merging neighbouring chunks."""
+
+    def test_merges_consecutive_chunks_removing_overlap(self):
+        """Consecutive chunks of a source become one excerpt without repeated text."""
+        first = "The pump moves water. It is rated by flow and head."
+        second = "rated by flow and head. Flow is measured in litres."
+
+        excerpts = merge_adjacent([_result(second, index=4), _result(first, index=3)])
+
+        assert len(excerpts) == 1
+        assert excerpts[0]["text"] == (
+            "The pump moves water. It is rated by flow and head. Flow is measured in litres."
+        )
+        assert excerpts[0]["ids"] == ["doc.pdf-3", "doc.pdf-4"]
+
+    def test_keeps_best_similarity_and_rank(self):
+        """A merged excerpt ranks where its best chunk ranked."""
+        results = [
+            _result("alpha", source="a.pdf", index=1, similarity=0.9),
+            _result("beta", source="b.pdf", index=7, similarity=0.8),
+            _result("gamma", source="a.pdf", index=2, similarity=0.7),
+        ]
+
+        excerpts = merge_adjacent(results)
+
+        assert [e["metadata"]["source"] for e in excerpts] == ["a.pdf", "b.pdf"]
+        assert excerpts[0]["similarity"] == 0.9
+
+    def test_gaps_are_not_merged(self):
+        """Non-consecutive chunks of a source stay separate."""
+        excerpts = merge_adjacent([_result("one", index=1), _result("three", index=3)])
+
+        assert len(excerpts) == 2
+
+    def test_other_sources_are_not_merged(self):
+        """Chunks with consecutive indexes from different sources stay separate."""
+        excerpts = merge_adjacent([
+            _result("one", source="a.pdf", index=1),
+            _result("two", source="b.pdf", index=2),
+        ])
+
+        assert len(excerpts) == 2
+
+    def test_results_without_index(self):
+        """Results without a chunk index are kept as they are."""
+        excerpts = merge_adjacent([_result("one"), _result("two")])
+
+        assert [e["text"] for e in excerpts] == ["one", "two"]
+
+
+class TestPackExcerpts:
+    """Tests for fitting excerpts into a budget."""
+
+    def test_everything_fits(self):
+        """Within budget all excerpts are kept untrimmed."""
+        results = [_result("one", id_="1"), _result("two", id_="2")]
+
+        packed = pack_excerpts(results, budget=1000)
+
+        assert [e["text"] for e in packed] == ["one", "two"]
+        assert not any(e["truncated"] for e in packed)
+
+    def test_lowest_ranked_are_dropped_first(self):
+        """Higher-ranked excerpts are kept whole while lower ones go."""
+        results = [_result(_words(50, w), id_=w) for w in ("best", "good", "worst")]
+        budget = _excerpt_cost(results[0]) + _excerpt_cost(results[1]) + 10
+
+        packed = pack_excerpts(results, budget)
+
+        assert [e["ids"] for e in packed] == [["best"], ["good"]]
+        assert not any(e["truncated"] for e in packed)
+
+    def test_crossing_excerpt_is_trimmed(self):
+        """The excerpt crossing the limit is trimmed to fit."""
+        results = [_result(_words(50, "best"), id_="1"), _result(_words(400, "next"), id_="2")]
+        budget = _excerpt_cost(results[0]) + 150
+
+        packed = pack_excerpts(results, budget)
+
+        assert len(packed) == 2
+        assert packed[1]["truncated"] is True
+        assert sum(_excerpt_cost(e) for e in packed) <= budget
+
+    def test_tiny_remainder_is_not_trimmed_into(self):
+        """Too little room left drops the next excerpt instead of trimming it."""
+        results = [_result(_words(50, "best"), id_="1"), _result(_words(400, "next"), id_="2")]
+
+        packed = pack_excerpts(results, _excerpt_cost(results[0]) + 5)
+
+        assert len(packed) == 1
+
+
+def _history(*lengths):
+    messages = []
+    for i, length in enumerate(lengths):
+        messages.append({"role": "user" if i % 2 == 0 else "assistant", "content": _words(length, f"m{i}w")})
+    return messages
+
+
+def _history_cost(messages):
+    return sum(MESSAGE_OVERHEAD_TOKENS + count_tokens(m["content"]) for m in messages)
+
+
+class TestPackHistory:
+    """Tests for fitting conversation history into a budget."""
+
+    def test_short_history_is_kept(self):
+        """History within budget is kept unchanged."""
+        history = _history(5, 5, 5, 5)
+
+        assert pack_history(history, budget=10000, max_messages=20) == history
+
+    def test_respects_max_messages(self):
+        """Only the most recent max_messages are considered."""
+        history = _history(*[3] * 30)
+
+        assert pack_history(history, budget=10000, max_messages=20) == history[-20:]
+
+    def test_keeps_newest_exchanges(self):
+        """Older exchanges are dropped first, whole."""
+        history = _history(20, 20, 20, 20, 20, 20)
+        budget = _history_cost(history[-4:]) + 10
+
+        packed = pack_history(history, budget, max_messages=20)
+
+        assert packed == history[-4:]
+
+    def test_long_reply_is_trimmed(self):
+        """An exchange crossing the limit is trimmed instead of dropped."""
+        history = _history(10, 2000, 10, 20)
+        budget = _history_cost(history[-2:]) + 300
+
+        packed = pack_history(history, budget, max_messages=20)
+
+        assert len(packed) == 4
+        assert packed[0] == history[0]
+        assert packed[1]["content"].endswith(TRUNCATION_MARKER)
+        assert _history_cost(packed) <= budget
+
+    def test_starts_with_user_message(self):
+        """A reply whose question fell outside max_messages is dropped."""
+        history = _history(5, 5, 5, 5, 5)
+
+        packed = pack_history(history, budget=10000, max_messages=4)
+
+        assert packed[0]["role"] == "user"
+        assert packed == history[-3:]
+
+    def test_empty_history(self):
+        """No history gives no messages."""
+        assert pack_history([], budget=100, max_messages=20) == []
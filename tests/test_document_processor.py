@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch, mock_open
 from pathlib import Path
 import requests
 
+from config.settings import CHUNK_SIZE
 from src.document_processor import DocumentProcessor, process_document
 from src.utils.retry import RetryError
 
@@ -27,7 +28,7 @@ class TestDocumentProcessor:
         text = "  Hello    world  \n\n\n\n  test  "
         cleaned = processor._clean_text(text)
         assert "    " not in cleaned
-        assert cleaned == "Hello world test"
+        assert cleaned == "Hello world\n\ntest"
 
     def test_clean_text_preserves_double_newlines(self):
         """Test that double newlines are preserved but not more."""
@@ -36,6 +37,24 @@ class TestDocumentProcessor:
         cleaned = processor._clean_text(text)
         assert "\n\n\n" not in cleaned
 
+    def test_clean_text_joins_lines_within_paragraphs(self):
+        """Single line breaks are wrapped text, not paragraph breaks."""
+        processor = DocumentProcessor()
+        text = "First line\nsecond\tline\r\n \r\nNext paragraph\n \n\n"
+
+        assert processor._clean_text(text) == "First line second line\n\nNext paragraph"
+
+    def test_chunks_split_at_paragraphs(self):
+        """The splitter prefers paragraph breaks over sentence breaks."""
+        processor = DocumentProcessor()
+        first = "Alpha sentence one. " * (CHUNK_SIZE * 7 // 200)
+        second = "Beta sentence two. " * (CHUNK_SIZE * 7 // 200)
+
+        chunks = processor.chunk_text(processor._clean_text(f"{first}\n\n{second}"))
+
+        assert chunks[0] == first.strip()
+        assert chunks[-1].startswith("Beta")
+
     def test_chunk_text(self):
         """Test text chunking."""
         processor = DocumentProcessor()
@@ -146,6 +165,49 @@ class TestProcessPDF:
         assert "page_count" in metadata
 
 
+class TestStreamPDF:
+    """Tests for page-by-page PDF streaming."""
+
+    def test_stream_matches_process_pdf(self, multi_page_pdf):
+        """Streaming a short PDF yields the same chunks as processing it whole."""
+        processor = DocumentProcessor()
+
+        chunks, metadata = processor.process_pdf(str(multi_page_pdf))
+        stream, stream_metadata = processor.stream_pdf(str(multi_page_pdf))
+
+        assert [chunk for chunk, _ in stream] == chunks
+        assert stream_metadata["page_count"] == metadata["page_count"] == 12
+
+    def test_split_pages_spans_page_breaks(self):
+        """Long streams are split incrementally without losing or reordering text."""
+        processor = DocumentProcessor()
+        pages = [(n, f"Page {n} sentence. " * 60) for n in range(1, 41)]
+
+        chunks = list(processor.split_pages(iter(pages)))
+
+        texts = [chunk for chunk, _ in chunks]
+        assert all(len(t) <= CHUNK_SIZE for t in texts)
+        assert [page for _, page in chunks] == sorted(page for _, page in chunks)
+        assert chunks[-1][1] == 40
+        positions = [" ".join(texts).find(f"Page {n} sentence") for n in range(1, 41)]
+        assert -1 not in positions and positions == sorted(positions)
+
+    def test_split_pages_skips_empty_pages(self):
+        """Pages without text do not produce chunks."""
+        processor = DocumentProcessor()
+
+        chunks = list(processor.split_pages(iter([(1, ""), (2, "Only text"), (3, "")])))
+
+        assert chunks == [("Only text", 3)]
+
+    def test_stream_pdf_file_not_found(self):
+        """A missing file fails before any work is scheduled."""
+        processor = DocumentProcessor()
+
+        with pytest.raises(FileNotFoundError):
+            processor.stream_pdf("/nonexistent/path/file.pdf")
+
+
 class TestProcessPDFUpload:
     """Tests for uploaded PDF processing."""
 
@@ -193,7 +255,7 @@ class TestProcessURL:
         all_content = " ".join(chunks)
         assert "console.log" not in all_content
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_process_url_connection_error(self, mock_get):
         """Test URL processing with connection error."""
         mock_get.side_effect = requests.RequestException("Connection failed")
@@ -205,13 +267,14 @@ class TestProcessURL:
 
         assert "Failed to fetch URL" in str(exc_info.value)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_process_url_retry_on_timeout(self, mock_get):
         """Test that URL fetching retries on timeout."""
         # First two calls fail, third succeeds
         mock_response = MagicMock()
         mock_response.content = b"<html><body>Test content</body></html>"
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = MagicMock()
 
         mock_get.side_effect = [
@@ -226,12 +289,13 @@ class TestProcessURL:
         assert mock_get.call_count == 3
         assert len(chunks) > 0
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_process_url_empty_content(self, mock_get):
         """Test URL processing with empty content."""
         mock_response = MagicMock()
         mock_response.content = b"<html><body></body></html>"
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -241,7 +305,7 @@ class TestProcessURL:
         assert chunks == []
         assert "error" in metadata
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_process_url_truncates_long_content(self, mock_get):
         """Test that long URL content is truncated."""
         # Create content longer than MAX_CONTENT_LENGTH
@@ -250,6 +314,7 @@ class TestProcessURL:
         mock_response = MagicMock()
         mock_response.content = long_content.encode()
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -261,6 +326,141 @@ class TestProcessURL:
         assert total_length < 200000
 
 
+def _article(title, text):
+    return f"<html><head><title>{title}</title></head><body><p>{text}</p></body></html>"
+
+
+class TestProcessURLs:
+    """Tests for concurrent URL processing against a local server."""
+
+    def test_processes_every_url(self, http_server):
+        """Each URL yields its own chunks and metadata."""
+        urls = [
+            http_server.add_page(f"/page{i}", _article(f"Page {i}", f"Content of page {i}."))
+            for i in range(5)
+        ]
+
+        results = {url: (parsed, error) for url, parsed, error in DocumentProcessor().process_urls(urls)}
+
+        assert set(results) == set(urls)
+        for i, url in enumerate(urls):
+            (chunks, metadata), error = results[url]
+            assert error is None
+            assert metadata["title"] == f"Page {i}"
+            assert f"Content of page {i}." in chunks[0]
+
+    def test_reuses_connections(self, http_server):
+        """Requests to one host share keep-alive connections."""
+        urls = [http_server.add_page(f"/p{i}", _article("T", "Text.")) for i in range(10)]
+
+        list(DocumentProcessor().process_urls(urls, workers=4, per_host=2))
+
+        assert len(http_server.requests) == 10
+        assert len(http_server.connections) <= 2
+
+    def test_respects_per_host_limit(self, http_server_factory):
+        """Each host sees at most per_host concurrent requests."""
+        hosts = [http_server_factory(delay=0.05) for _ in range(2)]
+        urls = [
+            server.add_page(f"/p{i}", _article("T", "Text."))
+            for server in hosts for i in range(6)
+        ]
+
+        list(DocumentProcessor().process_urls(urls, workers=8, per_host=2))
+
+        assert [server.max_in_flight for server in hosts] == [2, 2]
+
+    def test_failed_url_does_not_stop_others(self, http_server):
+        """A URL that cannot be fetched is reported with its error."""
+        good = http_server.add_page("/good", _article("Good", "Fine content."))
+        missing = http_server.url("/missing")
+
+        with patch("time.sleep"):
+            results = {url: error for url, _, error in DocumentProcessor().process_urls([good, missing])}
+
+        assert results[good] is None
+        assert isinstance(results[missing], RuntimeError)
+
+
+class TestURLRevalidation:
+    """Tests for conditional re-fetching of URL sources."""
+
+    def _fetch_and_remember(self, processor, url):
+        chunks, metadata = processor.process_url(url)
+        processor.remember_url(metadata)
+        return chunks, metadata
+
+    def test_first_fetch_is_unconditional(self, http_server):
+        """Unknown URLs are fetched without conditional headers."""
+        url = http_server.add_page("/a", _article("A", "Text."), headers={"ETag": '"v1"'})
+
+        chunks, metadata = DocumentProcessor().process_url(url)
+
+        assert chunks
+        assert metadata["etag"] == '"v1"'
+        assert "If-None-Match" not in http_server.requests[0][1]
+
+    def test_etag_304_skips_parsing(self, http_server):
+        """A 304 answer returns no chunks and flags the page unchanged."""
+        url = http_server.add_page("/a", _article("A", "Text."), headers={"ETag": '"v1"'})
+        processor = DocumentProcessor()
+        self._fetch_and_remember(processor, url)
+
+        with patch.object(processor, "_parse_url_content") as mock_parse:
+            chunks, metadata = processor.process_url(url)
+
+        assert chunks == []
+        assert metadata["not_modified"] is True
+        assert http_server.requests[1][1]["If-None-Match"] == '"v1"'
+        mock_parse.assert_not_called()
+
+    def test_last_modified_304(self, http_server):
+        """Last-Modified validators are sent back as If-Modified-Since."""
+        stamp = "Mon, 01 Jan 2024 00:00:00 GMT"
+        url = http_server.add_page("/a", _article("A", "Text."), headers={"Last-Modified": stamp})
+        processor = DocumentProcessor()
+        self._fetch_and_remember(processor, url)
+
+        chunks, metadata = processor.process_url(url)
+
+        assert metadata["not_modified"] is True
+        assert http_server.requests[1][1]["If-Modified-Since"] == stamp
+
+    def test_unchanged_body_without_validators(self, http_server):
+        """Servers without validators are compared by body hash."""
+        url = http_server.add_page("/a", _article("A", "Text."))
+        processor = DocumentProcessor()
+        self._fetch_and_remember(processor, url)
+
+        chunks, metadata = processor.process_url(url)
+
+        assert chunks == []
+        assert metadata["not_modified"] is True
+
+    def test_changed_page_is_processed(self, http_server):
+        """A new version of the page is parsed in full."""
+        url = http_server.add_page("/a", _article("A", "Old text."), headers={"ETag": '"v1"'})
+        processor = DocumentProcessor()
+        self._fetch_and_remember(processor, url)
+        http_server.add_page("/a", _article("A", "New text."), headers={"ETag": '"v2"'})
+
+        chunks, metadata = processor.process_url(url)
+
+        assert "New text." in chunks[0]
+        assert metadata["etag"] == '"v2"'
+
+    def test_unremembered_fetch_is_not_cached(self, http_server):
+        """Only versions recorded after storage are revalidated."""
+        url = http_server.add_page("/a", _article("A", "Text."), headers={"ETag": '"v1"'})
+        processor = DocumentProcessor()
+        processor.process_url(url)
+
+        chunks, _ = processor.process_url(url)
+
+        assert chunks
+        assert "If-None-Match" not in http_server.requests[1][1]
+
+
 class TestProcessDocument:
     """Tests for the convenience function process_document."""
 
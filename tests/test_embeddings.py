@@ -0,0 +1,244 @@
+"""
+Tests for Embeddings and Embedding Cache Modules
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from src.embedding_cache import EmbeddingCache, normalize_text
+
+
+DIMENSION = 8
+
+
+class FakeModel:
+    """Deterministic stand-in for SentenceTransformer that records calls."""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def get_sentence_embedding_dimension(self):
+        return DIMENSION
+
+    def encode(self, texts, pool=None, **kwargs):
+        self.calls.append(list(texts))
+        if pool is not None:
+            pool["encoded"] += len(texts)
+        return np.array(
+            [[len(t) + i for i in range(DIMENSION)] for t in texts],
+            dtype=np.float32
+        )
+
+    def start_multi_process_pool(self, target_devices=None):
+        return {"devices": target_devices, "encoded": 0}
+
+    def stop_multi_process_pool(self, pool):
+        pool["stopped"] = True
+
+
+@pytest.fixture
+def cache(temp_dir):
+    """Small embedding cache in a temporary directory."""
+    return EmbeddingCache(temp_dir / "cache", "test-model", DIMENSION, max_entries=3)
+
+
+@pytest.fixture
+def generator(temp_dir):
+    """EmbeddingGenerator backed by FakeModel and a temporary cache."""
+    from src.embeddings import EmbeddingGenerator
+
+    EmbeddingGenerator._instance = None
+    EmbeddingGenerator._model = None
+    EmbeddingGenerator._cache = None
+    EmbeddingGenerator._pool = None
+
+    with patch("src.embeddings.SentenceTransformer", FakeModel), \
+         patch("src.embeddings.EMBEDDING_CACHE_ENABLED", True), \
+         patch("src.embeddings.EMBEDDING_CACHE_DIR", temp_dir / "gen_cache"):
+        yield EmbeddingGenerator()
+
+    EmbeddingGenerator._instance = None
+    EmbeddingGenerator._model = None
+    EmbeddingGenerator._cache = None
+    EmbeddingGenerator._pool = None
+
+
+def _vector(value):
+    return np.full(DIMENSION, value, dtype=np.float32)
+
+
+class TestEmbeddingCache:
+    """Tests for the persistent embedding cache."""
+
+    def test_normalize_text_collapses_whitespace(self):
+        """Whitespace differences do not change the normalized text."""
+        assert normalize_text("  hello \n\t world ") == "hello world"
+
+    def test_key_depends_on_model_and_text(self, temp_dir, cache):
+        """Keys are content addresses scoped by model name."""
+        other = EmbeddingCache(temp_dir / "other", "other-model", DIMENSION, 3)
+
+        assert cache.key("hello  world") == cache.key("hello world")
+        assert cache.key("hello") != cache.key("goodbye")
+        assert cache.key("hello") != other.key("hello")
+
+    def test_get_many_reports_missing(self, cache):
+        """Uncached texts are reported by position."""
+        cache.put_many(["a"], np.stack([_vector(1)]))
+
+        vectors, missing = cache.get_many(["a", "b"])
+
+        assert missing == [1]
+        assert vectors.dtype == np.float32
+        np.testing.assert_array_equal(vectors[0], _vector(1))
+
+    def test_lru_eviction(self, cache):
+        """The least recently used entry is evicted when full."""
+        cache.put_many(["a", "b", "c"], np.stack([_vector(1), _vector(2), _vector(3)]))
+        cache.get("a")  # "b" is now the oldest
+        cache.put_many(["d"], np.stack([_vector(4)]))
+
+        assert len(cache) == 3
+        assert "b" not in cache
+        assert all(t in cache for t in ("a", "c", "d"))
+        np.testing.assert_array_equal(cache.get("d"), _vector(4))
+
+    def test_persists_across_instances(self, temp_dir, cache):
+        """Entries and their LRU order survive reopening the cache."""
+        cache.put_many(["a", "b"], np.stack([_vector(1), _vector(2)]))
+        cache.get("a")
+        cache.flush()
+
+        reopened = EmbeddingCache(temp_dir / "cache", "test-model", DIMENSION, 3)
+        reopened.put_many(["c", "d"], np.stack([_vector(3), _vector(4)]))
+
+        assert "b" not in reopened
+        np.testing.assert_array_equal(reopened.get("a"), _vector(1))
+
+    def test_model_change_discards_entries(self, temp_dir, cache):
+        """A cache written for another model is rebuilt."""
+        cache.put_many(["a"], np.stack([_vector(1)]))
+
+        reopened = EmbeddingCache(temp_dir / "cache", "new-model", DIMENSION, 3)
+
+        assert len(reopened) == 0
+
+    def test_float16_storage(self, temp_dir):
+        """float16 storage halves the store and returns float32 vectors."""
+        cache = EmbeddingCache(temp_dir / "half", "test-model", DIMENSION, 3, dtype="float16")
+        cache.put_many(["a"], np.stack([_vector(0.5)]))
+
+        vector = cache.get("a")
+
+        assert cache._vectors.dtype == np.float16
+        assert vector.dtype == np.float32
+        np.testing.assert_array_equal(vector, _vector(0.5))
+
+    def test_dtype_change_discards_entries(self, temp_dir, cache):
+        """Changing the storage dtype rebuilds the cache."""
+        cache.put_many(["a"], np.stack([_vector(1)]))
+
+        reopened = EmbeddingCache(temp_dir / "cache", "test-model", DIMENSION, 3, dtype="float16")
+
+        assert len(reopened) == 0
+
+    def test_clear(self, cache):
+        """Clearing empties the cache."""
+        cache.put_many(["a"], np.stack([_vector(1)]))
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+
+class TestEmbeddingGeneratorCache:
+    """Tests for cache use in EmbeddingGenerator."""
+
+    def test_repeated_texts_are_not_reencoded(self, generator):
+        """Only texts missing from the cache reach the model."""
+        first = generator.generate(["alpha", "beta"])
+        second = generator.generate(["beta", "gamma", "alpha"])
+
+        assert generator._model.calls == [["alpha", "beta"], ["gamma"]]
+        np.testing.assert_array_equal(second[0], first[1])
+        np.testing.assert_array_equal(second[2], first[0])
+
+    def test_duplicates_in_batch_encoded_once(self, generator):
+        """Duplicate texts within one call are encoded once."""
+        embeddings = generator.generate(["same", "same", "other"])
+
+        assert generator._model.calls == [["other", "same"]]
+        np.testing.assert_array_equal(embeddings[0], embeddings[1])
+
+    def test_single_and_batch_share_cache(self, generator):
+        """Query embeddings reuse vectors cached during ingestion."""
+        batch = generator.generate_batch(["What is RAG?"])
+        single = generator.generate_single("What is RAG?")
+
+        np.testing.assert_array_equal(single, batch[0])
+        assert len(generator._model.calls) == 1
+
+
+class TestBatchedEncoding:
+    """Tests for length-sorted, bounded-batch encoding."""
+
+    @pytest.fixture
+    def uncached(self, generator):
+        """Generator with the cache disabled so every call reaches the model."""
+        from src.embeddings import EmbeddingGenerator
+
+        EmbeddingGenerator._cache = None
+        return generator
+
+    def test_batches_are_bounded_and_length_sorted(self, uncached):
+        """Texts are encoded longest-first in batches of EMBEDDING_BATCH_SIZE."""
+        texts = ["a", "ccc", "bb", "eeeee", "dddd"]
+
+        with patch("src.embeddings.EMBEDDING_BATCH_SIZE", 2):
+            embeddings = uncached.generate(texts)
+
+        assert uncached._model.calls == [["eeeee", "dddd"], ["ccc", "bb"], ["a"]]
+        # Rows come back in input order
+        np.testing.assert_array_equal(embeddings[:, 0], [len(t) for t in texts])
+
+    def test_returns_float32_array(self, uncached):
+        """Embeddings are a contiguous float32 array, not nested lists."""
+        embeddings = uncached.generate(["one", "two"])
+
+        assert isinstance(embeddings, np.ndarray)
+        assert embeddings.dtype == np.float32
+        assert embeddings.shape == (2, DIMENSION)
+
+    def test_empty_input(self, uncached):
+        """An empty request returns an empty array without calling the model."""
+        embeddings = uncached.generate([])
+
+        assert embeddings.shape == (0, DIMENSION)
+        assert uncached._model.calls == []
+
+    def test_large_requests_use_pool(self, uncached):
+        """With workers configured, large requests go through the process pool."""
+        from src.embeddings import EmbeddingGenerator
+
+        texts = [f"text {i}" for i in range(10)]
+
+        with patch("src.embeddings.EMBEDDING_WORKERS", 2), \
+             patch("src.embeddings.EMBEDDING_POOL_MIN_TEXTS", 5):
+            embeddings = uncached.generate(texts)
+            pool = EmbeddingGenerator._pool
+            uncached.stop_pool()
+
+        assert pool["devices"] == ["cpu", "cpu"]
+        assert pool["encoded"] == 10
+        assert pool["stopped"] is True
+        np.testing.assert_array_equal(embeddings[:, 0], [len(t) for t in texts])
+
+    def test_small_requests_stay_in_process(self, uncached):
+        """Requests below the pool threshold do not start the pool."""
+        from src.embeddings import EmbeddingGenerator
+
+        with patch("src.embeddings.EMBEDDING_WORKERS", 2):
+            uncached.generate(["short request"])
+
+        assert EmbeddingGenerator._pool is None
@@ -0,0 +1,164 @@
+"""
+Tests for HTML Extractor Module
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src import html_extractor
+from src.html_extractor import (
+    charset_from_content_type,
+    decode_html,
+    extract_text,
+    lxml_available,
+    resolve_parser
+)
+
+
+PARSERS = [
+    "html.parser",
+    pytest.param("lxml", marks=pytest.mark.skipif(not lxml_available(), reason="lxml not installed")),
+]
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <title> Test  Page </title>
+  <style>body { color: red; }</style>
+  <script>console.log("head");</script>
+</head>
+<body>
+  <header><h1>Site banner</h1></header>
+  <nav><ul><li><a href="/">Home</a></li></ul></nav>
+  <main>
+    <h2>Heading</h2>
+    <p>First paragraph with <b>bold</b> and <a href="#">link</a> text.</p>
+    <p>Caf&eacute; &amp; cr&egrave;me</p>
+    <script>var hidden = 1;</script>
+    <noscript>Enable JavaScript</noscript>
+  </main>
+  <footer>Copyright notice</footer>
+</body>
+</html>"""
+
+
+def _lines(text):
+    return [" ".join(line.split()) for line in text.splitlines() if line.strip()]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+class TestExtractText:
+    """Tests for streaming text extraction, for each tokenizer."""
+
+    def test_drops_boilerplate(self, parser):
+        """Scripts, styles, navigation, headers and footers are skipped."""
+        text = extract_text(PAGE, max_chars=10000, parser=parser).text
+
+        for boilerplate in ("console.log", "color: red", "hidden", "Site banner",
+                            "Home", "Copyright", "Enable JavaScript"):
+            assert boilerplate not in text
+
+    def test_title_is_separate_from_text(self, parser):
+        """The title is returned on its own and not repeated in the text."""
+        extracted = extract_text(PAGE, max_chars=10000, parser=parser)
+
+        assert extracted.title == "Test Page"
+        assert "Test Page" not in extracted.text
+
+    def test_title_ignores_svg_titles(self, parser):
+        """Only the document title is used, not titles of inline SVG icons."""
+        html = (
+            "<html><head><title>T x</title><svg/></head>"
+            "<body><p>Text <svg><title>icon</title><path d='M0 0'/></svg></p>"
+            "<title>late</title></body></html>"
+        )
+
+        assert extract_text(html, max_chars=10000, parser=parser).title == "T x"
+
+    def test_blocks_become_lines(self, parser):
+        """Block elements break lines; inline elements do not."""
+        text = extract_text(PAGE, max_chars=10000, parser=parser).text
+
+        assert _lines(text) == [
+            "Heading",
+            "First paragraph with bold and link text.",
+            "Café & crème",
+        ]
+
+    def test_unclosed_elements_inside_skipped_ones(self, parser):
+        """Closing a skipped element also closes anything left open in it."""
+        html = "<body><nav><ul><li>Menu</nav><p>Kept</p></body>"
+
+        assert _lines(extract_text(html, max_chars=100, parser=parser).text) == ["Kept"]
+
+    def test_stops_at_content_limit(self, parser):
+        """Parsing stops once enough text has been collected."""
+        html = "<body>" + "<p>word word word word</p>" * 5000 + "</body>"
+        fed = []
+
+        real_tokenizer = html_extractor._tokenizer
+
+        def counting_tokenizer(name, collector):
+            feed, close = real_tokenizer(name, collector)
+            return (lambda data: (fed.append(len(data)), feed(data))), close
+
+        with patch("src.html_extractor.FEED_SIZE", 1000), \
+             patch("src.html_extractor._tokenizer", counting_tokenizer):
+            extracted = extract_text(html, max_chars=2000, parser=parser)
+
+        assert extracted.truncated is True
+        assert sum(fed) < len(html) / 10
+        assert len(" ".join(extracted.text.split())) >= 2000
+
+    def test_short_page_is_not_truncated(self, parser):
+        """Pages under the limit are extracted in full."""
+        assert extract_text(PAGE, max_chars=10000, parser=parser).truncated is False
+
+
+class TestDecoding:
+    """Tests for charset handling."""
+
+    def test_header_charset(self):
+        """The Content-Type charset is used when given."""
+        assert charset_from_content_type("text/html; charset=ISO-8859-1") == "ISO-8859-1"
+        assert charset_from_content_type("text/html") is None
+        assert charset_from_content_type(None) is None
+
+    def test_meta_charset(self):
+        """A <meta charset> is honoured when no encoding is given."""
+        body = '<html><head><meta charset="latin-1"></head><body>Café</body></html>'.encode("latin-1")
+
+        assert "Café" in decode_html(body)
+
+    def test_defaults_to_utf8(self):
+        """Pages without a declared charset are read as UTF-8."""
+        assert decode_html("Café".encode("utf-8")) == "Café"
+
+    def test_unknown_charset_falls_back(self):
+        """A bogus charset does not fail extraction."""
+        assert decode_html(b"plain", encoding="no-such-charset") == "plain"
+
+    def test_extract_from_bytes(self):
+        """extract_text accepts raw response bodies."""
+        extracted = extract_text(PAGE.encode("utf-8"), max_chars=10000, parser="html.parser")
+
+        assert "Café & crème" in extracted.text
+
+
+class TestResolveParser:
+    """Tests for tokenizer selection."""
+
+    def test_unknown_parser(self):
+        """Unknown parser names are rejected."""
+        with pytest.raises(ValueError, match="Unknown HTML parser"):
+            resolve_parser("regex")
+
+    def test_falls_back_without_lxml(self):
+        """auto and lxml fall back to html.parser when lxml is missing."""
+        with patch("src.html_extractor.etree", None):
+            assert resolve_parser("auto") == "html.parser"
+            assert resolve_parser("lxml") == "html.parser"
+
+    def test_explicit_stdlib(self):
+        """html.parser can always be forced."""
+        assert resolve_parser("html.parser") == "html.parser"
@@ -0,0 +1,60 @@
+"""
+Tests for HTTP Cache Module
+"""
+
+from src.http_cache import HTTPCache, content_hash
+
+
+URL = "https://example.com/article"
+
+
+class TestHTTPCache:
+    """Tests for the on-disk validator store."""
+
+    def test_conditional_headers(self, temp_dir):
+        """Stored validators become conditional request headers."""
+        cache = HTTPCache(temp_dir)
+        cache.put(URL, "abc", etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+        assert cache.conditional_headers(URL) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+        }
+
+    def test_missing_validators_are_not_sent(self, temp_dir):
+        """A URL served without validators is only compared by body hash."""
+        cache = HTTPCache(temp_dir)
+        cache.put(URL, "abc")
+
+        assert cache.conditional_headers(URL) == {}
+        assert cache.get(URL)["content_hash"] == "abc"
+
+    def test_persists_across_instances(self, temp_dir):
+        """Entries survive reopening the cache."""
+        HTTPCache(temp_dir).put(URL, "abc", etag='"v1"')
+
+        assert HTTPCache(temp_dir).get(URL)["etag"] == '"v1"'
+
+    def test_discard_and_clear(self, temp_dir):
+        """URLs can be forgotten one by one or all at once."""
+        cache = HTTPCache(temp_dir)
+        cache.put(URL, "abc")
+        cache.put("https://example.com/other", "def")
+
+        cache.discard(URL)
+        assert URL not in cache
+        assert len(HTTPCache(temp_dir)) == 1
+
+        cache.clear()
+        assert len(HTTPCache(temp_dir)) == 0
+
+    def test_corrupt_file_starts_empty(self, temp_dir):
+        """An unreadable cache file is discarded."""
+        (temp_dir / "validators.json").write_text("{not json")
+
+        assert len(HTTPCache(temp_dir)) == 0
+
+    def test_content_hash(self):
+        """Body hashes depend only on the bytes."""
+        assert content_hash(b"page") == content_hash(b"page")
+        assert content_hash(b"page") != content_hash(b"page 2")
@@ -0,0 +1,181 @@
+"""
+Tests for PDF Extractor Module
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.pdf_extractor import (
+    BLOCKS_IN_FLIGHT_PER_WORKER,
+    count_pages,
+    extract_page_range,
+    iter_pages,
+    _extract_page,
+    _page_ranges
+)
+from src.document_processor import DocumentProcessor
+
+
+EXPECTED = [f"Page {i} content" for i in range(1, 13)]
+
+
+class TestExtractPages:
+    """Tests for sequential page extraction."""
+
+    @pytest.mark.parametrize("extractor", ["pdfplumber", "pypdf"])
+    def test_extract_all_pages_in_order(self, multi_page_pdf, extractor):
+        """Both engines extract every page in order."""
+        results = extract_page_range(multi_page_pdf, extractor=extractor)
+
+        assert [r[0] for r in results] == list(range(1, 13))
+        assert [r[1] for r in results] == EXPECTED
+        assert all(r[2] is None for r in results)
+
+    @pytest.mark.parametrize("extractor", ["pdfplumber", "pypdf"])
+    def test_count_pages(self, multi_page_pdf, extractor):
+        """Page counts agree across engines."""
+        assert count_pages(multi_page_pdf, extractor) == 12
+
+    def test_extract_sub_range(self, multi_page_pdf):
+        """A page range yields 1-based page numbers."""
+        results = extract_page_range(multi_page_pdf, 3, 5, "pypdf")
+
+        assert [(r[0], r[1]) for r in results] == [(4, "Page 4 content"), (5, "Page 5 content")]
+
+    def test_pages_are_yielded_as_extracted(self, multi_page_pdf):
+        """In-process extraction does not extract ahead of the consumer."""
+        extracted = []
+
+        def recording(page_num, page, extractor):
+            extracted.append(page_num)
+            return _extract_page(page_num, page, extractor)
+
+        with patch("src.pdf_extractor._extract_page", side_effect=recording):
+            pages = iter_pages(multi_page_pdf, extractor="pypdf", workers=1)
+            assert next(pages)[0] == 1
+            assert extracted == [1]
+            pages.close()
+
+    def test_page_failure_is_captured(self):
+        """A failing page becomes an error result instead of raising."""
+        page = MagicMock()
+        page.extract_text.side_effect = Exception("bad page")
+
+        assert _extract_page(7, page, "pdfplumber") == (7, None, "bad page")
+        page.close.assert_called_once()
+
+    def test_unknown_extractor(self, multi_page_pdf):
+        """An unsupported engine name is rejected."""
+        with pytest.raises(ValueError):
+            list(iter_pages(multi_page_pdf, extractor="ocr"))
+
+
+class TestParallelExtraction:
+    """Tests for process-pool page extraction."""
+
+    def test_page_ranges_cover_document(self):
+        """Blocks are contiguous and cover every page exactly once."""
+        ranges = _page_ranges(101, workers=4)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 101
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+    @pytest.mark.parametrize("extractor", ["pdfplumber", "pypdf"])
+    def test_parallel_keeps_page_order(self, multi_page_pdf, extractor):
+        """Pages extracted by workers are reassembled in page order."""
+        with patch("src.pdf_extractor.PDF_PARALLEL_MIN_PAGES", 2):
+            results = list(iter_pages(multi_page_pdf, extractor=extractor, workers=3))
+
+        assert [r[0] for r in results] == list(range(1, 13))
+        assert [r[1] for r in results] == EXPECTED
+
+    def test_small_documents_stay_in_process(self, multi_page_pdf):
+        """Documents below the page threshold do not start a pool."""
+        with patch("src.pdf_extractor.ProcessPoolExecutor") as mock_pool:
+            results = list(iter_pages(multi_page_pdf, workers=4))
+
+        mock_pool.assert_not_called()
+        assert len(results) == 12
+
+    def test_blocks_in_flight_are_bounded(self, multi_page_pdf):
+        """Blocks are submitted as earlier ones are consumed, not all at once."""
+        submitted = []
+
+        class RecordingExecutor:
+            def __init__(self, max_workers, mp_context=None):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, *args):
+                submitted.append(args[1:3])
+                future = MagicMock()
+                future.result.return_value = fn(*args)
+                return future
+
+        with patch("src.pdf_extractor.PDF_PARALLEL_MIN_PAGES", 2), \
+             patch("src.pdf_extractor.ProcessPoolExecutor", RecordingExecutor):
+            pages = iter_pages(multi_page_pdf, extractor="pypdf", workers=2)
+            assert next(pages)[0] == 1
+            assert len(submitted) == 2 * BLOCKS_IN_FLIGHT_PER_WORKER + 1
+            results = [r[0] for r in pages]
+
+        assert len(submitted) == len(_page_ranges(12, 2))
+        assert [1] + results == list(range(1, 13))
+
+    def test_failed_block_does_not_lose_document(self, multi_page_pdf):
+        """A worker failure marks only its own pages as failed."""
+        def flaky(path, start, stop, extractor):
+            if start == 0:
+                raise RuntimeError("worker crashed")
+            return extract_page_range(path, start, stop, extractor)
+
+        start_methods = []
+
+        class InlineExecutor:
+            def __init__(self, max_workers, mp_context=None):
+                start_methods.append(mp_context and mp_context.get_start_method())
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, *args):
+                future = MagicMock()
+                try:
+                    future.result.return_value = flaky(*args)
+                except Exception as e:
+                    future.result.side_effect = e
+                return future
+
+        with patch("src.pdf_extractor.PDF_PARALLEL_MIN_PAGES", 2), \
+             patch("src.pdf_extractor.ProcessPoolExecutor", InlineExecutor):
+            results = list(iter_pages(multi_page_pdf, extractor="pypdf", workers=2))
+
+        failed = [r for r in results if r[2] is not None]
+        assert start_methods == ["spawn"]  # forking a threaded process can deadlock
+        assert [r[0] for r in results] == list(range(1, 13))
+        assert failed and all(r[2] == "worker crashed" for r in failed)
+        assert [r[1] for r in results if r[2] is None] == EXPECTED[len(failed):]
+
+
+class TestProcessPDFExtractors:
+    """Tests for extractor selection in DocumentProcessor.process_pdf."""
+
+    @pytest.mark.parametrize("extractor", ["pdfplumber", "pypdf"])
+    def test_process_pdf_with_extractor(self, multi_page_pdf, extractor):
+        """Both engines produce the same chunks and page count."""
+        processor = DocumentProcessor()
+
+        chunks, metadata = processor.process_pdf(str(multi_page_pdf), extractor=extractor)
+
+        assert metadata["page_count"] == 12
+        assert "Page 1 content" in chunks[0]
+        assert "Page 12 content" in chunks[-1]
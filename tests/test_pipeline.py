@@ -0,0 +1,206 @@
+"""
+Tests for Pipeline Utility Module
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.pipeline import BackgroundLoop, background, batched, bounded_map
+
+
+class TestBatched:
+    """Tests for batching."""
+
+    def test_batched(self):
+        """Items are grouped in order with a short final batch."""
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_batched_empty(self):
+        """An empty source yields no batches."""
+        assert list(batched([], 3)) == []
+
+
+class TestBackground:
+    """Tests for background pipeline stages."""
+
+    def test_preserves_order_and_applies_func(self):
+        """Results arrive in source order."""
+        assert list(background(range(10), lambda x: x * x)) == [x * x for x in range(10)]
+
+    def test_chained_stages(self):
+        """Stages can be chained into a pipeline."""
+        first = background(range(6), lambda x: x + 1, maxsize=1)
+        second = background(batched(first, 4), sum, maxsize=1)
+
+        assert list(second) == [1 + 2 + 3 + 4, 5 + 6]
+
+    def test_runs_ahead_by_at_most_maxsize(self):
+        """The producer is bounded by the queue size."""
+        produced = []
+
+        def source():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        stage = background(source(), maxsize=2)
+        next(stage)
+        time.sleep(0.2)
+
+        # One consumed, two queued, one blocked on put
+        assert len(produced) <= 4
+        stage.close()
+
+    def test_errors_reach_consumer(self):
+        """An exception in a stage is re-raised in the consumer."""
+        def fail(x):
+            if x == 3:
+                raise ValueError("bad item")
+            return x
+
+        results = []
+        with pytest.raises(ValueError, match="bad item"):
+            for item in background(range(10), fail):
+                results.append(item)
+
+        assert results == [0, 1, 2]
+
+    def test_close_stops_upstream(self):
+        """Closing the consumer stops and closes every upstream stage."""
+        closed = threading.Event()
+
+        def source():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        stage = background(background(source(), maxsize=1), maxsize=1)
+        assert next(stage) == 0
+        stage.close()
+
+        assert closed.wait(timeout=2)
+
+
+class TestBoundedMap:
+    """Tests for the per-key bounded thread pool."""
+
+    @staticmethod
+    def _tracking(delay=0.02):
+        """Function that records the peak concurrency per key."""
+        lock = threading.Lock()
+        active, peak = {}, {}
+
+        def func(item):
+            key = item[0]
+            with lock:
+                active[key] = active.get(key, 0) + 1
+                peak[key] = max(peak.get(key, 0), active[key])
+            time.sleep(delay)
+            with lock:
+                active[key] -= 1
+            return item.upper()
+
+        return func, peak
+
+    def test_returns_every_result(self):
+        """Every item is processed exactly once."""
+        results = bounded_map(lambda x: x * 2, range(20), workers=4)
+
+        assert sorted(result for _, result, _ in results) == [x * 2 for x in range(20)]
+
+    def test_per_key_limit(self):
+        """No key ever exceeds its concurrency limit."""
+        func, peak = self._tracking()
+        items = [f"{host}{i}" for host in "ab" for i in range(6)]
+
+        results = list(bounded_map(func, items, workers=6, key=lambda s: s[0], per_key=2))
+
+        assert len(results) == 12
+        assert peak == {"a": 2, "b": 2}
+
+    def test_failures_are_reported_per_item(self):
+        """A failing item is yielded with its error and the rest continue."""
+        def func(x):
+            if x == 2:
+                raise ValueError("bad item")
+            return x
+
+        results = {item: (result, error) for item, result, error in bounded_map(func, range(4), workers=2)}
+
+        assert isinstance(results[2][1], ValueError)
+        assert [results[i][0] for i in (0, 1, 3)] == [0, 1, 3]
+
+
+class TestBackgroundLoop:
+    """Tests for driving async code from synchronous code."""
+
+    @pytest.fixture
+    def loop(self):
+        """A running background event loop."""
+        loop = BackgroundLoop()
+        yield loop
+        loop.close()
+
+    def test_run(self, loop):
+        """Coroutines run on the loop thread and return their result."""
+        async def where():
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+        assert loop.run(where()) == "event-loop"
+
+    def test_iterate(self, loop):
+        """An async generator is iterated in order."""
+        async def numbers():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+
+        assert list(loop.iterate(numbers())) == [0, 1, 2]
+
+    def test_iterate_reraises(self, loop):
+        """Exceptions from the generator reach the consumer."""
+        async def failing():
+            yield 1
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            list(loop.iterate(failing()))
+
+    def test_iterate_reraises_cancellation(self, loop):
+        """A generator cancelled on the loop does not leave the consumer waiting."""
+        async def cancelled():
+            yield 1
+            raise asyncio.CancelledError()
+
+        items = loop.iterate(cancelled())
+        assert next(items) == 1
+        with pytest.raises(asyncio.CancelledError):
+            next(items)
+
+    def test_closing_cancels_generator(self, loop):
+        """Abandoning the iterator cancels the generator at its await."""
+        cancelled = threading.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield "tick"
+                    await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        items = loop.iterate(endless())
+        assert next(items) == "tick"
+        items.close()
+
+        assert cancelled.wait(timeout=1)
+
@@ -2,6 +2,7 @@
 Tests for RAG Pipeline Module
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -33,9 +34,9 @@ class TestIngestPDF:
         from src.rag_pipeline import RAGPipeline
 
         # Setup mocks
-        mock_doc_processor.return_value.process_pdf.return_value = (
-            ["chunk1", "chunk2"],
-            {"source": "test.pdf", "type": "pdf", "ingested_at": "2024-01-01"}
+        mock_doc_processor.return_value.stream_pdf.return_value = (
+            iter([("chunk1", 1), ("chunk2", 1)]),
+            {"source": "test.pdf", "type": "pdf", "page_count": 1, "ingested_at": "2024-01-01"}
         )
         mock_vector_store.return_value.add_documents.return_value = ["id1", "id2"]
 
@@ -54,7 +55,7 @@ class TestIngestPDF:
         """Test PDF ingestion error handling."""
         from src.rag_pipeline import RAGPipeline
 
-        mock_doc_processor.return_value.process_pdf.side_effect = FileNotFoundError("Not found")
+        mock_doc_processor.return_value.stream_pdf.side_effect = FileNotFoundError("Not found")
 
         pipeline = RAGPipeline()
 
@@ -71,9 +72,9 @@ class TestIngestPDFUpload:
         """Test successful uploaded PDF ingestion."""
         from src.rag_pipeline import RAGPipeline
 
-        mock_doc_processor.return_value.process_pdf_upload.return_value = (
-            ["chunk1"],
-            {"source": "uploaded.pdf", "type": "pdf", "ingested_at": "2024-01-01"}
+        mock_doc_processor.return_value.stream_pdf.return_value = (
+            iter([("chunk1", 1)]),
+            {"source": "uploaded.pdf", "type": "pdf", "page_count": 1, "ingested_at": "2024-01-01"}
         )
         mock_vector_store.return_value.add_documents.return_value = ["id1"]
 
@@ -82,6 +83,9 @@ class TestIngestPDFUpload:
 
         assert result["success"] is True
         assert result["source"] == "uploaded.pdf"
+        mock_doc_processor.return_value.save_upload.assert_called_once_with(
+            mock_uploaded_file, "uploaded.pdf"
+        )
 
 
 class TestIngestURL:
@@ -163,6 +167,391 @@ class TestIngestChunks:
         assert result["chunks_created"] == 0
 
 
+class FakeStore:
+    """In-memory stand-in for VectorStore that records embedding calls."""
+
+    def __init__(self):
+        self.docs = {}
+        self.embedded = []
+
+    def get_source_ids(self, source):
+        return {id_ for id_, (_, m) in self.docs.items() if m["source"] == source}
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[0.1] * 4 for _ in texts]
+
+    def add_documents(self, texts, metadatas, ids=None, embeddings=None):
+        if embeddings is None:
+            self.embed_documents(texts)
+        for id_, text, metadata in zip(ids, texts, metadatas):
+            self.docs[id_] = (text, dict(metadata))
+        return ids
+
+    def update_metadatas(self, ids, metadatas):
+        for id_, metadata in zip(ids, metadatas):
+            self.docs[id_][1].update(metadata)
+
+    def delete_by_ids(self, ids):
+        for id_ in ids:
+            del self.docs[id_]
+
+    def flush(self):
+        pass
+
+
+class TestStreamingIngestion:
+    """Tests for batch-by-batch PDF ingestion."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """RAGPipeline backed by an in-memory store."""
+        from src.rag_pipeline import RAGPipeline
+
+        with patch("src.rag_pipeline.VectorStore") as mock_vector_store, \
+             patch("src.rag_pipeline.DocumentProcessor"):
+            mock_vector_store.return_value = MagicMock(wraps=FakeStore())
+            yield RAGPipeline()
+
+    @staticmethod
+    def _chunks(count, per_page=3):
+        return ((f"chunk {i}", i // per_page + 1) for i in range(count))
+
+    def test_stores_in_batches_with_progress(self, pipeline):
+        """Chunks are stored batch by batch and progress is reported per batch."""
+        progress = []
+        metadata = {"source": "big.pdf", "type": "pdf", "page_count": 4}
+
+        with patch("src.rag_pipeline.INGEST_BATCH_SIZE", 4):
+            result = pipeline._ingest_stream(self._chunks(10), metadata, progress.append)
+
+        store = pipeline.vector_store
+        assert result["success"] is True
+        assert result["chunks_created"] == 10
+        assert len(set(result["ids"])) == 10
+        assert store.add_documents.call_count == 3
+        assert [p.chunks_stored for p in progress] == [4, 8, 10]
+        assert progress[-1].fraction == 1.0
+
+    def test_chunk_metadata(self, pipeline):
+        """Chunk indexes run across batches and the total is set at the end."""
+        metadata = {"source": "doc.pdf", "type": "pdf", "page_count": 2}
+
+        with patch("src.rag_pipeline.INGEST_BATCH_SIZE", 2):
+            result = pipeline._ingest_stream(self._chunks(5), metadata)
+
+        docs = pipeline.vector_store._mock_wraps.docs
+        stored = [docs[id_][1] for id_ in result["ids"]]
+        assert [m["chunk_index"] for m in stored] == list(range(5))
+        assert all(m["chunk_total"] == 5 for m in stored)
+
+    def test_embeddings_are_passed_to_store(self, pipeline):
+        """Batches are embedded once and stored with their embeddings."""
+        pipeline._ingest_stream(self._chunks(2), {"source": "doc.pdf", "type": "pdf"})
+
+        call = pipeline.vector_store.add_documents.call_args
+        assert call.kwargs["embeddings"] == [[0.1] * 4, [0.1] * 4]
+        pipeline.vector_store.embed_documents.assert_called_once_with(["chunk 0", "chunk 1"])
+
+    def test_failure_removes_partial_ingestion(self, pipeline):
+        """A failing stage rolls back the chunks already stored."""
+        def failing_chunks():
+            yield from self._chunks(4)
+            raise ValueError("corrupt page")
+
+        with patch("src.rag_pipeline.INGEST_BATCH_SIZE", 2):
+            with pytest.raises(ValueError, match="corrupt page"):
+                pipeline._ingest_stream(failing_chunks(), {"source": "bad.pdf", "type": "pdf"})
+
+        assert pipeline.vector_store._mock_wraps.docs == {}
+
+    def test_pdf_chunks_are_stored_while_pages_are_extracted(self, temp_dir):
+        """The first chunk reaches the store before the last page is extracted."""
+        from src.rag_pipeline import RAGPipeline
+
+        page_count = 100
+        events = []
+
+        class StubPage:
+            def __init__(self, page_num):
+                self.page_num = page_num
+
+            def extract_text(self):
+                events.append(("extract", self.page_num))
+                return f"Page {self.page_num} sentence. " * 150
+
+        reader = MagicMock(pages=[StubPage(i) for i in range(1, page_count + 1)])
+
+        store = FakeStore()
+        add_documents = store.add_documents
+
+        def recording_add(texts, metadatas, ids=None, embeddings=None):
+            events.append(("store", len(texts)))
+            return add_documents(texts, metadatas, ids=ids, embeddings=embeddings)
+
+        store.add_documents = recording_add
+        pdf_path = temp_dir / "long.pdf"
+        pdf_path.write_bytes(b"%PDF stub")
+
+        with patch("src.rag_pipeline.VectorStore", return_value=store), \
+             patch("src.pdf_extractor._pdf_reader", return_value=reader), \
+             patch("src.pdf_extractor.PDF_EXTRACTOR", "pypdf"), \
+             patch("src.document_processor.PDF_EXTRACTOR", "pypdf"), \
+             patch("src.rag_pipeline.INGEST_BATCH_SIZE", 2):
+            result = RAGPipeline().ingest_pdf(str(pdf_path))
+
+        assert result["success"] is True
+        first_store = events.index(("store", 2))
+        assert first_store < events.index(("extract", page_count))
+
+    def test_empty_document(self, pipeline):
+        """A document without text reports failure and stores nothing."""
+        result = pipeline._ingest_stream(iter([]), {"source": "blank.pdf", "type": "pdf"})
+
+        assert result["success"] is False
+        assert result["chunks_created"] == 0
+        pipeline.vector_store.add_documents.assert_not_called()
+
+
+class TestIncrementalIngestion:
+    """Tests for content-hash chunk IDs and re-ingestion."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """RAGPipeline backed by an in-memory store."""
+        from src.rag_pipeline import RAGPipeline
+
+        with patch("src.rag_pipeline.VectorStore") as mock_vector_store, \
+             patch("src.rag_pipeline.DocumentProcessor"):
+            mock_vector_store.return_value = FakeStore()
+            yield RAGPipeline()
+
+    def _ingest(self, pipeline, chunks, source="living.pdf"):
+        pairs = ((chunk, 1) for chunk in chunks)
+        return pipeline._ingest_stream(pairs, {"source": source, "type": "pdf", "page_count": 1})
+
+    def test_chunk_ids_are_deterministic(self):
+        """The same chunk of the same source always gets the same ID."""
+        from src.vector_store import ChunkIdGenerator
+
+        first, second = ChunkIdGenerator("a.pdf"), ChunkIdGenerator("a.pdf")
+
+        assert first("Some text") == second("Some  text")
+        assert first("Some text") != second("Other text")
+        assert ChunkIdGenerator("b.pdf")("Some text") != ChunkIdGenerator("a.pdf")("Some text")
+
+    def test_repeated_chunks_get_distinct_ids(self):
+        """Duplicate chunks within a source do not collide."""
+        from src.vector_store import ChunkIdGenerator
+
+        chunk_id = ChunkIdGenerator("a.pdf")
+
+        assert len({chunk_id("Header"), chunk_id("Header"), chunk_id("Header")}) == 3
+
+    def test_reingesting_unchanged_source_embeds_nothing(self, pipeline):
+        """A second ingestion of the same content reuses every stored chunk."""
+        self._ingest(pipeline, ["alpha", "beta", "gamma"])
+        store = pipeline.vector_store
+        store.embedded.clear()
+
+        result = self._ingest(pipeline, ["alpha", "beta", "gamma"])
+
+        assert store.embedded == []
+        assert result["chunks_added"] == 0
+        assert result["chunks_unchanged"] == 3
+        assert len(store.docs) == 3
+
+    def test_reingesting_changed_source(self, pipeline):
+        """Only new chunks are embedded and vanished chunks are deleted."""
+        self._ingest(pipeline, ["alpha", "beta", "gamma"])
+        store = pipeline.vector_store
+        store.embedded.clear()
+
+        result = self._ingest(pipeline, ["alpha", "gamma", "delta"])
+
+        assert store.embedded == ["delta"]
+        assert result["chunks_added"] == 1
+        assert result["chunks_deleted"] == 1
+        assert sorted(text for text, _ in store.docs.values()) == ["alpha", "delta", "gamma"]
+        indexes = {text: m["chunk_index"] for text, m in store.docs.values()}
+        assert indexes == {"alpha": 0, "gamma": 1, "delta": 2}
+
+    def test_failed_reingestion_keeps_old_content(self, pipeline):
+        """If finishing a re-ingestion fails, stale chunks are not yet deleted."""
+        self._ingest(pipeline, ["alpha", "beta", "gamma"])
+        store = pipeline.vector_store
+
+        update_metadatas = store.update_metadatas
+
+        def failing_total(ids, metadatas):
+            if "chunk_total" in metadatas[0]:
+                raise RuntimeError("store down")
+            update_metadatas(ids, metadatas)
+
+        with patch.object(store, "update_metadatas", side_effect=failing_total):
+            with pytest.raises(RuntimeError, match="store down"):
+                self._ingest(pipeline, ["alpha", "delta"])
+
+        assert sorted(text for text, _ in store.docs.values()) == ["alpha", "beta", "gamma"]
+
+    def test_other_sources_untouched(self, pipeline):
+        """Re-ingesting one source never deletes another source's chunks."""
+        self._ingest(pipeline, ["shared text"], source="a.pdf")
+        self._ingest(pipeline, ["shared text"], source="b.pdf")
+
+        self._ingest(pipeline, ["new text"], source="a.pdf")
+
+        sources = sorted(m["source"] for _, m in pipeline.vector_store.docs.values())
+        assert sources == ["a.pdf", "b.pdf"]
+
+    def test_url_reingestion_is_incremental(self, pipeline):
+        """Whole-document ingestion (URLs) uses the same diff."""
+        metadata = {"source": "https://example.com", "type": "url"}
+        pipeline._ingest_chunks(["one", "two"], metadata)
+        store = pipeline.vector_store
+        store.embedded.clear()
+
+        result = pipeline._ingest_chunks(["two", "three"], metadata)
+
+        assert store.embedded == ["three"]
+        assert result["chunks_deleted"] == 1
+        assert len(store.docs) == 2
+
+
+class TestURLBatchIngestion:
+    """Tests for concurrent ingestion of many URLs against a local server."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """RAGPipeline with a real DocumentProcessor and an in-memory store."""
+        from src.rag_pipeline import RAGPipeline
+
+        with patch("src.rag_pipeline.VectorStore") as mock_vector_store:
+            mock_vector_store.return_value = FakeStore()
+            yield RAGPipeline()
+
+    @staticmethod
+    def _add_pages(server, count):
+        return [
+            server.add_page(
+                f"/article{i}",
+                f"<html><head><title>Article {i}</title></head>"
+                f"<body><p>Article number {i} talks about topic {i}.</p></body></html>"
+            )
+            for i in range(count)
+        ]
+
+    def test_ingests_all_urls(self, pipeline, http_server):
+        """Every page is fetched, embedded and stored under its own source."""
+        urls = self._add_pages(http_server, 6)
+        progress = []
+
+        result = pipeline.ingest_urls(urls, progress_callback=progress.append)
+
+        assert result["success"] is True
+        assert result["succeeded"] == 6
+        assert [r["source"] for r in result["results"]] == urls
+        stored_sources = {m["source"] for _, m in pipeline.vector_store.docs.values()}
+        assert stored_sources == set(urls)
+        assert [p.pages_read for p in progress] == list(range(1, 7))
+        assert progress[-1].fraction == 1.0
+
+    def test_failures_are_reported_per_url(self, pipeline, http_server):
+        """Unreachable and empty pages fail individually."""
+        good = self._add_pages(http_server, 2)
+        empty = http_server.add_page("/empty", "<html><body></body></html>")
+        missing = http_server.url("/missing")
+
+        with patch("time.sleep"):
+            result = pipeline.ingest_urls(good + [empty, missing])
+
+        assert result["succeeded"] == 2
+        assert result["failed"] == 2
+        errors = {r["source"]: r.get("error") for r in result["results"]}
+        assert errors[empty] == "No content extracted"
+        assert "Failed to fetch URL" in errors[missing]
+
+    def test_duplicate_urls_fetched_once(self, pipeline, http_server):
+        """Repeated URLs in a batch are only fetched once."""
+        url = self._add_pages(http_server, 1)[0]
+
+        result = pipeline.ingest_urls([url, url])
+
+        assert result["urls"] == 1
+        assert len(http_server.requests) == 1
+
+
+class TestURLRefresh:
+    """Tests for revalidating URL sources already in the knowledge base."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """RAGPipeline with a real DocumentProcessor and an in-memory store."""
+        from src.rag_pipeline import RAGPipeline
+
+        with patch("src.rag_pipeline.VectorStore") as mock_vector_store:
+            mock_vector_store.return_value = FakeStore()
+            pipeline = RAGPipeline()
+            pipeline.get_sources = lambda: [
+                {"source": source, "type": "url"}
+                for source in {m["source"] for _, m in pipeline.vector_store.docs.values()}
+            ]
+            yield pipeline
+
+    @staticmethod
+    def _page(text):
+        return f"<html><body><p>{text}</p></body></html>"
+
+    def test_unchanged_url_is_not_reembedded(self, pipeline, http_server):
+        """Re-ingesting an unchanged URL costs only a conditional request."""
+        url = http_server.add_page("/a", self._page("Stable text."), headers={"ETag": '"v1"'})
+        pipeline.ingest_url(url)
+        pipeline.vector_store.embedded.clear()
+
+        result = pipeline.ingest_url(url)
+
+        assert result["success"] is True
+        assert result["not_modified"] is True
+        assert pipeline.vector_store.embedded == []
+
+    def test_refresh_updates_only_changed_urls(self, pipeline, http_server):
+        """Refreshing re-embeds changed pages and skips the rest."""
+        stable = http_server.add_page("/stable", self._page("Stable text."), headers={"ETag": '"s1"'})
+        changing = http_server.add_page("/changing", self._page("Old text."), headers={"ETag": '"c1"'})
+        pipeline.ingest_urls([stable, changing])
+        pipeline.vector_store.embedded.clear()
+        http_server.add_page("/changing", self._page("New text."), headers={"ETag": '"c2"'})
+
+        result = pipeline.refresh_url_sources()
+
+        assert result["urls"] == 2
+        assert result["not_modified"] == 1
+        assert pipeline.vector_store.embedded == ["New text."]
+        texts = sorted(text for text, _ in pipeline.vector_store.docs.values())
+        assert texts == ["New text.", "Stable text."]
+
+    def test_cached_url_missing_from_store_is_refetched(self, pipeline, http_server):
+        """A 304 for a URL whose chunks are gone triggers a full fetch."""
+        url = http_server.add_page("/a", self._page("Text."), headers={"ETag": '"v1"'})
+        pipeline.ingest_url(url)
+        pipeline.vector_store.docs.clear()
+
+        result = pipeline.ingest_url(url)
+
+        assert result["chunks_created"] == 1
+        assert len(pipeline.vector_store.docs) == 1
+
+    def test_delete_source_forgets_url(self, pipeline, http_server):
+        """Deleted URLs are fetched unconditionally next time."""
+        url = http_server.add_page("/a", self._page("Text."), headers={"ETag": '"v1"'})
+        pipeline.ingest_url(url)
+        pipeline.vector_store.delete_by_source = MagicMock(return_value=1)
+
+        pipeline.delete_source(url)
+
+        assert url not in pipeline.document_processor.http_cache
+
+
 class TestRetrieveContext:
     """Tests for context retrieval."""
 
@@ -238,6 +627,53 @@ class TestRetrieveContext:
         assert "pdf" in source_types
         assert "url" in source_types
 
+    @patch("src.rag_pipeline.VectorStore")
+    @patch("src.rag_pipeline.DocumentProcessor")
+    def test_retrieve_context_merges_adjacent_chunks(self, mock_doc_processor, mock_vector_store):
+        """Test that neighbouring chunks of a source form one excerpt."""
+        from src.rag_pipeline import RAGPipeline
+
+        mock_vector_store.return_value.search.return_value = [
+            {
+                "text": f"Part {i} of the section.",
+                "metadata": {"source": "paper.pdf", "type": "pdf", "chunk_index": i},
+                "similarity": 0.8,
+                "id": f"id{i}"
+            }
+            for i in (5, 4)
+        ]
+
+        pipeline = RAGPipeline()
+        context, sources = pipeline.retrieve_context("test query")
+
+        assert "Excerpt 2" not in context
+        assert context.index("Part 4") < context.index("Part 5")
+        assert len(sources) == 1
+
+    @patch("src.rag_pipeline.VectorStore")
+    @patch("src.rag_pipeline.DocumentProcessor")
+    def test_retrieve_context_fits_budget(self, mock_doc_processor, mock_vector_store):
+        """Test that context beyond the token budget is dropped."""
+        from src.rag_pipeline import RAGPipeline
+
+        mock_vector_store.return_value.search.return_value = [
+            {
+                "text": f"Result {i}. " + "filler " * 500,
+                "metadata": {"source": f"doc{i}.pdf", "type": "pdf"},
+                "similarity": 0.8,
+                "id": f"id{i}"
+            }
+            for i in range(5)
+        ]
+
+        with patch("src.rag_pipeline.CONTEXT_TOKEN_BUDGET", 1200):
+            pipeline = RAGPipeline()
+            context, sources = pipeline.retrieve_context("test query")
+
+        assert "Result 0" in context
+        assert "Result 4" not in context
+        assert len(sources) < 5
+
     @patch("src.rag_pipeline.VectorStore")
     @patch("src.rag_pipeline.DocumentProcessor")
     def test_retrieve_context_respects_top_k(self, mock_doc_processor, mock_vector_store):
@@ -249,7 +685,9 @@ class TestRetrieveContext:
         pipeline = RAGPipeline()
         pipeline.retrieve_context("test", top_k=3)
 
-        mock_vector_store.return_value.search.assert_called_once_with("test", top_k=3)
+        call = mock_vector_store.return_value.search.call_args
+        assert call.args == ("test",)
+        assert call.kwargs["top_k"] == 3
 
     @patch("src.rag_pipeline.VectorStore")
     @patch("src.rag_pipeline.DocumentProcessor")
@@ -266,6 +704,106 @@ class TestRetrieveContext:
         assert sources == []
 
 
+class SearchableStore:
+    """Vector store stand-in with a version counter and canned embeddings."""
+
+    def __init__(self, embeddings):
+        self.version = 0
+        self.embeddings = embeddings
+        self.embedded = []
+        self.search = MagicMock(side_effect=lambda query, top_k, query_embedding: [{
+            "text": f"Answer to {query}",
+            "metadata": {"source": "doc.pdf", "type": "pdf"},
+            "similarity": 0.9,
+            "id": query
+        }])
+
+    def embed_query(self, query):
+        self.embedded.append(query)
+        return self.embeddings[query]
+
+
+class TestQueryCache:
+    """Tests for the retrieval cache in front of the vector store."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """RAGPipeline with a store returning fixed query embeddings."""
+        from src.rag_pipeline import RAGPipeline
+
+        store = SearchableStore({
+            "What is RAG?": np.array([1.0, 0.0, 0.0]),
+            "what is RAG": np.array([0.99, 0.05, 0.0]),
+            "Who wrote it?": np.array([0.0, 1.0, 0.0]),
+        })
+        with patch("src.rag_pipeline.VectorStore", return_value=store), \
+             patch("src.rag_pipeline.DocumentProcessor"):
+            yield RAGPipeline()
+
+    def test_repeated_query_skips_embedding_and_search(self, pipeline):
+        """An identical question is answered from the cache."""
+        first = pipeline.retrieve_context("What is RAG?")
+        second = pipeline.retrieve_context("What  is RAG? ")
+
+        assert second == first
+        assert pipeline.vector_store.embedded == ["What is RAG?"]
+        assert pipeline.vector_store.search.call_count == 1
+
+    def test_similar_query_skips_search(self, pipeline):
+        """A rephrased question reuses the results of a similar one."""
+        pipeline.retrieve_context("What is RAG?")
+        context, _ = pipeline.retrieve_context("what is RAG")
+
+        assert "Answer to What is RAG?" in context
+        assert pipeline.vector_store.search.call_count == 1
+
+    def test_different_query_searches(self, pipeline):
+        """Unrelated questions are searched."""
+        pipeline.retrieve_context("What is RAG?")
+        pipeline.retrieve_context("Who wrote it?")
+
+        assert pipeline.vector_store.search.call_count == 2
+
+    def test_top_k_is_part_of_the_key(self, pipeline):
+        """Results for one top_k are not reused for another."""
+        pipeline.retrieve_context("What is RAG?", top_k=3)
+        pipeline.retrieve_context("What is RAG?", top_k=8)
+
+        assert pipeline.vector_store.search.call_count == 2
+
+    def test_store_change_invalidates(self, pipeline):
+        """Results are dropped once the store's version changes."""
+        pipeline.retrieve_context("What is RAG?")
+        pipeline.vector_store.version += 1
+        pipeline.retrieve_context("What is RAG?")
+
+        assert pipeline.vector_store.search.call_count == 2
+
+    def test_entries_expire(self, pipeline):
+        """Results older than the TTL are not reused."""
+        with patch("src.query_cache.time.monotonic", return_value=1000.0):
+            pipeline.retrieve_context("What is RAG?")
+        with patch("src.query_cache.time.monotonic", return_value=1000.0 + pipeline.query_cache.ttl + 1):
+            pipeline.retrieve_context("What is RAG?")
+
+        assert pipeline.vector_store.search.call_count == 2
+
+    def test_cache_can_be_disabled(self):
+        """With the cache disabled every question is searched directly."""
+        from src.rag_pipeline import RAGPipeline
+
+        with patch("src.rag_pipeline.VectorStore") as mock_vector_store, \
+             patch("src.rag_pipeline.DocumentProcessor"), \
+             patch("src.rag_pipeline.QUERY_CACHE_ENABLED", False):
+            mock_vector_store.return_value.search.return_value = []
+            pipeline = RAGPipeline()
+            pipeline.retrieve_context("test")
+            pipeline.retrieve_context("test")
+
+        assert pipeline.query_cache is None
+        assert mock_vector_store.return_value.search.call_count == 2
+
+
 class TestDeleteSource:
     """Tests for source deletion."""
 
@@ -340,3 +878,61 @@ class TestClearKnowledgeBase:
         pipeline.clear_knowledge_base()
 
         mock_vector_store.return_value.clear_collection.assert_called_once()
+
+
+class TestReranking:
+    """Tests for the optional cross-encoder rerank stage."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """RAGPipeline with reranking enabled and a mock reranker."""
+        from src.rag_pipeline import RAGPipeline
+
+        with patch("src.rag_pipeline.VectorStore") as mock_vector_store, \
+             patch("src.rag_pipeline.DocumentProcessor"), \
+             patch("src.rag_pipeline.Reranker") as mock_reranker, \
+             patch("src.rag_pipeline.RERANK_ENABLED", True), \
+             patch("src.rag_pipeline.QUERY_CACHE_ENABLED", False):
+            mock_vector_store.return_value.search.return_value = [
+                {"text": f"Chunk {i}", "metadata": {"source": "doc.pdf", "type": "pdf"},
+                 "similarity": 0.9, "id": f"id{i}"}
+                for i in range(20)
+            ]
+            mock_reranker.return_value.rerank.side_effect = (
+                lambda query, results, top_k: list(reversed(results))[:top_k]
+            )
+            yield RAGPipeline()
+
+    def test_over_fetches_and_keeps_top_k(self, pipeline):
+        """Candidates are over-fetched and the reranked best are kept."""
+        context, _ = pipeline.retrieve_context("query", top_k=2)
+
+        assert pipeline.vector_store.search.call_args.kwargs["top_k"] == 20
+        assert "Chunk 19" in context
+        assert "Chunk 18" in context
+        assert "Chunk 0" not in context
+
+    def test_default_top_k(self, pipeline):
+        """With reranking the default keeps RERANK_TOP_K chunks."""
+        from config.settings import RERANK_TOP_K
+
+        pipeline.retrieve_context("query")
+
+        assert pipeline.reranker.rerank.call_args.args[2] == RERANK_TOP_K
+
+    def test_falls_back_to_vector_ranking(self, pipeline):
+        """If the reranker fails the vector ranking is used."""
+        pipeline.reranker.rerank.side_effect = RuntimeError("model unavailable")
+
+        context, _ = pipeline.retrieve_context("query", top_k=2)
+
+        assert "Chunk 0" in context
+        assert "Chunk 1" in context
+        assert "Chunk 2" not in context
+
+    def test_disabled_by_default(self):
+        """Without RERANK_ENABLED no reranker is created."""
+        from src.rag_pipeline import RAGPipeline
+
+        with patch("src.rag_pipeline.VectorStore"), patch("src.rag_pipeline.DocumentProcessor"):
+            assert RAGPipeline().reranker is None
@@ -0,0 +1,101 @@
+"""
+Tests for Reranker Module
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from src.reranker import Reranker
+
+
+class FakeCrossEncoder:
+    """Stand-in for CrossEncoder scoring pairs by query-word overlap."""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32, **kwargs):
+        self.calls.append((list(pairs), batch_size))
+        return np.array([
+            len(set(query.lower().split()) & set(text.lower().split()))
+            for query, text in pairs
+        ], dtype=np.float32)
+
+
+def _results(*texts):
+    return [
+        {"text": text, "metadata": {"source": "doc.pdf"}, "similarity": 0.9 - i * 0.1, "id": f"id{i}"}
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def reranker():
+    """Reranker backed by FakeCrossEncoder."""
+    with patch("src.reranker.CrossEncoder", FakeCrossEncoder):
+        reranker = Reranker(batch_size=4, max_entries=3)
+        reranker.model  # load while patched
+        yield reranker
+
+
+class TestRerank:
+    """Tests for reordering results."""
+
+    def test_orders_by_relevance(self, reranker):
+        """The most relevant candidates come first, regardless of similarity."""
+        results = _results("unrelated text", "pumps move water", "how water pumps move")
+
+        reranked = reranker.rerank("how do water pumps move", results, top_k=2)
+
+        assert [r["id"] for r in reranked] == ["id2", "id1"]
+        assert reranked[0]["rerank_score"] > reranked[1]["rerank_score"]
+        assert reranked[0]["similarity"] == results[2]["similarity"]
+
+    def test_empty_results(self, reranker):
+        """Nothing to rerank returns nothing and loads no pairs."""
+        assert reranker.rerank("query", [], top_k=3) == []
+
+    def test_scores_in_one_batched_call(self, reranker):
+        """All uncached pairs go to the model together, with the batch size."""
+        reranker.score("query", _results("a", "b", "c"))
+
+        assert len(reranker.model.calls) == 1
+        pairs, batch_size = reranker.model.calls[0]
+        assert len(pairs) == 3
+        assert batch_size == 4
+
+
+class TestScoreCache:
+    """Tests for the (query, chunk ID) score cache."""
+
+    def test_repeated_query_is_not_rescored(self, reranker):
+        """Scores for a query and chunk are reused."""
+        results = _results("a b", "c d")
+        first = reranker.score("a c", results)
+        second = reranker.score("a  c ", results)
+
+        assert np.array_equal(first, second)
+        assert len(reranker.model.calls) == 1
+        assert reranker.hits == 2
+
+    def test_only_new_chunks_are_scored(self, reranker):
+        """A partly cached candidate list only scores the new chunks."""
+        reranker.score("query", _results("a"))
+        reranker.score("query", _results("a", "b"))
+
+        assert [len(pairs) for pairs, _ in reranker.model.calls] == [1, 1]
+
+    def test_results_without_id_are_not_cached(self, reranker):
+        """Chunks without an ID are scored every time."""
+        results = [{"text": "a", "metadata": {}, "similarity": 0.5, "id": None}]
+        reranker.score("query", results)
+        reranker.score("query", results)
+
+        assert len(reranker.model.calls) == 2
+
+    def test_cache_is_bounded(self, reranker):
+        """The least recently used scores are evicted."""
+        reranker.score("query", _results("a", "b", "c", "d", "e"))
+
+        assert len(reranker._scores) == 3
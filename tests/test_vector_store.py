@@ -6,6 +6,8 @@ import pytest
 from unittest.mock import MagicMock, patch
 import uuid
 
+import numpy as np
+
 from src.vector_store import VectorStore
 
 
@@ -87,6 +89,18 @@ class TestAddDocuments:
         assert ids == []
         mock_get_embeddings.assert_not_called()
 
+    @patch("src.vector_store.get_embeddings")
+    def test_add_documents_passes_array_through(self, mock_get_embeddings, mock_chroma_client, mock_chroma_collection, sample_chunks):
+        """Test that the embedding array reaches ChromaDB without conversion to lists."""
+        embeddings = np.random.rand(len(sample_chunks), 384).astype(np.float32)
+        mock_get_embeddings.return_value = embeddings
+
+        store = VectorStore()
+        store.add_documents(sample_chunks, [{"source": "test"} for _ in sample_chunks])
+
+        passed = mock_chroma_collection.add.call_args.kwargs["embeddings"]
+        assert passed is embeddings
+
 
 class TestSearch:
     """Tests for vector store search."""
@@ -102,6 +116,19 @@ class TestSearch:
         assert isinstance(results, list)
         mock_chroma_collection.query.assert_called_once()
 
+    @patch("src.vector_store.get_embedding")
+    def test_search_passes_query_array(self, mock_get_embedding, mock_chroma_client, mock_chroma_collection):
+        """Test that the query embedding is passed as a 2-D float32 array view."""
+        embedding = np.random.rand(384).astype(np.float32)
+        mock_get_embedding.return_value = embedding
+
+        store = VectorStore()
+        store.search("test query")
+
+        passed = mock_chroma_collection.query.call_args.kwargs["query_embeddings"]
+        assert passed.shape == (1, 384)
+        assert np.shares_memory(passed, embedding)
+
     @patch("src.vector_store.get_embedding")
     def test_search_result_format(self, mock_get_embedding, mock_chroma_client, mock_chroma_collection):
         """Test that search results have correct format."""
@@ -161,6 +188,72 @@ class TestSearch:
         assert call_args.kwargs["n_results"] == 3
 
 
+class TestSourceManifest:
+    """Tests for per-source chunk IDs and metadata updates."""
+
+    def test_get_source_ids(self, mock_chroma_client, mock_chroma_collection):
+        """Test that a source's chunk IDs are read without payloads."""
+        mock_chroma_collection.get.return_value = {"ids": ["a", "b"]}
+        store = VectorStore()
+
+        ids = store.get_source_ids("doc.pdf")
+
+        assert ids == {"a", "b"}
+        mock_chroma_collection.get.assert_called_once_with(where={"source": "doc.pdf"}, include=[])
+
+    def test_update_metadatas(self, mock_chroma_client, mock_chroma_collection):
+        """Test that metadata updates go to the collection."""
+        store = VectorStore()
+
+        store.update_metadatas(["a"], [{"chunk_index": 3}])
+
+        mock_chroma_collection.update.assert_called_once_with(ids=["a"], metadatas=[{"chunk_index": 3}])
+
+
+class TestVersion:
+    """Tests for the store version used to invalidate cached results."""
+
+    @patch("src.vector_store.get_embeddings")
+    def test_mutations_bump_version(self, mock_get_embeddings, mock_chroma_client, mock_chroma_collection, sample_chunks):
+        """Adding, updating, deleting and clearing each bump the version."""
+        mock_get_embeddings.return_value = [[0.1] * 384 for _ in sample_chunks]
+        store = VectorStore()
+        versions = [store.version]
+
+        store.add_documents(sample_chunks, [{"source": "a.pdf"}] * len(sample_chunks))
+        versions.append(store.version)
+        store.update_metadatas(["a"], [{"chunk_total": 1}])
+        versions.append(store.version)
+        store.delete_by_source("a.pdf")
+        versions.append(store.version)
+        store.delete_by_ids(["a"])
+        versions.append(store.version)
+        store.clear_collection()
+        versions.append(store.version)
+
+        assert versions == sorted(set(versions))
+
+    @patch("src.vector_store.get_embedding")
+    def test_search_does_not_bump_version(self, mock_get_embedding, mock_chroma_client, mock_chroma_collection):
+        """Reads leave the version unchanged."""
+        mock_get_embedding.return_value = [0.1] * 384
+        store = VectorStore()
+
+        store.search("query")
+
+        assert store.version == 0
+
+    @patch("src.vector_store.get_embedding")
+    def test_search_with_precomputed_embedding(self, mock_get_embedding, mock_chroma_client, mock_chroma_collection):
+        """A precomputed query embedding is not computed again."""
+        store = VectorStore()
+
+        store.search("query", query_embedding=np.ones(384, dtype=np.float32))
+
+        mock_get_embedding.assert_not_called()
+        mock_chroma_collection.query.assert_called_once()
+
+
 class TestDeleteBySource:
     """Tests for deleting documents by source."""
 
@@ -310,3 +403,100 @@ class TestRetryLogic:
 
         assert len(results) == 1
         assert mock_collection.query.call_count == 3
+
+
+class TestHybridSearch:
+    """Tests for BM25 + vector retrieval against a local Chroma collection."""
+
+    @pytest.fixture
+    def hybrid_store(self, temp_dir):
+        """VectorStore in hybrid mode over a temporary persistent collection."""
+        import chromadb
+        from chromadb.config import Settings
+
+        client = chromadb.PersistentClient(
+            path=str(temp_dir / "chroma_db"),
+            settings=Settings(anonymized_telemetry=False)
+        )
+        with patch("src.vector_store.create_chroma_client", return_value=client), \
+             patch("src.vector_store.SEARCH_MODE", "hybrid"), \
+             patch("src.vector_store.BM25_INDEX_PATH", temp_dir / "bm25_index.npz"):
+            yield VectorStore
+
+    @staticmethod
+    def _populate(store):
+        """Three chunks; the part-number chunk points away from the query."""
+        store.add_documents(
+            ["Pumps move fluids through a system.",
+             "Valves regulate the flow of fluids.",
+             "Replace seal kit SK-4471 every year."],
+            [{"source": "manual.pdf", "type": "pdf"},
+             {"source": "manual.pdf", "type": "pdf"},
+             {"source": "parts.pdf", "type": "pdf"}],
+            ids=["pumps", "valves", "seal"],
+            embeddings=np.array([[1.0, 0.0, 0.0], [0.9, 0.4, 0.0], [0.0, 0.0, 1.0]])
+        )
+
+    def test_keyword_match_below_threshold_is_kept(self, hybrid_store):
+        """An exact-term match is returned even when its similarity is low."""
+        store = hybrid_store()
+        self._populate(store)
+
+        results = store.search("SK-4471", top_k=2, query_embedding=np.array([1.0, 0.1, 0.0]))
+
+        ids = [r["id"] for r in results]
+        assert "seal" in ids
+        seal = next(r for r in results if r["id"] == "seal")
+        assert seal["similarity"] < 0.3
+        assert all("score" in r for r in results)
+
+    def test_agreement_ranks_first(self, hybrid_store):
+        """A chunk ranked by both retrievers outranks one ranked by either."""
+        store = hybrid_store()
+        self._populate(store)
+
+        results = store.search("valves", top_k=3, query_embedding=np.array([1.0, 0.1, 0.0]))
+
+        assert results[0]["id"] == "valves"
+
+    def test_metadata_filter_applies_to_keyword_matches(self, hybrid_store):
+        """Keyword matches outside the filter are dropped."""
+        store = hybrid_store()
+        self._populate(store)
+
+        results = store.search(
+            "SK-4471", top_k=3,
+            filter_metadata={"source": "manual.pdf"},
+            query_embedding=np.array([1.0, 0.1, 0.0])
+        )
+
+        assert "seal" not in [r["id"] for r in results]
+
+    def test_deletes_update_index(self, hybrid_store):
+        """Deleted chunks disappear from the keyword index."""
+        store = hybrid_store()
+        self._populate(store)
+
+        store.delete_by_source("parts.pdf")
+
+        assert "seal" not in store.lexical_index
+        assert len(store.lexical_index) == 2
+
+    def test_index_persists_and_rebuilds(self, hybrid_store, temp_dir):
+        """The index is reloaded from disk, or rebuilt when it is missing."""
+        store = hybrid_store()
+        self._populate(store)
+        store.flush()
+
+        assert len(hybrid_store().lexical_index) == 3
+
+        (temp_dir / "bm25_index.npz").unlink()
+        rebuilt = hybrid_store()
+
+        assert len(rebuilt.lexical_index) == 3
+        assert "seal" in rebuilt.lexical_index
+        assert (temp_dir / "bm25_index.npz").exists()
+
+    def test_vector_mode_has_no_index(self, mock_chroma_client):
+        """The default vector mode keeps no keyword index."""
+        assert VectorStore().lexical_index is None